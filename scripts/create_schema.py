@@ -41,24 +41,37 @@ def create_schema_from_template(
         sql_content = f.read()
     
     # Replace embedding dimension first (before table name replacement)
-    sql_content = sql_content.replace('vector(768)', f'vector({embedding_dim})')
-    sql_content = sql_content.replace('vector(3072)', f'vector({embedding_dim})')
+    column_type = "halfvec" if settings.PGVECTOR_COLUMN_TYPE == "halfvec" else "vector"
+    sql_content = sql_content.replace('vector(768)', f'{column_type}({embedding_dim})')
+    sql_content = sql_content.replace('vector(3072)', f'{column_type}({embedding_dim})')
+    
+    index_pattern = (
+        '-- Vector Index for Fast Similarity Search (ivfflat for 768 dimensions)\n'
+        'CREATE INDEX idx_chunks_embedding \n'
+        'ON award_chunks \n'
+        'USING ivfflat (embedding vector_cosine_ops) \n'
+        'WITH (lists = 100);'
+    )
     
     # Choose index type based on dimension
     # pgvector limits: 
     #   - ivfflat: max 2000 dimensions
     #   - hnsw: max 2000 dimensions (standard vector type)
     #   - hnsw with halfvec: supports up to 4000 dimensions (for > 2000)
-    if embedding_dim > 2000:
-        # Use HNSW with halfvec casting for high-dimensional vectors (OpenAI 3072)
-        # This allows indexing vectors with > 2000 dimensions
-        index_pattern = (
-            '-- Vector Index for Fast Similarity Search (ivfflat for 768 dimensions)\n'
+    if column_type == "halfvec":
+        # Native halfvec column: HNSW directly on the column (half the bytes per scan)
+        index_replacement = (
+            f'-- Vector Index for Fast Similarity Search (hnsw on halfvec for {embedding_dim} dimensions)\n'
             'CREATE INDEX idx_chunks_embedding \n'
             'ON award_chunks \n'
-            'USING ivfflat (embedding vector_cosine_ops) \n'
-            'WITH (lists = 100);'
+            'USING hnsw (embedding halfvec_cosine_ops) \n'
+            'WITH (m = 16, ef_construction = 64);'
         )
+        sql_content = sql_content.replace(index_pattern, index_replacement)
+        logger.info(f"✅ Using halfvec column with HNSW index for {embedding_dim} dimensions.")
+    elif embedding_dim > 2000:
+        # Use HNSW with halfvec casting for high-dimensional vectors (OpenAI 3072)
+        # This allows indexing vectors with > 2000 dimensions
         index_replacement = (
             f'-- Vector Index for Fast Similarity Search (hnsw with halfvec for {embedding_dim} dimensions)\n'
             '-- Using halfvec cast to support dimensions > 2000\n'
@@ -135,6 +135,26 @@ CREATE TRIGGER update_awards_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_updated_at_column();
 
+-- ============================================================================
+-- Step 7: Create Lexical Search Function
+-- ============================================================================
+
+-- Ranked full-text search over title + abstract in a single round-trip
+-- Uses the GIN indexes above; called via supabase.rpc("search_awards", {"q": ..., "k": ...})
+-- Function name 'search_awards' will be replaced with search_<AWARDS_TABLE_NAME>
+CREATE OR REPLACE FUNCTION search_awards(q TEXT, k INTEGER)
+RETURNS SETOF awards AS $$
+    SELECT *
+    FROM awards
+    WHERE to_tsvector('english', COALESCE(title, '')) @@ plainto_tsquery('english', q)
+       OR to_tsvector('english', COALESCE(public_abstract, '')) @@ plainto_tsquery('english', q)
+    ORDER BY ts_rank(
+        to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(public_abstract, '')),
+        plainto_tsquery('english', q)
+    ) DESC
+    LIMIT k;
+$$ LANGUAGE sql STABLE;
+
 -- ============================================================================
 -- Schema Creation Complete
 -- ============================================================================
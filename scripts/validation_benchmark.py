@@ -187,7 +187,8 @@ Generate exactly 5 questions, one per line, without numbering or bullets:"""
                     semantic_results = semantic_search(
                         query=query,
                         vector_store_client=self.pgvector_manager,
-                        top_k=top_k * 2  # Get more results for better recall
+                        top_k=top_k * 2,  # Get more results for better recall
+                        accuracy="accurate"
                     )
                     
                     # Deduplicate by award_id (keep best score)
@@ -205,7 +206,8 @@ Generate exactly 5 questions, one per line, without numbering or bullets:"""
                     semantic_results = semantic_search(
                         query=query,
                         vector_store_client=self.pgvector_manager,
-                        top_k=top_k * 2
+                        top_k=top_k * 2,
+                        accuracy="accurate"
                     )
                     
                     results = hybrid_search(
@@ -28,16 +28,9 @@ def get_vector_store_client():
     if settings.VECTOR_STORE == "pgvector":
         return get_pgvector_manager()
     elif settings.VECTOR_STORE == "qdrant":
-        # Import Qdrant client if needed
-        try:
-            from qdrant_client import QdrantClient
-            return QdrantClient(
-                url=settings.QDRANT_URL,
-                api_key=settings.QDRANT_API_KEY if settings.QDRANT_API_KEY else None
-            )
-        except ImportError:
-            logger.warning("Qdrant client not available. Install with: pip install qdrant-client")
-            return None
+        # Shared client: keeps its (gRPC) connection open across requests
+        from src.core.startup import get_qdrant_client_lazy
+        return get_qdrant_client_lazy()
     else:
         return None
 
@@ -98,7 +91,11 @@ async def search(
         supabase_raw_client = None
         if supabase_client:
             try:
-                supabase_raw_client = supabase_client.get_client()
+                # Prefer the async client so lexical search runs on the event loop
+                supabase_raw_client = (
+                    await supabase_client.get_async_client()
+                    or supabase_client.get_client()
+                )
             except Exception as e:
                 logger.warning(f"Could not get Supabase client: {e}")
         
@@ -37,10 +37,20 @@ class Settings(BaseSettings):
     # ==================== Vector Store ====================
     # Choice: "pgvector" (Supabase extension) or "qdrant" (separate service)
     VECTOR_STORE: str = os.getenv("VECTOR_STORE", "pgvector")
+    PGVECTOR_COLUMN_TYPE: str = os.getenv("PGVECTOR_COLUMN_TYPE", "vector")  # "vector" or "halfvec" (pgvector 0.7+, half the bytes per HNSW scan)
+    PGVECTOR_HNSW_EF_SEARCH: int = int(os.getenv("PGVECTOR_HNSW_EF_SEARCH", "40"))  # HNSW candidate list for interactive searches (0 keeps server default)
+    PGVECTOR_HNSW_EF_SEARCH_ACCURATE: int = int(os.getenv("PGVECTOR_HNSW_EF_SEARCH_ACCURATE", "100"))  # HNSW candidate list for accuracy="accurate" (evaluation)
+    PGVECTOR_POOL_MIN_SIZE: int = int(os.getenv("PGVECTOR_POOL_MIN_SIZE", "2"))  # Connections opened up front
+    PGVECTOR_POOL_MAX_SIZE: int = int(os.getenv("PGVECTOR_POOL_MAX_SIZE", "10"))  # Pooled connections (extra callers open short-lived ones)
+    PGVECTOR_PREPARED_SEARCH: bool = os.getenv("PGVECTOR_PREPARED_SEARCH", "true").lower() == "true"  # PREPARE search SQL once per connection (falls back automatically)
     
     # Qdrant settings (if using Qdrant)
     QDRANT_URL: str = os.getenv("QDRANT_URL", "http://localhost:6333")
     QDRANT_API_KEY: str = os.getenv("QDRANT_API_KEY", "")
+    QDRANT_PREFER_GRPC: bool = os.getenv("QDRANT_PREFER_GRPC", "true").lower() == "true"  # Search over gRPC (HTTP/2) instead of REST
+    QDRANT_GRPC_PORT: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+    QDRANT_HNSW_EF: int = int(os.getenv("QDRANT_HNSW_EF", "0"))  # HNSW ef for interactive searches (0 keeps collection default)
+    QDRANT_HNSW_EF_ACCURATE: int = int(os.getenv("QDRANT_HNSW_EF_ACCURATE", "128"))  # HNSW ef for accuracy="accurate" (evaluation)
     
     # ==================== Embeddings ====================
     # Choose: "openai" or "sentence-transformers" (default: sentence-transformers for free/fast)
@@ -48,6 +58,10 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-mpnet-base-v2")
     EMBEDDING_DIMENSION: int = int(os.getenv("EMBEDDING_DIMENSION", "768"))  # 768 for Sentence Transformers, 3072 for OpenAI
+    EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", ".embedcache.sqlite3")  # Persistent OpenAI embedding cache file (empty disables)
+    EMBEDDING_CACHE_TTL_DAYS: float = float(os.getenv("EMBEDDING_CACHE_TTL_DAYS", "30"))  # Days before a cached embedding expires (0 = never)
+    OPENAI_REQUESTS_PER_MIN: int = int(os.getenv("OPENAI_REQUESTS_PER_MIN", "5000"))  # Embedding requests/min allowed by the account (0 disables throttling)
+    OPENAI_TOKENS_PER_MIN: int = int(os.getenv("OPENAI_TOKENS_PER_MIN", "1000000"))  # Embedding tokens/min allowed by the account (0 disables throttling)
     
     # ==================== LLM for Query Generation ====================
     GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
@@ -58,10 +72,27 @@ class Settings(BaseSettings):
     MAX_TOP_K: int = int(os.getenv("MAX_TOP_K", "100"))
     LEXICAL_BOOST: float = float(os.getenv("LEXICAL_BOOST", "10.0"))
     SEMANTIC_WEIGHT: float = float(os.getenv("SEMANTIC_WEIGHT", "0.5"))
+    SCORE_FUSION: str = os.getenv("SCORE_FUSION", "weighted")  # weighted, arctan, or rrf
+    RRF_K: int = int(os.getenv("RRF_K", "60"))  # Rank offset for reciprocal rank fusion
+    SEARCH_IO_WORKERS: int = int(os.getenv("SEARCH_IO_WORKERS", "64"))  # Threads for blocking search I/O
+    SEMANTIC_BATCH_WINDOW_MS: float = float(os.getenv("SEMANTIC_BATCH_WINDOW_MS", "5"))  # Wait for concurrent vector searches to batch (0 = same loop tick)
+    SEMANTIC_BATCH_MAX_SIZE: int = int(os.getenv("SEMANTIC_BATCH_MAX_SIZE", "32"))  # Max queries per batched vector search (1 disables batching)
+    
+    # ==================== Search Caching ====================
+    QUERY_CACHE_MAX_SIZE: int = int(os.getenv("QUERY_CACHE_MAX_SIZE", "1024"))  # Cached queries (LRU eviction)
+    QUERY_CACHE_TTL: float = float(os.getenv("QUERY_CACHE_TTL", "300"))  # Seconds before a cached result expires
+    SEMANTIC_CACHE_MAX_SIZE: int = int(os.getenv("SEMANTIC_CACHE_MAX_SIZE", "4096"))  # Cached query embeddings (0 disables)
+    SEMANTIC_CACHE_TAU: float = float(os.getenv("SEMANTIC_CACHE_TAU", "0.95"))  # Min cosine similarity for a semantic cache hit
+    QUERY_EMBED_CACHE_MAX_SIZE: int = int(os.getenv("QUERY_EMBED_CACHE_MAX_SIZE", "2048"))  # Cached query embeddings by query text
+    QUERY_EMBED_TTL: float = float(os.getenv("QUERY_EMBED_TTL", "600"))  # Seconds before a cached query embedding expires
+    AWARD_METADATA_CACHE_MAX_SIZE: int = int(os.getenv("AWARD_METADATA_CACHE_MAX_SIZE", "50000"))  # Cached award rows for semantic results
+    AWARD_METADATA_CACHE_TTL: float = float(os.getenv("AWARD_METADATA_CACHE_TTL", "3600"))  # Seconds before a cached award row expires
+    PGVECTOR_SEARCH_CACHE_MAX_SIZE: int = int(os.getenv("PGVECTOR_SEARCH_CACHE_MAX_SIZE", "1024"))  # Cached pgvector results by query vector (0 disables)
     
     # ==================== Chunking Configuration ====================
     CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "400"))
     CHUNK_OVERLAP: int = int(os.getenv("CHUNK_OVERLAP", "40"))
+    TEXT_HASH_HEX_LENGTH: int = int(os.getenv("TEXT_HASH_HEX_LENGTH", "64"))  # Hex chars of chunk SHA-256 kept as text_hash (32-64; 32 halves dedup keys, changing it re-indexes every chunk)
     
     # ==================== Indexing Configuration ====================
     INDEXING_BATCH_SIZE: int = int(os.getenv("INDEXING_BATCH_SIZE", "100"))  # Awards per batch (increased for better throughput)
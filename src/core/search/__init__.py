@@ -4,7 +4,8 @@ Core search functionality for lexical, semantic, and hybrid search
 """
 from src.core.search.lexical import (
     lexical_search_in_memory,
-    lexical_search_supabase
+    lexical_search_supabase,
+    lexical_search_supabase_async
 )
 from src.core.search.semantic import (
     semantic_search,
@@ -13,7 +14,10 @@ from src.core.search.semantic import (
 )
 from src.core.search.hybrid_search import (
     hybrid_search,
-    search_all
+    search_all,
+    search_all_async,
+    search_all_batch_async,
+    clear_search_caches
 )
 from src.core.search.ranking import (
     apply_lexical_boost,
@@ -25,6 +29,7 @@ __all__ = [
     # Lexical search
     "lexical_search_in_memory",
     "lexical_search_supabase",
+    "lexical_search_supabase_async",
     # Semantic search
     "semantic_search",
     "semantic_search_pgvector",
@@ -32,6 +37,9 @@ __all__ = [
     # Hybrid search
     "hybrid_search",
     "search_all",
+    "search_all_async",
+    "search_all_batch_async",
+    "clear_search_caches",
     # Ranking
     "apply_lexical_boost",
     "deduplicate_by_award_id",
@@ -0,0 +1,124 @@
+"""
+Request Batching
+Coalesces concurrent async calls into batched calls on a worker thread
+"""
+import asyncio
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class BatchingDispatcher:
+    """
+    Micro-batching dispatcher for blocking batch APIs
+
+    Items submitted under the same key within ``window_ms`` of the first one
+    (or until ``max_batch_size`` items are waiting) are passed together to
+    ``batch_fn(key, items)``, which runs in ``executor`` and must return one
+    result per item, in order. Each caller awaits only its own result.
+
+    While no batch is running the window is skipped (items submitted in the
+    same event-loop tick still batch), so a lone request pays no delay.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[Hashable, List[Any]], List[Any]],
+        window_ms: float = 5.0,
+        max_batch_size: int = 32,
+        executor=None,
+        name: str = "batch"
+    ):
+        """
+        Initialize batching dispatcher
+
+        Args:
+            batch_fn: Blocking function mapping (key, items) to a list of results
+            window_ms: How long the first item of a batch waits for company
+                while another batch is running (0 batches only items submitted
+                in the same event-loop tick)
+            max_batch_size: Batch size that triggers an immediate flush
+            executor: Executor for batch_fn (None uses the loop's default)
+            name: Dispatcher name used in log messages
+        """
+        self.batch_fn = batch_fn
+        self.window_ms = window_ms
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        self.name = name
+        self._pending: Dict[Hashable, List[Tuple[Any, asyncio.Future]]] = {}
+        self._running = 0  # Batches currently in batch_fn
+
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """
+        Queue an item for the next batch under key and wait for its result
+
+        Args:
+            key: Batch key (only items with equal keys are batched together)
+            item: Item passed to batch_fn
+
+        Returns:
+            batch_fn's result for this item (its exception is raised here)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.setdefault(key, [])
+        batch.append((item, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif len(batch) == 1:
+            if self.window_ms > 0 and self._running:
+                loop.call_later(self.window_ms / 1000.0, self._flush, key, batch)
+            else:
+                loop.call_soon(self._flush, key, batch)
+
+        return await future
+
+    def _flush(self, key: Hashable, batch: Optional[List[Tuple[Any, asyncio.Future]]] = None) -> None:
+        """
+        Hand the pending batch for key to the executor
+
+        Args:
+            key: Batch key
+            batch: Batch the timer was armed for (skipped if already flushed)
+        """
+        if batch is not None and self._pending.get(key) is not batch:
+            # Flushed early by max_batch_size; a newer batch has its own timer
+            return
+
+        batch = self._pending.pop(key, None)
+        if batch:
+            asyncio.ensure_future(self._run_batch(key, batch))
+
+    async def _run_batch(self, key: Hashable, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """
+        Run batch_fn for one batch and resolve each caller's future
+
+        Args:
+            key: Batch key
+            batch: (item, future) pairs
+        """
+        items = [item for item, _ in batch]
+        loop = asyncio.get_running_loop()
+        self._running += 1
+        try:
+            results = await loop.run_in_executor(self.executor, self.batch_fn, key, items)
+            if len(results) != len(items):
+                raise RuntimeError(f"{self.name} batch returned {len(results)} results for {len(items)} items")
+        except Exception as e:
+            logger.error(f"{self.name} batch failed: {e}", extra={"batch_size": len(items)})
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._running -= 1
+
+        logger.debug(f"{self.name} batch completed", extra={"batch_size": len(items)})
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -4,16 +4,126 @@ Combines lexical and semantic search with lexical boost
 Supports both sync and async (parallel) execution
 """
 import asyncio
-from typing import List, Dict, Optional, Any
+import concurrent.futures
+import functools
+import heapq
+import math
+import time
+from typing import List, Dict, Optional, Any, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
 
 from src.core.config import settings
 from src.core.logging import get_logger
-from src.core.search.lexical import lexical_search_in_memory, lexical_search_supabase
-from src.core.search.semantic import semantic_search
+from src.core.search.lexical import (
+    lexical_search_in_memory,
+    lexical_search_supabase,
+    lexical_search_supabase_async,
+)
+from src.core.search.semantic import clear_semantic_search_cache, embed_query, semantic_search, semantic_search_batch
+from src.core.search.batching import BatchingDispatcher
 from src.core.search.deduplication import deduplicate_and_group_results
+from src.core.search.query_cache import QueryCache, SemanticCache, make_cache_key
+from src.database.supabase import is_async_client
+from src.indexing.embeddings import get_embedding_service
 
 logger = get_logger(__name__)
 
+# Schema columns merged from lexical/semantic rows into each hybrid result
+_HYBRID_SCHEMA_KEYS = (
+    "award_number", "award_status", "institution", "uei", "duns",
+    "most_recent_award_date", "num_support_periods", "pm",
+    "current_budget_period", "current_project_period", "pi",
+    "supplement_budget_period", "public_abstract"
+)
+
+# Dedicated pool for blocking search I/O (sync Supabase/vector store clients, embedding)
+# so search does not contend with other users of the loop's default executor
+_IO_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=settings.SEARCH_IO_WORKERS,
+    thread_name_prefix="search-io"
+)
+
+# Exact-query cache of (lexical_results, semantic_results), shared by sync and async search
+_results_cache = QueryCache(
+    max_size=settings.QUERY_CACHE_MAX_SIZE,
+    ttl_seconds=settings.QUERY_CACHE_TTL,
+    name="search results"
+)
+
+# Exact-query cache of the final deduplicated response (also keyed by alpha/beta)
+_response_cache = QueryCache(
+    max_size=settings.QUERY_CACHE_MAX_SIZE,
+    ttl_seconds=settings.QUERY_CACHE_TTL,
+    name="search response"
+)
+
+# Approximate cache of the same tuple, keyed by query embedding (catches paraphrases)
+_semantic_results_cache = SemanticCache(
+    max_size=settings.SEMANTIC_CACHE_MAX_SIZE,
+    threshold=settings.SEMANTIC_CACHE_TAU,
+    ttl_seconds=settings.QUERY_CACHE_TTL,
+    name="semantic search results"
+)
+
+
+def clear_search_caches() -> None:
+    """Drop cached search results (call after the index changes)"""
+    _results_cache.clear()
+    _response_cache.clear()
+    _semantic_results_cache.clear()
+    clear_semantic_search_cache()
+
+
+def _semantic_search_group(key: Tuple[Any, int], items: List[Tuple[str, Optional[List[float]]]]) -> List[List[Dict[str, Any]]]:
+    """
+    Run one batch of semantic searches (BatchingDispatcher callback)
+    
+    Args:
+        key: (vector_store_client, top_k) shared by the batch
+        items: (query, query_embedding) pairs
+    
+    Returns:
+        Semantic results per item, in order
+    """
+    vector_store_client, top_k = key
+    queries = [query for query, _ in items]
+    query_embeddings = [query_embedding for _, query_embedding in items]
+    return semantic_search_batch(queries, vector_store_client, top_k, query_embeddings=query_embeddings)
+
+
+# Concurrent async pgvector searches share batched SQL round-trips (Qdrant
+# searches run individually, in parallel on _IO_EXECUTOR)
+_semantic_dispatcher = BatchingDispatcher(
+    _semantic_search_group,
+    window_ms=settings.SEMANTIC_BATCH_WINDOW_MS,
+    max_batch_size=settings.SEMANTIC_BATCH_MAX_SIZE,
+    executor=_IO_EXECUTOR,
+    name="semantic search"
+)
+
+
+def _embed_query(query: str) -> Optional[List[float]]:
+    """
+    Embed a query for semantic cache lookups
+    
+    Args:
+        query: Search query string
+    
+    Returns:
+        Query embedding, or None if embedding failed
+    """
+    try:
+        return embed_query(query)
+    except Exception as e:
+        logger.warning(f"Could not embed query for semantic cache: {e}")
+        return None
+
 
 def hybrid_search(
     query: str,
@@ -36,6 +146,13 @@ def hybrid_search(
     
     Returns:
         List of dictionaries with hybrid scores, sorted by final_score
+    
+    Note:
+        Scores are computed over parallel arrays (one slot per candidate award);
+        result dicts are only materialized for the top_k winners.
+        settings.SCORE_FUSION selects how the two scores are combined:
+        "weighted" (raw alpha/beta sum), "arctan" (both scores arctan-normalized
+        to [0, 1) first) or "rrf" (reciprocal rank fusion with settings.RRF_K).
     """
     # Use explicit None check to allow 0.0 values
     # This is important: if alpha=0.0 or beta=0.0, we want to use those values, not defaults
@@ -49,150 +166,232 @@ def hybrid_search(
     )
     
     # Create maps for easy lookup
-    lexical_map = {r["award_id"]: r["lexical_score"] for r in lexical_results}
+    lexical_map = {r["award_id"]: r for r in lexical_results}
     semantic_map = {}
     
-    # Keep best semantic score per award_id
-    for r in semantic_results:
-        award_id = r["award_id"]
-        if award_id not in semantic_map or r["semantic_score"] > semantic_map[award_id]["semantic_score"]:
-            semantic_map[award_id] = r
-    
-    # Union of all award IDs
-    all_award_ids = set(lexical_map.keys()) | set(semantic_map.keys())
-    
-    # Calculate hybrid scores
-    hybrid_results = []
-    for award_id in all_award_ids:
-        lexical_score = lexical_map.get(award_id, 0.0)
-        semantic_data = semantic_map.get(award_id, {})
-        semantic_score = semantic_data.get("semantic_score", 0.0)
-        
-        # Filter: If one parameter is 0, only include awards with contribution from the other
-        # When beta=0: Only include awards that were found by semantic search (in semantic_map)
-        if beta == 0.0 and award_id not in semantic_map:
-            continue
-        # When alpha=0: Only include awards that were found by lexical search (in lexical_map)
-        if alpha == 0.0 and award_id not in lexical_map:
-            continue
-        
-        # Hybrid Score = (alpha × semantic) + (beta × lexical)
-        final_score = (alpha * semantic_score) + (beta * lexical_score)
-        
-        # Get metadata from either source (prefer semantic as it has more complete data)
-        metadata = semantic_data.copy() if semantic_data else {}
-        
-        # Add/override with lexical info if available (lexical might have better snippet)
-        if award_id in lexical_map:
-            lexical_result = next((r for r in lexical_results if r["award_id"] == award_id), None)
-            if lexical_result:
-                # Merge lexical data, but keep semantic data for fields not in lexical
-                metadata.update({
-                    "title": lexical_result.get("title", metadata.get("title", "")),
-                    "agency": lexical_result.get("agency", metadata.get("agency", "")),
-                    "snippet": lexical_result.get("snippet", metadata.get("snippet", "")),
-                    "url": lexical_result.get("url") or lexical_result.get("public_abstract_url") or metadata.get("url"),
-                    "public_abstract_url": lexical_result.get("public_abstract_url") or lexical_result.get("url") or metadata.get("public_abstract_url")
-                })
-                # Add any other columns from lexical that semantic might not have
-                for key in ["award_number", "award_status", "institution", "uei", "duns", 
-                           "most_recent_award_date", "num_support_periods", "pm", 
-                           "current_budget_period", "current_project_period", "pi", 
-                           "supplement_budget_period", "public_abstract"]:
-                    if key in lexical_result and lexical_result[key] is not None:
-                        metadata[key] = lexical_result[key]
+    # Keep best semantic score per award_id: visit chunks best-first so the
+    # first row seen per award wins (stable sort keeps earlier rows on ties)
+    for r in sorted(semantic_results, key=lambda x: x["semantic_score"], reverse=True):
+        semantic_map.setdefault(r["award_id"], r)
+    
+    # Union of all award IDs (set ops directly on the key views, no intermediate sets)
+    all_award_ids = lexical_map.keys() | semantic_map.keys()
+    
+    # Filter: If one parameter is 0, only include awards with contribution from the other
+    # When beta=0: Only include awards that were found by semantic search (in semantic_map)
+    if beta == 0.0:
+        all_award_ids &= semantic_map.keys()
+    # When alpha=0: Only include awards that were found by lexical search (in lexical_map)
+    if alpha == 0.0:
+        all_award_ids &= lexical_map.keys()
+    
+    award_ids = list(all_award_ids)
+    num_candidates = len(award_ids)
+    
+    # Hybrid Score = (alpha × semantic) + (beta × lexical), computed for all candidates at once
+    if NUMPY_AVAILABLE:
+        lexical_scores = np.fromiter(
+            (lexical_map[a]["lexical_score"] if a in lexical_map else 0.0 for a in award_ids),
+            dtype=np.float64,
+            count=num_candidates
+        )
+        semantic_scores = np.fromiter(
+            (semantic_map[a]["semantic_score"] if a in semantic_map else 0.0 for a in award_ids),
+            dtype=np.float64,
+            count=num_candidates
+        )
+        if settings.SCORE_FUSION == "rrf":
+            # Reciprocal rank fusion: alpha/(k + semantic rank) + beta/(k + lexical rank)
+            semantic_present = np.fromiter((a in semantic_map for a in award_ids), dtype=bool, count=num_candidates)
+            lexical_present = np.fromiter((a in lexical_map for a in award_ids), dtype=bool, count=num_candidates)
+            final_scores = (
+                alpha * _rrf_scores(semantic_scores, semantic_present, settings.RRF_K)
+                + beta * _rrf_scores(lexical_scores, lexical_present, settings.RRF_K)
+            )
+        elif settings.SCORE_FUSION == "arctan":
+            # Map both score ranges onto [0, 1) before weighting (cosine vs distance backends)
+            final_scores = (2 / np.pi) * (alpha * np.arctan(semantic_scores) + beta * np.arctan(lexical_scores))
+        else:
+            final_scores = alpha * semantic_scores + beta * lexical_scores
         
-        # Build result with ALL schema columns
-        hybrid_result = {
-            "award_id": award_id,
-            "award_number": metadata.get("award_number"),
-            "final_score": final_score,
-            "lexical_score": lexical_score,
-            "semantic_score": semantic_score,
-            "title": metadata.get("title", ""),
-            "agency": metadata.get("agency", ""),
-            "snippet": metadata.get("snippet", ""),
-            "url": metadata.get("url") or metadata.get("public_abstract_url"),
-            "public_abstract_url": metadata.get("public_abstract_url") or metadata.get("url"),
-            "chunk_index": metadata.get("chunk_index", 0),
-            # All other schema columns
-            "award_status": metadata.get("award_status"),
-            "institution": metadata.get("institution"),
-            "uei": metadata.get("uei"),
-            "duns": metadata.get("duns"),
-            "most_recent_award_date": metadata.get("most_recent_award_date"),
-            "num_support_periods": metadata.get("num_support_periods"),
-            "pm": metadata.get("pm"),
-            "current_budget_period": metadata.get("current_budget_period"),
-            "current_project_period": metadata.get("current_project_period"),
-            "pi": metadata.get("pi"),
-            "supplement_budget_period": metadata.get("supplement_budget_period"),
-            "public_abstract": metadata.get("public_abstract")
-        }
-        hybrid_results.append(hybrid_result)
-    
-    # Sort by final score (descending)
-    hybrid_results.sort(key=lambda x: x["final_score"], reverse=True)
+        # Partial selection of the top_k winners, then sort only that slice
+        if top_k < num_candidates:
+            top_indices = np.argpartition(-final_scores, top_k)[:top_k]
+        else:
+            top_indices = np.arange(num_candidates)
+        top_indices = top_indices[np.argsort(-final_scores[top_indices], kind="stable")].tolist()
+        lexical_scores = lexical_scores.tolist()
+        semantic_scores = semantic_scores.tolist()
+        final_scores = final_scores.tolist()
+    else:
+        lexical_scores = [lexical_map[a]["lexical_score"] if a in lexical_map else 0.0 for a in award_ids]
+        semantic_scores = [semantic_map[a]["semantic_score"] if a in semantic_map else 0.0 for a in award_ids]
+        if settings.SCORE_FUSION == "rrf":
+            semantic_ranks = _rank_positions([a for a in award_ids if a in semantic_map], semantic_map, "semantic_score")
+            lexical_ranks = _rank_positions([a for a in award_ids if a in lexical_map], lexical_map, "lexical_score")
+            final_scores = [
+                (alpha / (settings.RRF_K + semantic_ranks[a]) if a in semantic_ranks else 0.0)
+                + (beta / (settings.RRF_K + lexical_ranks[a]) if a in lexical_ranks else 0.0)
+                for a in award_ids
+            ]
+        elif settings.SCORE_FUSION == "arctan":
+            final_scores = [
+                (2 / math.pi) * (alpha * math.atan(s) + beta * math.atan(l))
+                for s, l in zip(semantic_scores, lexical_scores)
+            ]
+        else:
+            final_scores = [(alpha * s) + (beta * l) for s, l in zip(semantic_scores, lexical_scores)]
+        top_indices = heapq.nlargest(top_k, range(num_candidates), key=final_scores.__getitem__)
+    
+    # Build result dicts only for the top_k winners
+    hybrid_results = [
+        _build_hybrid_result(
+            award_ids[i],
+            final_scores[i],
+            lexical_scores[i],
+            semantic_scores[i],
+            semantic_map.get(award_ids[i]),
+            lexical_map.get(award_ids[i])
+        )
+        for i in top_indices
+    ]
     
     logger.debug(
-        f"Hybrid search combined {len(lexical_results)} lexical + {len(semantic_results)} semantic = {len(hybrid_results)} unique results",
+        f"Hybrid search combined {len(lexical_results)} lexical + {len(semantic_results)} semantic = {num_candidates} unique results",
         extra={"query": query, "top_k": top_k}
     )
     
-    return hybrid_results[:top_k]
+    return hybrid_results
 
 
-async def search_all_async(
-    query: str,
-    awards: Optional[List[Dict[str, Any]]] = None,
-    supabase_client=None,
-    vector_store_client=None,
-    top_k: Optional[int] = None,
-    alpha: Optional[float] = None,
-    beta: Optional[float] = None
+def _rrf_scores(scores, present, k: int):
+    """
+    Reciprocal rank fusion contributions for one result list (NumPy)
+    
+    Args:
+        scores: Score per candidate
+        present: Whether each candidate appears in this result list
+        k: Rank offset (larger values flatten the head of the ranking)
+    
+    Returns:
+        Array of 1/(k + rank), 0.0 for candidates not in the list
+    """
+    # Absent candidates sort last so they do not shift the ranks of present ones
+    order = np.argsort(-np.where(present, scores, -np.inf), kind="stable")
+    ranks = np.empty(len(scores), dtype=np.float64)
+    ranks[order] = np.arange(1, len(scores) + 1)
+    return np.where(present, 1.0 / (k + ranks), 0.0)
+
+
+def _rank_positions(award_ids: List[str], result_map: Dict[str, Dict[str, Any]], score_key: str) -> Dict[str, int]:
+    """
+    1-based rank of each award by score (pure-Python RRF fallback)
+    
+    Args:
+        award_ids: Awards present in the result list
+        result_map: Result row per award
+        score_key: Score field to rank by
+    
+    Returns:
+        Dictionary mapping award_id to rank
+    """
+    ranked = sorted(award_ids, key=lambda a: result_map[a][score_key], reverse=True)
+    return {award_id: rank for rank, award_id in enumerate(ranked, start=1)}
+
+
+def _build_hybrid_result(
+    award_id: str,
+    final_score: float,
+    lexical_score: float,
+    semantic_score: float,
+    semantic_data: Optional[Dict[str, Any]],
+    lexical_result: Optional[Dict[str, Any]]
 ) -> Dict[str, Any]:
     """
-    Perform all search types in TRUE PARALLEL (async version)
+    Build a single hybrid result row from semantic and lexical data
     
-    Runs lexical and semantic searches simultaneously using asyncio.
-    This is 2x faster than sequential execution.
+    Args:
+        award_id: Award identifier
+        final_score: Hybrid score
+        lexical_score: Lexical score
+        semantic_score: Semantic score
+        semantic_data: Best semantic result for this award (if any)
+        lexical_result: Lexical result for this award (if any)
+    
+    Returns:
+        Dictionary with ALL schema columns
+    """
+    semantic_data = semantic_data or {}
+    lexical_result = lexical_result or {}
+    
+    # Schema columns: lexical value when present, otherwise semantic (single pass, no copies)
+    hybrid_result = {
+        key: lexical_result[key] if lexical_result.get(key) is not None else semantic_data.get(key)
+        for key in _HYBRID_SCHEMA_KEYS
+    }
+    
+    # Display fields: lexical wins if it has the key (lexical might have better snippet)
+    for key in ("title", "agency", "snippet"):
+        hybrid_result[key] = lexical_result[key] if key in lexical_result else semantic_data.get(key, "")
+    
+    url = lexical_result.get("url") or lexical_result.get("public_abstract_url") or semantic_data.get("url")
+    public_abstract_url = (
+        lexical_result.get("public_abstract_url") or lexical_result.get("url") or semantic_data.get("public_abstract_url")
+    )
+    hybrid_result["url"] = url or public_abstract_url
+    hybrid_result["public_abstract_url"] = public_abstract_url or url
+    
+    hybrid_result["award_id"] = award_id
+    hybrid_result["final_score"] = final_score
+    hybrid_result["lexical_score"] = lexical_score
+    hybrid_result["semantic_score"] = semantic_score
+    hybrid_result["chunk_index"] = semantic_data.get("chunk_index", 0)
+    
+    return hybrid_result
+
+
+async def _run_searches_async(
+    query: str,
+    awards: Optional[List[Dict[str, Any]]],
+    supabase_client,
+    vector_store_client,
+    top_k: int,
+    query_embedding: Optional[List[float]] = None
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Run lexical and semantic searches in parallel
     
     Args:
         query: Search query string
         awards: List of awards (for in-memory lexical search)
-        supabase_client: Supabase client (for database lexical search)
+        supabase_client: Supabase client, sync or async (for database lexical search)
         vector_store_client: Vector store client (pgvector/Qdrant)
         top_k: Number of results per search type
-        alpha: Semantic weight
-        beta: Lexical boost
+        query_embedding: Precomputed query embedding for semantic search
     
     Returns:
-        Dictionary with all three result sets and metadata
+        Tuple of (lexical_results, semantic_results)
     """
-    import time
-    
-    top_k = top_k or settings.DEFAULT_TOP_K
-    start_time = time.time()
-    
-    logger.info(f"Running parallel search for query: {query}", extra={"top_k": top_k})
-    
     # Define async search functions
     async def run_lexical_search():
         """Run lexical search async"""
         try:
-            if supabase_client:
-                loop = asyncio.get_event_loop()
+            if supabase_client and is_async_client(supabase_client):
+                # Native async client: await the HTTP calls, no worker thread
+                return await lexical_search_supabase_async(query, supabase_client, top_k)
+            elif supabase_client:
+                loop = asyncio.get_running_loop()
                 return await loop.run_in_executor(
-                    None,
+                    _IO_EXECUTOR,
                     lexical_search_supabase,
                     query,
                     supabase_client,
                     top_k
                 )
             elif awards:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 return await loop.run_in_executor(
-                    None,
+                    _IO_EXECUTOR,
                     lexical_search_in_memory,
                     query,
                     awards,
@@ -208,14 +407,22 @@ async def search_all_async(
     async def run_semantic_search():
         """Run semantic search async"""
         try:
-            if vector_store_client:
-                loop = asyncio.get_event_loop()
+            if vector_store_client and settings.VECTOR_STORE == "pgvector" and settings.SEMANTIC_BATCH_MAX_SIZE > 1:
+                return await _semantic_dispatcher.submit(
+                    (vector_store_client, top_k),
+                    (query, query_embedding)
+                )
+            elif vector_store_client:
+                loop = asyncio.get_running_loop()
                 return await loop.run_in_executor(
-                    None,
-                    semantic_search,
-                    query,
-                    vector_store_client,
-                    top_k
+                    _IO_EXECUTOR,
+                    functools.partial(
+                        semantic_search,
+                        query,
+                        vector_store_client,
+                        top_k,
+                        query_embedding=query_embedding
+                    )
                 )
             else:
                 logger.warning("No vector store available for semantic search")
@@ -244,6 +451,146 @@ async def search_all_async(
         logger.error(f"Semantic search failed: {semantic_results}")
         semantic_results = []
     
+    return lexical_results, semantic_results
+
+
+def _get_cached_response(response_key: str, start_time: float) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached search response
+    
+    Args:
+        response_key: Response cache key
+        start_time: Request start time (for search_time_ms)
+    
+    Returns:
+        Copy of the cached response with fresh metadata, or None on a miss
+    """
+    cached_response = _response_cache.get(response_key)
+    if cached_response is None:
+        return None
+    
+    # Result lists are shared with the cache; only the metadata is per-request
+    return {
+        **cached_response,
+        "metadata": {
+            **cached_response["metadata"],
+            "search_time_ms": (time.perf_counter() - start_time) * 1000,
+            "cache_hit": True
+        }
+    }
+
+
+def _build_search_response(
+    query: str,
+    hybrid_results: List[Dict[str, Any]],
+    lexical_results: List[Dict[str, Any]],
+    semantic_results: List[Dict[str, Any]],
+    top_k: int,
+    duration_ms: float,
+    cache_hit: bool
+) -> Dict[str, Any]:
+    """
+    Deduplicate result sets and build the search_all response
+    
+    Args:
+        query: Search query string
+        hybrid_results: Hybrid search results
+        lexical_results: Lexical search results
+        semantic_results: Semantic search results
+        top_k: Number of results per search type
+        duration_ms: Search time in milliseconds
+        cache_hit: Whether results came from a cache
+    
+    Returns:
+        Dictionary with all three result sets and metadata
+    """
+    # Deduplicate and group results by award_id. Each input is already bounded by
+    # top_k (hybrid_search, lexical and semantic search all select their top_k),
+    # so there is no tail to trim before grouping; semantic chunks are kept whole
+    # so every chunk of a returned award is grouped under it.
+    hybrid_deduplicated = deduplicate_and_group_results(hybrid_results, group_chunks=True)
+    lexical_deduplicated = deduplicate_and_group_results(lexical_results, group_chunks=True)
+    semantic_deduplicated = deduplicate_and_group_results(semantic_results, group_chunks=True)
+    
+    return {
+        "query": query,
+        "hybrid_results": hybrid_deduplicated[:top_k],
+        "lexical_results": lexical_deduplicated[:top_k],
+        "semantic_results": semantic_deduplicated[:top_k],
+        "metadata": {
+            "hybrid_count": len(hybrid_deduplicated),
+            "lexical_count": len(lexical_deduplicated),
+            "semantic_count": len(semantic_deduplicated),
+            "search_time_ms": duration_ms,
+            "vector_store": settings.VECTOR_STORE,
+            "cache_hit": cache_hit
+        }
+    }
+
+
+async def search_all_async(
+    query: str,
+    awards: Optional[List[Dict[str, Any]]] = None,
+    supabase_client=None,
+    vector_store_client=None,
+    top_k: Optional[int] = None,
+    alpha: Optional[float] = None,
+    beta: Optional[float] = None,
+    query_embedding: Optional[List[float]] = None
+) -> Dict[str, Any]:
+    """
+    Perform all search types in TRUE PARALLEL (async version)
+    
+    Runs lexical and semantic searches simultaneously using asyncio.
+    This is 2x faster than sequential execution.
+    
+    Args:
+        query: Search query string
+        awards: List of awards (for in-memory lexical search)
+        supabase_client: Supabase client (for database lexical search)
+        vector_store_client: Vector store client (pgvector/Qdrant)
+        top_k: Number of results per search type
+        alpha: Semantic weight
+        beta: Lexical boost
+        query_embedding: Precomputed query embedding (embedded here if None)
+    
+    Returns:
+        Dictionary with all three result sets and metadata
+    """
+    top_k = top_k or settings.DEFAULT_TOP_K
+    start_time = time.perf_counter()
+    
+    logger.info(f"Running parallel search for query: {query}", extra={"top_k": top_k})
+    
+    # Response cache: repeated requests return before any search work is scheduled
+    response_key = make_cache_key(query, top_k, settings.VECTOR_STORE, alpha, beta, settings.SCORE_FUSION)
+    cached_response = _get_cached_response(response_key, start_time)
+    if cached_response is not None:
+        return cached_response
+    
+    # Exact-query cache: skip both searches for repeated queries
+    cache_key = make_cache_key(query, top_k, settings.VECTOR_STORE)
+    cached = _results_cache.get(cache_key)
+    
+    # Semantic cache: reuse results of a near-identical earlier query
+    cache_tag = (top_k, settings.VECTOR_STORE)
+    if cached is None and vector_store_client and settings.SEMANTIC_CACHE_MAX_SIZE > 0:
+        if query_embedding is None:
+            query_embedding = await asyncio.get_running_loop().run_in_executor(_IO_EXECUTOR, _embed_query, query)
+        if query_embedding is not None:
+            cached = _semantic_results_cache.lookup(query_embedding, tag=cache_tag)
+    
+    if cached is not None:
+        lexical_results, semantic_results = cached
+    else:
+        lexical_results, semantic_results = await _run_searches_async(
+            query, awards, supabase_client, vector_store_client, top_k, query_embedding
+        )
+        if lexical_results or semantic_results:
+            _results_cache.put(cache_key, (lexical_results, semantic_results))
+            if query_embedding is not None:
+                _semantic_results_cache.put(query_embedding, (lexical_results, semantic_results), tag=cache_tag)
+    
     # Run hybrid search (combines lexical + semantic)
     hybrid_results = []
     try:
@@ -263,7 +610,7 @@ async def search_all_async(
     except Exception as e:
         logger.error(f"Hybrid search failed: {e}")
     
-    duration_ms = (time.time() - start_time) * 1000
+    duration_ms = (time.perf_counter() - start_time) * 1000
     
     logger.info(
         f"Parallel search completed in {duration_ms:.2f}ms",
@@ -276,43 +623,32 @@ async def search_all_async(
         }
     )
     
-    # Deduplicate and group results by award_id
-    hybrid_deduplicated = deduplicate_and_group_results(hybrid_results, group_chunks=True)
-    lexical_deduplicated = deduplicate_and_group_results(lexical_results, group_chunks=True)
-    semantic_deduplicated = deduplicate_and_group_results(semantic_results, group_chunks=True)
+    response = _build_search_response(
+        query, hybrid_results, lexical_results, semantic_results, top_k, duration_ms,
+        cache_hit=cached is not None
+    )
+    if lexical_results or semantic_results:
+        _response_cache.put(response_key, response)
     
-    return {
-        "query": query,
-        "hybrid_results": hybrid_deduplicated[:top_k],
-        "lexical_results": lexical_deduplicated[:top_k],
-        "semantic_results": semantic_deduplicated[:top_k],
-        "metadata": {
-            "hybrid_count": len(hybrid_deduplicated),
-            "lexical_count": len(lexical_deduplicated),
-            "semantic_count": len(semantic_deduplicated),
-            "search_time_ms": duration_ms,
-            "vector_store": settings.VECTOR_STORE
-        }
-    }
+    return response
 
 
-def search_all(
-    query: str,
+async def search_all_batch_async(
+    queries: List[str],
     awards: Optional[List[Dict[str, Any]]] = None,
     supabase_client=None,
     vector_store_client=None,
     top_k: Optional[int] = None,
     alpha: Optional[float] = None,
     beta: Optional[float] = None
-) -> Dict[str, Any]:
+) -> List[Dict[str, Any]]:
     """
-    Perform all three search types and return all results (SYNC version)
+    Run search_all_async for many queries (evaluation, warm-up)
     
-    This is the synchronous version. For better performance, use search_all_async().
-    Runs lexical, semantic, and hybrid searches sequentially.
+    All queries are embedded with one batch call, then searched concurrently.
     
     Args:
-        query: Search query string
+        queries: Search query strings
         awards: List of awards (for in-memory lexical search)
         supabase_client: Supabase client (for database lexical search)
         vector_store_client: Vector store client (pgvector/Qdrant)
@@ -321,15 +657,64 @@ def search_all(
         beta: Lexical boost
     
     Returns:
-        Dictionary with all three result sets and metadata
+        List of search_all_async responses, in query order
     """
-    import time
-    
-    top_k = top_k or settings.DEFAULT_TOP_K
-    start_time = time.time()
+    query_embeddings: List[Optional[List[float]]] = [None] * len(queries)
+    # Providers drop blank texts from batch results, so embed only the
+    # non-blank queries and scatter the vectors back by position
+    embed_indices = [i for i, query in enumerate(queries) if query and query.strip()]
+    if vector_store_client and embed_indices:
+        try:
+            embeddings = await get_embedding_service().embed_batch_async([queries[i] for i in embed_indices])
+            if len(embeddings) == len(embed_indices):
+                for i, embedding in zip(embed_indices, embeddings):
+                    query_embeddings[i] = embedding
+            else:
+                logger.warning(
+                    f"Batch query embedding returned {len(embeddings)} vectors for "
+                    f"{len(embed_indices)} queries, embedding per query"
+                )
+        except Exception as e:
+            # Each search embeds its own query instead
+            logger.warning(f"Batch query embedding failed, embedding per query: {e}")
+    
+    return list(await asyncio.gather(*(
+        search_all_async(
+            query,
+            awards=awards,
+            supabase_client=supabase_client,
+            vector_store_client=vector_store_client,
+            top_k=top_k,
+            alpha=alpha,
+            beta=beta,
+            query_embedding=query_embedding
+        )
+        for query, query_embedding in zip(queries, query_embeddings)
+    )))
+
+
+def _run_searches(
+    query: str,
+    awards: Optional[List[Dict[str, Any]]],
+    supabase_client,
+    vector_store_client,
+    top_k: int,
+    query_embedding: Optional[List[float]] = None
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Run lexical and semantic searches sequentially
     
-    logger.info(f"Running all search types for query: {query}", extra={"top_k": top_k})
+    Args:
+        query: Search query string
+        awards: List of awards (for in-memory lexical search)
+        supabase_client: Supabase client (for database lexical search)
+        vector_store_client: Vector store client (pgvector/Qdrant)
+        top_k: Number of results per search type
+        query_embedding: Precomputed query embedding for semantic search
     
+    Returns:
+        Tuple of (lexical_results, semantic_results)
+    """
     # Run lexical search
     lexical_results = []
     try:
@@ -346,12 +731,78 @@ def search_all(
     semantic_results = []
     try:
         if vector_store_client:
-            semantic_results = semantic_search(query, vector_store_client, top_k=top_k)
+            semantic_results = semantic_search(
+                query, vector_store_client, top_k=top_k, query_embedding=query_embedding
+            )
         else:
             logger.warning("No vector store available for semantic search")
     except Exception as e:
         logger.error(f"Semantic search failed: {e}")
     
+    return lexical_results, semantic_results
+
+
+def search_all(
+    query: str,
+    awards: Optional[List[Dict[str, Any]]] = None,
+    supabase_client=None,
+    vector_store_client=None,
+    top_k: Optional[int] = None,
+    alpha: Optional[float] = None,
+    beta: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Perform all three search types and return all results (SYNC version)
+    
+    This is the synchronous version. For better performance, use search_all_async().
+    Runs lexical, semantic, and hybrid searches sequentially.
+    
+    Args:
+        query: Search query string
+        awards: List of awards (for in-memory lexical search)
+        supabase_client: Supabase client (for database lexical search)
+        vector_store_client: Vector store client (pgvector/Qdrant)
+        top_k: Number of results per search type
+        alpha: Semantic weight
+        beta: Lexical boost
+    
+    Returns:
+        Dictionary with all three result sets and metadata
+    """
+    top_k = top_k or settings.DEFAULT_TOP_K
+    start_time = time.perf_counter()
+    
+    logger.info(f"Running all search types for query: {query}", extra={"top_k": top_k})
+    
+    # Response cache: repeated requests return before any search work is scheduled
+    response_key = make_cache_key(query, top_k, settings.VECTOR_STORE, alpha, beta, settings.SCORE_FUSION)
+    cached_response = _get_cached_response(response_key, start_time)
+    if cached_response is not None:
+        return cached_response
+    
+    # Exact-query cache: skip both searches for repeated queries
+    cache_key = make_cache_key(query, top_k, settings.VECTOR_STORE)
+    cached = _results_cache.get(cache_key)
+    
+    # Semantic cache: reuse results of a near-identical earlier query
+    query_embedding = None
+    cache_tag = (top_k, settings.VECTOR_STORE)
+    if cached is None and vector_store_client and settings.SEMANTIC_CACHE_MAX_SIZE > 0:
+        query_embedding = _embed_query(query)
+        if query_embedding is not None:
+            cached = _semantic_results_cache.lookup(query_embedding, tag=cache_tag)
+    
+    if cached is not None:
+        lexical_results, semantic_results = cached
+    else:
+        lexical_results, semantic_results = _run_searches(
+            query, awards, supabase_client, vector_store_client, top_k, query_embedding
+        )
+        if lexical_results or semantic_results:
+            _results_cache.put(cache_key, (lexical_results, semantic_results))
+            if query_embedding is not None:
+                _semantic_results_cache.put(query_embedding, (lexical_results, semantic_results), tag=cache_tag)
+    
     # Run hybrid search (combines lexical + semantic)
     hybrid_results = []
     try:
@@ -367,7 +818,7 @@ def search_all(
     except Exception as e:
         logger.error(f"Hybrid search failed: {e}")
     
-    duration_ms = (time.time() - start_time) * 1000
+    duration_ms = (time.perf_counter() - start_time) * 1000
     
     logger.info(
         f"Search completed in {duration_ms:.2f}ms",
@@ -380,21 +831,11 @@ def search_all(
         }
     )
     
-    # Deduplicate and group results by award_id
-    hybrid_deduplicated = deduplicate_and_group_results(hybrid_results, group_chunks=True)
-    lexical_deduplicated = deduplicate_and_group_results(lexical_results, group_chunks=True)
-    semantic_deduplicated = deduplicate_and_group_results(semantic_results, group_chunks=True)
+    response = _build_search_response(
+        query, hybrid_results, lexical_results, semantic_results, top_k, duration_ms,
+        cache_hit=cached is not None
+    )
+    if lexical_results or semantic_results:
+        _response_cache.put(response_key, response)
     
-    return {
-        "query": query,
-        "hybrid_results": hybrid_deduplicated[:top_k],
-        "lexical_results": lexical_deduplicated[:top_k],
-        "semantic_results": semantic_deduplicated[:top_k],
-        "metadata": {
-            "hybrid_count": len(hybrid_deduplicated),
-            "lexical_count": len(lexical_deduplicated),
-            "semantic_count": len(semantic_deduplicated),
-            "search_time_ms": duration_ms,
-            "vector_store": settings.VECTOR_STORE
-        }
-    }
+    return response
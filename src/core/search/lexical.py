@@ -2,14 +2,111 @@
 Lexical Search
 Exact match search using Supabase Full-Text Search (FTS)
 """
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+from collections import Counter
+import asyncio
+import heapq
 import re
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None  # type: ignore
+
 from src.core.config import settings
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Columns needed to score a candidate; the rest are fetched for the top_k only
+_SCORING_COLUMNS = "award_id, title, public_abstract"
+_DETAIL_COLUMNS = (
+    "award_id, award_number, award_status, institution, uei, duns, "
+    "most_recent_award_date, num_support_periods, pm, current_budget_period, "
+    "current_project_period, pi, supplement_budget_period, public_abstract_url, agency"
+)
+_BASIC_DETAIL_COLUMNS = "award_id, award_number, agency, public_abstract_url"
+
+# Projections for the ilike fallback when the search function fails (all, then basic)
+_FALLBACK_COLUMNS = (
+    "award_id, award_number, title, award_status, institution, uei, duns, "
+    "most_recent_award_date, num_support_periods, pm, current_budget_period, "
+    "current_project_period, pi, supplement_budget_period, public_abstract, "
+    "public_abstract_url, agency"
+)
+_BASIC_FALLBACK_COLUMNS = "award_id, award_number, title, public_abstract, agency, public_abstract_url"
+
+
+class _LexicalQuery:
+    """Per-query lexical state, built once and reused for every scored row"""
+    
+    def __init__(self, query: str):
+        """
+        Precompute lowercased query, terms and a compiled term matcher
+        
+        Args:
+            query: Search query string
+        """
+        self.query_lower = query.lower()
+        self.terms = self.query_lower.split()
+        # Repeated query terms count once per repetition (same as a per-term loop)
+        self.term_counts = Counter(self.terms)
+        
+        # Longest terms first so each position reports its longest matching term;
+        # shorter terms that are substrings of a match are implied present.
+        distinct_terms = sorted(self.term_counts, key=len, reverse=True)
+        self.term_re = (
+            re.compile("(?=(" + "|".join(re.escape(t) for t in distinct_terms) + "))")
+            if distinct_terms else None
+        )
+        self._implied = {t: [u for u in distinct_terms if u in t] for t in distinct_terms}
+        
+        # Aho-Corasick automaton (pyahocorasick, optional): one linear pass reports
+        # every term occurrence, including overlapping and nested terms
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and distinct_terms:
+            self._automaton = ahocorasick.Automaton()
+            for term in distinct_terms:
+                self._automaton.add_word(term, term)
+            self._automaton.make_automaton()
+        
+        # Case-insensitive matcher for locating the first query term in snippets
+        self.snippet_re = (
+            re.compile("|".join(re.escape(t) for t in distinct_terms), re.IGNORECASE)
+            if distinct_terms else None
+        )
+        
+        # Per-query memo of scores and snippets (repeated titles/abstracts skip the scan)
+        self.score_memo: Dict[Tuple[str, str], float] = {}
+        self.snippet_memo: Dict[Tuple[str, int], str] = {}
+    
+    def count_term_matches(self, text_lower: str) -> int:
+        """
+        Count query terms present in text using a single scan
+        
+        Uses the Aho-Corasick automaton when pyahocorasick is installed,
+        otherwise a lookahead regex.
+        
+        Args:
+            text_lower: Lowercased text to scan
+        
+        Returns:
+            Number of query terms found in text
+        """
+        if self.term_re is None:
+            return 0
+        
+        if self._automaton is not None:
+            present = {term for _, term in self._automaton.iter(text_lower)}
+            return sum(self.term_counts[t] for t in present)
+        
+        present = set()
+        for match in set(self.term_re.findall(text_lower)):
+            present.update(self._implied[match])
+        return sum(self.term_counts[t] for t in present)
+
 
 def lexical_search_supabase(
     query: str,
@@ -20,6 +117,11 @@ def lexical_search_supabase(
     """
     Perform lexical search using Supabase Full-Text Search
     
+    Candidates are fetched with one call to the search_<awards_table> RPC
+    (see scripts/create_schema.sql), then re-scored locally so lexical
+    scores keep their 0-1 scale. Only the scoring columns are fetched for
+    candidates; the remaining schema columns are fetched for the top_k.
+    
     Args:
         query: Search query string
         supabase_client: Supabase client instance
@@ -33,94 +135,37 @@ def lexical_search_supabase(
         fields = ["title", "abstract"]
     
     try:
-        # Use Supabase's ilike for text search (works with FTS indexes)
-        # Search in both title and abstract using OR condition
-        query_escaped = query.replace("'", "''")  # Escape single quotes
+        query_escaped = query.replace("'", "''")  # Escape single quotes (ilike fallback)
         
         # Use configured table name
         awards_table = settings.AWARDS_TABLE_NAME
         
-        # Select ALL columns from schema for complete data
-        all_columns = (
-            "award_id, award_number, title, award_status, institution, uei, duns, "
-            "most_recent_award_date, num_support_periods, pm, current_budget_period, "
-            "current_project_period, pi, supplement_budget_period, public_abstract, "
-            "public_abstract_url, agency"
-        )
-        
-        # Search title first (fetch all columns)
+        # Single round-trip: ranked FTS over title + abstract (server-side top-k),
+        # projecting only the columns needed for scoring
         try:
-            title_response = supabase_client.table(awards_table).select(
-                all_columns
-            ).ilike("title", f"%{query_escaped}%").limit(top_k * 2).execute()
+            response = supabase_client.rpc(
+                f"search_{awards_table}",
+                {"q": query, "k": top_k * 2}
+            ).select(_SCORING_COLUMNS).execute()
+            all_rows = response.data
         except Exception as e:
-            # Fallback to basic columns if some don't exist
-            logger.warning(f"Could not fetch all columns, using fallback: {e}")
-            title_response = supabase_client.table(awards_table).select(
-                "award_id, award_number, title, public_abstract, agency, public_abstract_url"
-            ).ilike("title", f"%{query_escaped}%").limit(top_k * 2).execute()
-        
-        # Search abstract (fetch all columns)
-        try:
-            abstract_response = supabase_client.table(awards_table).select(
-                all_columns
-            ).ilike("public_abstract", f"%{query_escaped}%").limit(top_k * 2).execute()
-        except Exception as e:
-            # Fallback to basic columns if some don't exist
-            logger.warning(f"Could not fetch all columns, using fallback: {e}")
-            abstract_response = supabase_client.table(awards_table).select(
-                "award_id, award_number, title, public_abstract, agency, public_abstract_url"
-            ).ilike("public_abstract", f"%{query_escaped}%").limit(top_k * 2).execute()
-        
-        # Combine and deduplicate
-        seen_ids = set()
-        all_rows = []
-        
-        for row in title_response.data:
-            if row.get("award_id") not in seen_ids:
-                all_rows.append(row)
-                seen_ids.add(row.get("award_id"))
+            # Fallback to ilike if the search function is not deployed
+            logger.warning(f"FTS search function unavailable, using ilike fallback: {e}")
+            all_rows = _ilike_title_abstract_rows(
+                supabase_client, awards_table, _SCORING_COLUMNS, query_escaped, top_k
+            )
         
-        for row in abstract_response.data:
-            if row.get("award_id") not in seen_ids:
-                all_rows.append(row)
-                seen_ids.add(row.get("award_id"))
+        lexical_query = _LexicalQuery(query)
+        top_rows = _top_scored_rows(lexical_query, all_rows, top_k)
         
-        results = []
-        for row in all_rows:
-            # Calculate lexical score based on term frequency
-            abstract_text = row.get("public_abstract") or row.get("abstract", "")
-            score = _calculate_lexical_score(query, row.get("title", ""), abstract_text)
-            
-            if score > 0:  # Only include results with matches
-                # Include ALL schema columns in result
-                result = {
-                    "award_id": row.get("award_id", ""),
-                    "award_number": row.get("award_number"),
-                    "lexical_score": score,
-                    "title": row.get("title", ""),
-                    "agency": row.get("agency", ""),
-                    "url": row.get("public_abstract_url") or row.get("url") or None,
-                    "public_abstract_url": row.get("public_abstract_url") or row.get("url") or None,
-                    "snippet": _get_snippet(abstract_text, query),
-                    # All other schema columns
-                    "award_status": row.get("award_status"),
-                    "institution": row.get("institution"),
-                    "uei": row.get("uei"),
-                    "duns": row.get("duns"),
-                    "most_recent_award_date": row.get("most_recent_award_date"),
-                    "num_support_periods": row.get("num_support_periods"),
-                    "pm": row.get("pm"),
-                    "current_budget_period": row.get("current_budget_period"),
-                    "current_project_period": row.get("current_project_period"),
-                    "pi": row.get("pi"),
-                    "supplement_budget_period": row.get("supplement_budget_period"),
-                    "public_abstract": abstract_text
-                }
-                results.append(result)
-        
-        # Sort by score and limit
-        results = sorted(results, key=lambda x: x["lexical_score"], reverse=True)[:top_k]
+        # Fetch the remaining schema columns for the survivors only
+        details = _fetch_award_details(
+            supabase_client, awards_table, [row.get("award_id") for _, row in top_rows]
+        )
+        results = [
+            _build_lexical_result(lexical_query, score, row, details.get(row.get("award_id")))
+            for score, row in top_rows
+        ]
         
         logger.debug(
             f"Lexical search found {len(results)} results",
@@ -135,6 +180,235 @@ def lexical_search_supabase(
         return _lexical_search_fallback(query, supabase_client, top_k)
 
 
+async def lexical_search_supabase_async(
+    query: str,
+    supabase_client,
+    top_k: int = 10
+) -> List[Dict[str, Any]]:
+    """
+    Perform lexical search using the async Supabase client
+    
+    Same query, scoring and fallbacks as lexical_search_supabase, but awaits
+    the PostgREST calls on the event loop instead of blocking a worker thread.
+    
+    Args:
+        query: Search query string
+        supabase_client: Async Supabase client (supabase.AsyncClient)
+        top_k: Number of results to return
+    
+    Returns:
+        List of dictionaries with award_id and lexical_score
+    """
+    try:
+        # Use configured table name
+        awards_table = settings.AWARDS_TABLE_NAME
+        
+        # Single round-trip: ranked FTS over title + abstract (server-side top-k),
+        # projecting only the columns needed for scoring
+        try:
+            response = await supabase_client.rpc(
+                f"search_{awards_table}",
+                {"q": query, "k": top_k * 2}
+            ).select(_SCORING_COLUMNS).execute()
+            all_rows = response.data
+        except Exception as e:
+            # Fallback to ilike if the search function is not deployed
+            logger.warning(f"FTS search function unavailable, using ilike fallback: {e}")
+            all_rows = await _ilike_title_abstract_rows_async(
+                supabase_client, awards_table, _SCORING_COLUMNS, query.replace("'", "''"), top_k
+            )
+        
+        lexical_query = _LexicalQuery(query)
+        top_rows = _top_scored_rows(lexical_query, all_rows, top_k)
+        
+        # Fetch the remaining schema columns for the survivors only
+        details = await _fetch_award_details_async(
+            supabase_client, awards_table, [row.get("award_id") for _, row in top_rows]
+        )
+        results = [
+            _build_lexical_result(lexical_query, score, row, details.get(row.get("award_id")))
+            for score, row in top_rows
+        ]
+        
+        logger.debug(
+            f"Lexical search (async) found {len(results)} results",
+            extra={"query": query, "top_k": top_k}
+        )
+        
+        return results
+        
+    except Exception as e:
+        logger.error(f"Lexical search (async) failed: {e}", extra={"query": query}, exc_info=True)
+        # Fallback to simple text matching
+        return await _lexical_search_fallback_async(query, supabase_client, top_k)
+
+
+def _top_scored_rows(
+    lexical_query: "_LexicalQuery",
+    rows: List[Dict[str, Any]],
+    top_k: int
+) -> List[Tuple[float, Dict[str, Any]]]:
+    """
+    Score candidate award rows against the query and keep the top_k
+    
+    Args:
+        lexical_query: Precomputed per-query state (see _LexicalQuery)
+        rows: Candidate award rows (at least title and public_abstract)
+        top_k: Number of results to return
+    
+    Returns:
+        List of (lexical_score, row) tuples, best first
+    """
+    scored = []
+    for row in rows:
+        # Calculate lexical score based on term frequency
+        abstract_text = row.get("public_abstract") or row.get("abstract", "")
+        score = _calculate_lexical_score(lexical_query, row.get("title", ""), abstract_text)
+        
+        if score > 0:  # Only include results with matches
+            scored.append((score, row))
+    
+    # Select top_k by score (heap selection, no full sort)
+    return heapq.nlargest(top_k, scored, key=lambda x: x[0])
+
+
+def _build_lexical_result(
+    lexical_query: "_LexicalQuery",
+    score: float,
+    row: Dict[str, Any],
+    details: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build a lexical result row with ALL schema columns
+    
+    Args:
+        lexical_query: Precomputed per-query state (see _LexicalQuery)
+        score: Lexical score
+        row: Scored award row (title and abstract)
+        details: Remaining schema columns for the award (defaults to row)
+    
+    Returns:
+        Result dictionary with lexical_score and ALL schema columns
+    """
+    if details is None:
+        details = row
+    abstract_text = row.get("public_abstract") or row.get("abstract", "")
+    url = details.get("public_abstract_url") or details.get("url") or None
+    
+    return {
+        "award_id": row.get("award_id", ""),
+        "award_number": details.get("award_number"),
+        "lexical_score": score,
+        "title": row.get("title", ""),
+        "agency": details.get("agency", ""),
+        "url": url,
+        "public_abstract_url": url,
+        "snippet": _get_snippet(abstract_text, lexical_query),
+        # All other schema columns
+        "award_status": details.get("award_status"),
+        "institution": details.get("institution"),
+        "uei": details.get("uei"),
+        "duns": details.get("duns"),
+        "most_recent_award_date": details.get("most_recent_award_date"),
+        "num_support_periods": details.get("num_support_periods"),
+        "pm": details.get("pm"),
+        "current_budget_period": details.get("current_budget_period"),
+        "current_project_period": details.get("current_project_period"),
+        "pi": details.get("pi"),
+        "supplement_budget_period": details.get("supplement_budget_period"),
+        "public_abstract": abstract_text
+    }
+
+
+def _fetch_award_details(
+    supabase_client,
+    awards_table: str,
+    award_ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch the non-scoring schema columns for a set of awards
+    
+    Args:
+        supabase_client: Supabase client instance
+        awards_table: Awards table name
+        award_ids: Awards to fetch
+    
+    Returns:
+        Dictionary mapping award_id to its detail columns
+    """
+    if not award_ids:
+        return {}
+    
+    for columns in (_DETAIL_COLUMNS, _BASIC_DETAIL_COLUMNS):
+        try:
+            response = _award_details_query(supabase_client, awards_table, columns, award_ids).execute()
+            return {row.get("award_id"): row for row in response.data}
+        except Exception as e:
+            _log_award_details_failure(columns, e)
+    
+    return {}
+
+
+async def _fetch_award_details_async(
+    supabase_client,
+    awards_table: str,
+    award_ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch the non-scoring schema columns for a set of awards (async client)
+    
+    Args:
+        supabase_client: Async Supabase client (supabase.AsyncClient)
+        awards_table: Awards table name
+        award_ids: Awards to fetch
+    
+    Returns:
+        Dictionary mapping award_id to its detail columns
+    """
+    if not award_ids:
+        return {}
+    
+    for columns in (_DETAIL_COLUMNS, _BASIC_DETAIL_COLUMNS):
+        try:
+            response = await _award_details_query(supabase_client, awards_table, columns, award_ids).execute()
+            return {row.get("award_id"): row for row in response.data}
+        except Exception as e:
+            _log_award_details_failure(columns, e)
+    
+    return {}
+
+
+def _award_details_query(supabase_client, awards_table: str, columns: str, award_ids: List[str]):
+    """
+    Build (without executing) the award details query
+    
+    Args:
+        supabase_client: Supabase client instance (sync or async)
+        awards_table: Awards table name
+        columns: Column projection string
+        award_ids: Awards to fetch
+    
+    Returns:
+        PostgREST request builder
+    """
+    return supabase_client.table(awards_table).select(columns).in_("award_id", award_ids)
+
+
+def _log_award_details_failure(columns: str, error: Exception) -> None:
+    """
+    Log a failed award details fetch (all columns first, then basic)
+    
+    Args:
+        columns: Column projection that failed
+        error: Raised exception
+    """
+    if columns == _DETAIL_COLUMNS:
+        # Fallback to basic columns if some don't exist
+        logger.warning(f"Could not fetch all columns, using fallback: {error}")
+    else:
+        logger.warning(f"Could not fetch award details for lexical results: {error}")
+
+
 def lexical_search_in_memory(
     query: str,
     awards: List[Dict[str, Any]],
@@ -151,7 +425,7 @@ def lexical_search_in_memory(
     Returns:
         List of dictionaries with award_id and lexical_score
     """
-    query_terms = query.lower().split()
+    lexical_query = _LexicalQuery(query)
     results = []
     
     for award in awards:
@@ -167,14 +441,9 @@ def lexical_search_in_memory(
         if query.lower() in title:
             score += 50.0
         
-        # Term matching
-        for term in query_terms:
-            # Title matches are worth more
-            if term in title:
-                score += 5.0
-            # Abstract matches
-            if term in abstract:
-                score += 1.0
+        # Term matching (title matches are worth more)
+        score += 5.0 * lexical_query.count_term_matches(title)
+        score += 1.0 * lexical_query.count_term_matches(abstract)
         
         # Normalize score to 0-1 range (for scores < 100)
         if score > 0:
@@ -185,70 +454,94 @@ def lexical_search_in_memory(
                 "lexical_score": normalized_score,
                 "title": award.get("title", ""),
                 "agency": award.get("agency", ""),
-                "snippet": _get_snippet(abstract, query)
+                "snippet": _get_snippet(abstract, lexical_query)
             })
     
-    # Sort by score and return top_k
-    sorted_results = sorted(results, key=lambda x: x["lexical_score"], reverse=True)
-    
     logger.debug(
-        f"Lexical search (in-memory) found {len(sorted_results)} results",
+        f"Lexical search (in-memory) found {len(results)} results",
         extra={"query": query, "top_k": top_k}
     )
     
-    return sorted_results[:top_k]
+    # Select top_k by score (heap selection, no full sort)
+    return heapq.nlargest(top_k, results, key=lambda x: x["lexical_score"])
 
 
 def _calculate_lexical_score(
-    query: str,
+    lexical_query: _LexicalQuery,
     title: str,
     abstract: str
 ) -> float:
     """
     Calculate lexical score based on term frequency
     
+    Results are memoized on the query state, so repeated title/abstract
+    pairs within one search are scored once.
+    
     Args:
-        query: Search query
+        lexical_query: Precomputed per-query state (see _LexicalQuery)
         title: Award title
         abstract: Award abstract
     
     Returns:
         Lexical score (0.0 to 1.0)
     """
-    query_terms = query.lower().split()
+    memo_key = (title, abstract)
+    score = lexical_query.score_memo.get(memo_key)
+    if score is None:
+        score = lexical_query.score_memo[memo_key] = _score_title_abstract(lexical_query, title, abstract)
+    return score
+
+
+def _score_title_abstract(
+    lexical_query: _LexicalQuery,
+    title: str,
+    abstract: str
+) -> float:
+    """
+    Score one title/abstract pair (uncached, see _calculate_lexical_score)
+    
+    Args:
+        lexical_query: Precomputed per-query state (see _LexicalQuery)
+        title: Award title
+        abstract: Award abstract
+    
+    Returns:
+        Lexical score (0.0 to 1.0)
+    """
+    query_lower = lexical_query.query_lower
+    num_terms = len(lexical_query.terms)
     title_lower = title.lower()
-    abstract_lower = abstract.lower()
     
     score = 0.0
     
     # Exact title match
-    if query.lower() == title_lower:
+    if query_lower == title_lower:
         return 1.0
     
     # Exact phrase match in title
-    if query.lower() in title_lower:
+    if query_lower in title_lower:
         score += 0.8
     
     # Term frequency in title (weighted higher)
-    title_matches = sum(1 for term in query_terms if term in title_lower)
+    title_matches = lexical_query.count_term_matches(title_lower)
     if title_matches > 0:
-        score += (title_matches / len(query_terms)) * 0.5
+        score += (title_matches / num_terms) * 0.5
     
     # Term frequency in abstract
-    abstract_matches = sum(1 for term in query_terms if term in abstract_lower)
+    abstract_matches = lexical_query.count_term_matches(abstract.lower())
     if abstract_matches > 0:
-        score += (abstract_matches / len(query_terms)) * 0.2
+        score += (abstract_matches / num_terms) * 0.2
     
     return min(score, 1.0)
 
 
-def _get_snippet(text: str, query: str, max_length: int = 200) -> str:
+def _get_snippet(text: str, lexical_query: _LexicalQuery, max_length: int = 200) -> str:
     """
     Extract a snippet from text containing query terms
     
     Args:
         text: Full text
-        query: Search query
+        lexical_query: Precomputed per-query state (see _LexicalQuery)
         max_length: Maximum snippet length
     
     Returns:
@@ -257,25 +550,41 @@ def _get_snippet(text: str, query: str, max_length: int = 200) -> str:
     if not text:
         return ""
     
-    query_terms = query.lower().split()
-    text_lower = text.lower()
-    
-    # Find first occurrence of any query term
-    for term in query_terms:
-        idx = text_lower.find(term.lower())
-        if idx != -1:
-            # Extract snippet around match
-            start = max(0, idx - 50)
-            end = min(len(text), idx + max_length - 50)
-            snippet = text[start:end]
-            
-            # Add ellipsis if needed
-            if start > 0:
-                snippet = "..." + snippet
-            if end < len(text):
-                snippet = snippet + "..."
-            
-            return snippet
+    memo_key = (text, max_length)
+    snippet = lexical_query.snippet_memo.get(memo_key)
+    if snippet is None:
+        snippet = lexical_query.snippet_memo[memo_key] = _extract_snippet(text, lexical_query, max_length)
+    return snippet
+
+
+def _extract_snippet(text: str, lexical_query: _LexicalQuery, max_length: int) -> str:
+    """
+    Extract a snippet around the first query term (uncached, see _get_snippet)
+    
+    Args:
+        text: Full text (non-empty)
+        lexical_query: Precomputed per-query state (see _LexicalQuery)
+        max_length: Maximum snippet length
+    
+    Returns:
+        Text snippet
+    """
+    # Find first occurrence of any query term (single case-insensitive scan)
+    match = lexical_query.snippet_re.search(text) if lexical_query.snippet_re else None
+    if match:
+        idx = match.start()
+        # Extract snippet around match
+        start = max(0, idx - 50)
+        end = min(len(text), idx + max_length - 50)
+        snippet = text[start:end]
+        
+        # Add ellipsis if needed
+        if start > 0:
+            snippet = "..." + snippet
+        if end < len(text):
+            snippet = snippet + "..."
+        
+        return snippet
     
     # Fallback: return beginning of text
     if len(text) > max_length:
@@ -283,6 +592,111 @@ def _get_snippet(text: str, query: str, max_length: int = 200) -> str:
     return text
 
 
+def _ilike_title_abstract_rows(
+    supabase_client,
+    awards_table: str,
+    columns: str,
+    query_escaped: str,
+    top_k: int
+) -> List[Dict[str, Any]]:
+    """
+    Fetch candidate rows with ilike on title and abstract (two round-trips)
+    
+    Used when the search_<awards_table> FTS function is not available.
+    
+    Args:
+        supabase_client: Supabase client instance
+        awards_table: Awards table name
+        columns: Column projection string
+        query_escaped: Escaped search query
+        top_k: Number of results requested
+    
+    Returns:
+        List of unique award rows
+    """
+    queries = _ilike_title_abstract_queries(supabase_client, awards_table, columns, query_escaped, top_k)
+    
+    # Combine and deduplicate (title matches first)
+    return _merge_unique_rows(*(query.execute().data for query in queries))
+
+
+async def _ilike_title_abstract_rows_async(
+    supabase_client,
+    awards_table: str,
+    columns: str,
+    query_escaped: str,
+    top_k: int
+) -> List[Dict[str, Any]]:
+    """
+    Fetch candidate rows with ilike on title and abstract (async client, concurrently)
+    
+    Args:
+        supabase_client: Async Supabase client (supabase.AsyncClient)
+        awards_table: Awards table name
+        columns: Column projection string
+        query_escaped: Escaped search query
+        top_k: Number of results requested
+    
+    Returns:
+        List of unique award rows
+    """
+    queries = _ilike_title_abstract_queries(supabase_client, awards_table, columns, query_escaped, top_k)
+    responses = await asyncio.gather(*(query.execute() for query in queries))
+    
+    # Combine and deduplicate (title matches first)
+    return _merge_unique_rows(*(response.data for response in responses))
+
+
+def _ilike_title_abstract_queries(
+    supabase_client,
+    awards_table: str,
+    columns: str,
+    query_escaped: str,
+    top_k: int
+) -> list:
+    """
+    Build (without executing) the ilike queries on title and abstract
+    
+    Args:
+        supabase_client: Supabase client instance (sync or async)
+        awards_table: Awards table name
+        columns: Column projection string
+        query_escaped: Escaped search query
+        top_k: Number of results requested
+    
+    Returns:
+        PostgREST request builders, title first
+    """
+    return [
+        supabase_client.table(awards_table).select(
+            columns
+        ).ilike(field, f"%{query_escaped}%").limit(top_k * 2)
+        for field in ("title", "public_abstract")
+    ]
+
+
+def _merge_unique_rows(*row_lists: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Concatenate row lists keeping the first row per award_id
+    
+    Args:
+        *row_lists: Lists of award rows
+    
+    Returns:
+        List of unique award rows
+    """
+    seen_ids = set()
+    all_rows = []
+    
+    for rows in row_lists:
+        for row in rows:
+            if row.get("award_id") not in seen_ids:
+                all_rows.append(row)
+                seen_ids.add(row.get("award_id"))
+    
+    return all_rows
+
+
 def _lexical_search_fallback(
     query: str,
     supabase_client,
@@ -300,64 +714,93 @@ def _lexical_search_fallback(
         List of search results
     """
     try:
-        # Use configured table name
-        awards_table = settings.AWARDS_TABLE_NAME
-        
         # Simple text search fallback (fetch all columns)
-        all_columns = (
-            "award_id, award_number, title, award_status, institution, uei, duns, "
-            "most_recent_award_date, num_support_periods, pm, current_budget_period, "
-            "current_project_period, pi, supplement_budget_period, public_abstract, "
-            "public_abstract_url, agency"
-        )
-        
         try:
-            response = supabase_client.table(awards_table).select(
-                all_columns
-            ).ilike("title", f"%{query}%").limit(top_k).execute()
+            response = _fallback_query(supabase_client, _FALLBACK_COLUMNS, query, top_k).execute()
         except Exception as e:
             logger.warning(f"Could not fetch all columns in fallback, using basic: {e}")
-            response = supabase_client.table(awards_table).select(
-                "award_id, award_number, title, public_abstract, agency, public_abstract_url"
-            ).ilike("title", f"%{query}%").limit(top_k).execute()
-        
-        results = []
-        for row in response.data:
-            abstract_text = row.get("public_abstract") or row.get("abstract", "")
-            score = _calculate_lexical_score(
-                query,
-                row.get("title", ""),
-                abstract_text
-            )
-            
-            # Include ALL schema columns
-            result = {
-                "award_id": row.get("award_id", ""),
-                "award_number": row.get("award_number"),
-                "lexical_score": score,
-                "title": row.get("title", ""),
-                "agency": row.get("agency", ""),
-                "url": row.get("public_abstract_url") or row.get("url") or None,
-                "public_abstract_url": row.get("public_abstract_url") or row.get("url") or None,
-                "snippet": _get_snippet(abstract_text, query),
-                # All other schema columns
-                "award_status": row.get("award_status"),
-                "institution": row.get("institution"),
-                "uei": row.get("uei"),
-                "duns": row.get("duns"),
-                "most_recent_award_date": row.get("most_recent_award_date"),
-                "num_support_periods": row.get("num_support_periods"),
-                "pm": row.get("pm"),
-                "current_budget_period": row.get("current_budget_period"),
-                "current_project_period": row.get("current_project_period"),
-                "pi": row.get("pi"),
-                "supplement_budget_period": row.get("supplement_budget_period"),
-                "public_abstract": abstract_text
-            }
-            results.append(result)
-        
-        return sorted(results, key=lambda x: x["lexical_score"], reverse=True)
+            response = _fallback_query(supabase_client, _BASIC_FALLBACK_COLUMNS, query, top_k).execute()
+        
+        return _score_fallback_rows(query, response.data)
         
     except Exception as e:
         logger.error(f"Fallback lexical search failed: {e}")
         return []
+
+
+async def _lexical_search_fallback_async(
+    query: str,
+    supabase_client,
+    top_k: int
+) -> List[Dict[str, Any]]:
+    """
+    Fallback lexical search if FTS fails (async client)
+    
+    Args:
+        query: Search query
+        supabase_client: Async Supabase client (supabase.AsyncClient)
+        top_k: Number of results
+    
+    Returns:
+        List of search results
+    """
+    try:
+        # Simple text search fallback (fetch all columns)
+        try:
+            response = await _fallback_query(supabase_client, _FALLBACK_COLUMNS, query, top_k).execute()
+        except Exception as e:
+            logger.warning(f"Could not fetch all columns in fallback, using basic: {e}")
+            response = await _fallback_query(supabase_client, _BASIC_FALLBACK_COLUMNS, query, top_k).execute()
+        
+        return _score_fallback_rows(query, response.data)
+        
+    except Exception as e:
+        logger.error(f"Fallback lexical search (async) failed: {e}")
+        return []
+
+
+def _fallback_query(supabase_client, columns: str, query: str, top_k: int):
+    """
+    Build (without executing) the fallback title ilike query
+    
+    Args:
+        supabase_client: Supabase client instance (sync or async)
+        columns: Column projection string
+        query: Search query
+        top_k: Number of results
+    
+    Returns:
+        PostgREST request builder
+    """
+    # Use configured table name
+    return supabase_client.table(settings.AWARDS_TABLE_NAME).select(
+        columns
+    ).ilike("title", f"%{query}%").limit(top_k)
+
+
+def _score_fallback_rows(query: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Score fallback rows and build results with ALL schema columns
+    
+    Args:
+        query: Search query
+        rows: Award rows from the fallback query
+    
+    Returns:
+        List of search results, best first
+    """
+    lexical_query = _LexicalQuery(query)
+    
+    results = []
+    for row in rows:
+        abstract_text = row.get("public_abstract") or row.get("abstract", "")
+        score = _calculate_lexical_score(
+            lexical_query,
+            row.get("title", ""),
+            abstract_text
+        )
+        
+        # Include ALL schema columns
+        results.append(_build_lexical_result(lexical_query, score, row))
+    
+    return sorted(results, key=lambda x: x["lexical_score"], reverse=True)
@@ -0,0 +1,264 @@
+"""
+Query Cache
+Thread-safe caches for search hot paths: exact-key LRU with TTL, and an
+approximate cache keyed by query embedding similarity
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a compact cache key from query parameters
+
+    Args:
+        *parts: Values that identify the cached computation
+
+    Returns:
+        128-bit blake2b hex digest of the joined parts
+    """
+    raw = "|".join(str(p) for p in parts)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class QueryCache:
+    """Bounded LRU cache with per-entry expiry (thread-safe)"""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300.0, name: str = "query"):
+        """
+        Initialize query cache
+
+        Args:
+            max_size: Maximum number of entries (oldest evicted first)
+            ttl_seconds: Entry lifetime in seconds (0 disables expiry)
+            name: Cache name used in log messages
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        logger.debug(
+            f"{self.name} cache hit",
+            extra={"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+        )
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else 0.0
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticCache:
+    """
+    Approximate cache keyed by query embedding (thread-safe)
+
+    A lookup returns the payload of the most similar cached query when the
+    cosine similarity is at least ``threshold`` and the entry was stored
+    under the same tag (e.g. top_k and vector store) and has not expired.
+    Requires numpy; without it every lookup misses.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        threshold: float = 0.95,
+        ttl_seconds: float = 300.0,
+        name: str = "semantic"
+    ):
+        """
+        Initialize semantic cache
+
+        Args:
+            max_size: Maximum number of entries (least recently used evicted first)
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Entry lifetime in seconds (0 disables expiry)
+            name: Cache name used in log messages
+        """
+        self.max_size = max_size
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._vectors = None  # (capacity, d) float32, L2-normalized rows
+        self._last_used = None  # (capacity,) int64 use counter for LRU eviction
+        self._expires_at = None  # (capacity,) float64 monotonic expiry (inf = never)
+        self._tags: list = []
+        self._payloads: list = []
+        self._clock = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]):
+        """L2-normalize an embedding (None for a zero vector)"""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else None
+
+    def lookup(self, embedding: Sequence[float], tag: Hashable = None) -> Optional[Any]:
+        """
+        Find the payload of the closest cached query
+
+        Args:
+            embedding: Query embedding
+            tag: Only entries stored with an equal tag can match
+
+        Returns:
+            Cached payload, or None if no entry is similar enough
+        """
+        if not NUMPY_AVAILABLE or self.max_size <= 0:
+            return None
+
+        query_vector = self._normalize(embedding)
+
+        with self._lock:
+            count = len(self._payloads)
+            if query_vector is None or count == 0 or self._vectors.shape[1] != query_vector.shape[0]:
+                self.misses += 1
+                return None
+
+            # One matrix-vector product scores every cached query; expired
+            # slots are misses
+            scores = self._vectors[:count] @ query_vector
+            candidates = np.flatnonzero(
+                (scores >= self.threshold) & (self._expires_at[:count] >= time.monotonic())
+            )
+            for i in candidates[np.argsort(-scores[candidates])]:
+                if self._tags[i] == tag:
+                    self._clock += 1
+                    self._last_used[i] = self._clock
+                    self.hits += 1
+                    logger.debug(
+                        f"{self.name} cache hit",
+                        extra={"similarity": float(scores[i]), "hits": self.hits, "misses": self.misses}
+                    )
+                    return self._payloads[i]
+
+            self.misses += 1
+            return None
+
+    def put(self, embedding: Sequence[float], payload: Any, tag: Hashable = None) -> None:
+        """
+        Store a payload under a query embedding
+
+        Args:
+            embedding: Query embedding
+            payload: Value to cache
+            tag: Tag that lookups must match
+        """
+        if not NUMPY_AVAILABLE or self.max_size <= 0:
+            return
+
+        query_vector = self._normalize(embedding)
+        if query_vector is None:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != query_vector.shape[0]:
+                # First entry (or embedding model changed): allocate storage
+                capacity = min(self.max_size, 64)
+                self._vectors = np.zeros((capacity, query_vector.shape[0]), dtype=np.float32)
+                self._last_used = np.zeros(capacity, dtype=np.int64)
+                self._expires_at = np.zeros(capacity, dtype=np.float64)
+                self._tags = []
+                self._payloads = []
+
+            count = len(self._payloads)
+            if count == self._vectors.shape[0] and count < self.max_size:
+                # Grow storage geometrically up to max_size
+                capacity = min(self.max_size, count * 2)
+                self._vectors = np.resize(self._vectors, (capacity, self._vectors.shape[1]))
+                self._last_used = np.resize(self._last_used, capacity)
+                self._expires_at = np.resize(self._expires_at, capacity)
+
+            if count < self.max_size:
+                slot = count
+                self._tags.append(tag)
+                self._payloads.append(payload)
+            else:
+                # Reuse an expired slot, else the least recently used one
+                expired = np.flatnonzero(self._expires_at[:count] < now)
+                slot = int(expired[0]) if expired.size else int(np.argmin(self._last_used[:count]))
+                self._tags[slot] = tag
+                self._payloads[slot] = payload
+
+            self._clock += 1
+            self._vectors[slot] = query_vector
+            self._last_used[slot] = self._clock
+            self._expires_at[slot] = now + self.ttl_seconds if self.ttl_seconds > 0 else np.inf
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._vectors = None
+            self._last_used = None
+            self._expires_at = None
+            self._tags = []
+            self._payloads = []
+
+    def __len__(self) -> int:
+        return len(self._payloads)
@@ -2,7 +2,15 @@
 Ranking and Re-ranking
 Functions for ranking and re-ranking search results
 """
-from typing import List, Dict, Any
+import heapq
+from typing import List, Dict, Any, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
 
 from src.core.config import settings
 from src.core.logging import get_logger
@@ -28,6 +36,28 @@ def apply_lexical_boost(
     """
     beta = beta or settings.LEXICAL_BOOST
     
+    if NUMPY_AVAILABLE and results:
+        lexical = np.fromiter(
+            (lexical_scores.get(r.get("award_id"), 0.0) for r in results),
+            dtype=np.float64,
+            count=len(results)
+        )
+        # Only results with a lexical match are boosted
+        boosted = np.flatnonzero(lexical > 0)
+        current = np.fromiter(
+            (results[i].get("final_score", results[i].get("semantic_score", 0.0)) for i in boosted.tolist()),
+            dtype=np.float64,
+            count=len(boosted)
+        )
+        boosted_lexical = lexical[boosted]
+        final = current + beta * boosted_lexical
+        
+        for i, final_score, lexical_score in zip(boosted.tolist(), final.tolist(), boosted_lexical.tolist()):
+            results[i]["final_score"] = final_score
+            results[i]["lexical_score"] = lexical_score
+        
+        return results
+    
     for result in results:
         award_id = result.get("award_id")
         lexical_score = lexical_scores.get(award_id, 0.0)
@@ -53,8 +83,25 @@ def deduplicate_by_award_id(
         keep_highest_score: If True, keep result with highest score
     
     Returns:
-        Deduplicated list of results
+        Deduplicated list of results (in order of each award's first appearance)
     """
+    if NUMPY_AVAILABLE and keep_highest_score:
+        rows = [r for r in results if r.get("award_id")]
+        if not rows:
+            return []
+        
+        ids = np.asarray([r["award_id"] for r in rows], dtype=object)
+        scores = np.fromiter((_result_score(r) for r in rows), dtype=np.float64, count=len(rows))
+        
+        # Best row per award: first occurrence of each id after a stable sort by score
+        order = np.argsort(-scores, kind="stable")
+        _, best_positions = np.unique(ids[order], return_index=True)
+        best_rows = order[best_positions]
+        
+        # Restore first-appearance order (both np.unique calls list ids in sorted order)
+        _, first_positions = np.unique(ids, return_index=True)
+        return [rows[i] for i in best_rows[np.argsort(first_positions)].tolist()]
+    
     award_results = {}
     
     for result in results:
@@ -75,10 +122,25 @@ def deduplicate_by_award_id(
     return list(award_results.values())
 
 
+def _result_score(result: Dict[str, Any]) -> float:
+    """
+    Score used to compare duplicate results (final, then semantic, then lexical)
+    
+    Args:
+        result: Search result
+    
+    Returns:
+        Result score (0.0 if missing)
+    """
+    score_key = "final_score" if "final_score" in result else "semantic_score" if "semantic_score" in result else "lexical_score"
+    return result.get(score_key) or 0.0
+
+
 def rank_results(
     results: List[Dict[str, Any]],
     sort_key: str = "final_score",
-    reverse: bool = True
+    reverse: bool = True,
+    top_k: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     Rank results by score
@@ -87,8 +149,17 @@ def rank_results(
         results: List of search results
         sort_key: Key to sort by (default: "final_score")
         reverse: Sort in descending order (default: True)
+        top_k: Only return the first top_k ranked results (default: all)
     
     Returns:
         Sorted list of results
     """
-    return sorted(results, key=lambda x: x.get(sort_key, 0.0), reverse=reverse)
+    key = lambda x: x.get(sort_key, 0.0)
+    
+    # Heap selection is O(n log k) when only a small head is needed
+    if top_k is not None and top_k < len(results) // 2:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(top_k, results, key=key)
+    
+    ranked = sorted(results, key=key, reverse=reverse)
+    return ranked if top_k is None else ranked[:top_k]
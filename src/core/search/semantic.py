@@ -2,20 +2,225 @@
 Semantic Search
 Vector similarity search using embeddings
 """
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
 
 from src.core.config import settings
 from src.core.logging import get_logger
+from src.core.search.query_cache import QueryCache, SemanticCache, make_cache_key
 from src.indexing.embeddings import get_embedding_service
 
 logger = get_logger(__name__)
 
+# Query embeddings keyed by normalized query text (repeated queries skip the model/API call)
+_query_embedding_cache = QueryCache(
+    max_size=settings.QUERY_EMBED_CACHE_MAX_SIZE,
+    ttl_seconds=settings.QUERY_EMBED_TTL,
+    name="query embedding"
+)
+
+# Award columns joined onto pgvector hits (all schema columns)
+_AWARD_METADATA_COLUMNS = [
+    "award_id", "award_number", "title", "award_status", "institution", "uei", "duns",
+    "most_recent_award_date", "num_support_periods", "pm", "current_budget_period",
+    "current_project_period", "pi", "supplement_budget_period", "public_abstract",
+    "public_abstract_url", "agency"
+]
+
+# Metadata projections for the REST fallback ladder (full, then basic, then minimal)
+_AWARD_COLUMNS_FULL = ", ".join(_AWARD_METADATA_COLUMNS)
+_AWARD_COLUMNS_BASIC = "award_id, award_number, title, public_abstract, agency, public_abstract_url"
+_AWARD_COLUMNS_MIN = "award_id, title, agency"
+
+# Columns that exist in the awards table (loaded once by load_awards_columns;
+# None until then, in which case metadata fetches probe with fallbacks)
+_awards_columns: Optional[frozenset] = None
+
+# Semantic result snippets: leading characters of the matched chunk
+_SNIPPET_CHARS = 200
+
+# Award metadata rows by award_id (the same awards recur across queries)
+_award_metadata_cache = QueryCache(
+    max_size=settings.AWARD_METADATA_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AWARD_METADATA_CACHE_TTL,
+    name="award metadata"
+)
+
+# Vector search results keyed by query embedding (near-duplicate queries skip the vector store)
+_semantic_search_cache = SemanticCache(
+    max_size=settings.SEMANTIC_CACHE_MAX_SIZE,
+    threshold=settings.SEMANTIC_CACHE_TAU,
+    ttl_seconds=settings.QUERY_CACHE_TTL,
+    name="vector search"
+)
+
+
+def clear_semantic_search_cache() -> None:
+    """Drop cached vector search results (call after the index changes)"""
+    _semantic_search_cache.clear()
+
+
+def embed_query(query: str) -> Sequence[float]:
+    """
+    Embed a search query, reusing the embedding of a repeated query
+    
+    Args:
+        query: Search query string
+    
+    Returns:
+        Query embedding vector (read-only float32 array when numpy is available,
+        so the vector store and caches use it without re-converting each float)
+    """
+    cache_key = _query_embedding_key(query)
+    query_embedding = _query_embedding_cache.get(cache_key)
+    if query_embedding is None:
+        embedding_service = get_embedding_service()
+        query_embedding = _cache_query_embedding(cache_key, embedding_service.embed_text(query))
+    return query_embedding
+
+
+def _query_embedding_key(query: str) -> str:
+    """Query embedding cache key (normalized query text + embedding model)"""
+    return make_cache_key(query.strip().lower(), settings.EMBEDDING_PROVIDER, settings.EMBEDDING_MODEL)
+
+
+def _cache_query_embedding(cache_key: str, embedding: Sequence[float]) -> Sequence[float]:
+    """Store a query embedding (as a read-only float32 array with numpy) and return it"""
+    if NUMPY_AVAILABLE:
+        embedding = np.asarray(embedding, dtype=np.float32)
+        embedding.flags.writeable = False  # shared through the cache
+    _query_embedding_cache.put(cache_key, embedding)
+    return embedding
+
+
+def embed_queries(queries: List[str]) -> List[Optional[Sequence[float]]]:
+    """
+    Embed several search queries, with one model/API call for the uncached ones
+    
+    Args:
+        queries: Search query strings
+    
+    Returns:
+        Embedding per query, in order (None for blank queries)
+    """
+    cache_keys = [_query_embedding_key(query) for query in queries]
+    query_embeddings = [_query_embedding_cache.get(key) for key in cache_keys]
+    missing = [
+        i for i, (query, embedding) in enumerate(zip(queries, query_embeddings))
+        if embedding is None and query and query.strip()
+    ]
+    if not missing:
+        return query_embeddings
+    
+    # Providers drop blank texts from batch results; only non-blank ones are sent
+    embeddings = get_embedding_service().embed_batch([queries[i] for i in missing])
+    if len(embeddings) != len(missing):
+        logger.warning(f"Batch query embedding returned {len(embeddings)} vectors for {len(missing)} queries")
+        for i in missing:
+            query_embeddings[i] = embed_query(queries[i])
+        return query_embeddings
+    
+    for i, embedding in zip(missing, embeddings):
+        if embedding is not None:
+            query_embeddings[i] = _cache_query_embedding(cache_keys[i], embedding)
+    return query_embeddings
+
+
+def load_awards_columns(supabase_raw=None) -> Optional[frozenset]:
+    """
+    Look up which award metadata columns exist (once, e.g. during warmup)
+    
+    PostgREST doesn't expose information_schema, so the column names are read
+    from one sample row.
+    
+    Args:
+        supabase_raw: Raw Supabase client (defaults to the shared client)
+    
+    Returns:
+        Available column names, or None if they could not be determined
+    """
+    global _awards_columns
+    
+    try:
+        if supabase_raw is None:
+            from src.database.supabase import get_supabase_client
+            supabase_raw = get_supabase_client().get_client()
+        
+        response = supabase_raw.table(settings.AWARDS_TABLE_NAME).select("*").limit(1).execute()
+        if response.data:
+            _awards_columns = frozenset(response.data[0].keys())
+            logger.info(
+                f"Awards table columns loaded ({len(_awards_columns)})",
+                extra={"missing": [c for c in _AWARD_METADATA_COLUMNS if c not in _awards_columns]}
+            )
+    except Exception as e:
+        logger.warning(f"Could not load awards table columns: {e}")
+    
+    return _awards_columns
+
+
+def _award_metadata_columns() -> List[str]:
+    """
+    Award metadata columns to select (only those that exist, once known)
+    
+    Returns:
+        Column names
+    """
+    if _awards_columns is None:
+        return _AWARD_METADATA_COLUMNS
+    return [c for c in _AWARD_METADATA_COLUMNS if c in _awards_columns]
+
+
+def _format_award_metadata(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize an award row into the metadata merged into semantic results
+    
+    Args:
+        row: Award row (Supabase REST or joined pgvector columns)
+    
+    Returns:
+        Dictionary with ALL schema columns
+    """
+    url = row.get("public_abstract_url") or row.get("url") or None
+    return {
+        "award_id": row.get("award_id", ""),
+        "award_number": row.get("award_number"),
+        "title": row.get("title", ""),
+        "agency": row.get("agency", ""),
+        "url": url,
+        "public_abstract_url": url,
+        "award_status": row.get("award_status"),
+        "institution": row.get("institution"),
+        "uei": row.get("uei"),
+        "duns": row.get("duns"),
+        "most_recent_award_date": row.get("most_recent_award_date"),
+        "num_support_periods": row.get("num_support_periods"),
+        "pm": row.get("pm"),
+        "current_budget_period": row.get("current_budget_period"),
+        "current_project_period": row.get("current_project_period"),
+        "pi": row.get("pi"),
+        "supplement_budget_period": row.get("supplement_budget_period"),
+        "public_abstract": row.get("public_abstract")
+    }
+
+
+# Metadata for hits whose award row could not be fetched
+_EMPTY_AWARD_METADATA = _format_award_metadata({})
+
 
 def semantic_search_pgvector(
     query: str,
     pgvector_manager,
     top_k: int = 10,
-    filter_agency: Optional[str] = None
+    filter_agency: Optional[str] = None,
+    query_embedding: Optional[List[float]] = None,
+    accuracy: str = "fast"
 ) -> List[Dict[str, Any]]:
     """
     Perform semantic search using pgvector
@@ -25,139 +230,189 @@ def semantic_search_pgvector(
         pgvector_manager: PgVectorManager instance
         top_k: Number of results to return
         filter_agency: Optional agency filter
+        query_embedding: Precomputed query embedding (skips re-encoding the query)
+        accuracy: "fast" or "accurate" (HNSW ef_search tier)
     
     Returns:
         List of dictionaries with award_id and semantic_score
     """
     try:
-        # Generate query embedding
-        embedding_service = get_embedding_service()
-        query_embedding = embedding_service.embed_text(query)
+        # Generate query embedding (unless the caller already has one)
+        if query_embedding is None:
+            query_embedding = embed_query(query)
         
-        # Search vectors
-        results = pgvector_manager.search_vectors(
-            query_vector=query_embedding,
-            top_k=top_k,
-            filter_agency=filter_agency
+        results = _search_pgvector_hits(pgvector_manager, [query_embedding], top_k, filter_agency, accuracy)[0]
+        formatted_results = _format_pgvector_results(results)
+        
+        logger.debug(
+            f"Semantic search (pgvector) found {len(formatted_results)} results",
+            extra={"query": query, "top_k": top_k}
         )
         
-        # Fetch full award data from Supabase for titles and agency
-        formatted_results = []
-        award_ids = list(set([r["award_id"] for r in results]))  # Get unique award IDs
+        return formatted_results
         
-        # Fetch award metadata from Supabase
-        award_metadata = {}
-        try:
+    except Exception as e:
+        logger.error(f"Semantic search (pgvector) failed: {e}", extra={"query": query})
+        return []
+
+
+def _search_pgvector_hits(
+    pgvector_manager,
+    query_embeddings: List[List[float]],
+    top_k: int,
+    filter_agency: Optional[str],
+    accuracy: str = "fast"
+) -> List[List[Dict[str, Any]]]:
+    """
+    Run one batched pgvector search, joining award metadata when possible
+    
+    Args:
+        pgvector_manager: PgVectorManager instance
+        query_embeddings: Query embedding vectors
+        top_k: Number of results per query
+        filter_agency: Optional agency filter
+        accuracy: "fast" or "accurate" (HNSW ef_search tier)
+    
+    Returns:
+        Raw vector hits per query, in input order
+    """
+    if accuracy == "accurate":
+        ef_search = settings.PGVECTOR_HNSW_EF_SEARCH_ACCURATE
+    else:
+        ef_search = settings.PGVECTOR_HNSW_EF_SEARCH
+    
+    # Search vectors, joining award metadata in the same query
+    try:
+        return pgvector_manager.search_vectors_batch(
+            query_embeddings,
+            top_k=top_k,
+            filter_agency=filter_agency,
+            award_columns=_award_metadata_columns(),
+            ef_search=ef_search
+        )
+    except Exception as e:
+        logger.warning(f"Vector search with award join failed, fetching metadata separately: {e}")
+        return pgvector_manager.search_vectors_batch(
+            query_embeddings,
+            top_k=top_k,
+            filter_agency=filter_agency,
+            ef_search=ef_search
+        )
+
+
+def _format_pgvector_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge award metadata into pgvector hits
+    
+    Args:
+        results: Raw vector hits for one query
+    
+    Returns:
+        Semantic results with ALL schema columns (all chunks kept, deduplicated later)
+    """
+    formatted_results = []
+    award_metadata = {}
+    for r in results:
+        if r.get("award"):
+            award_metadata[r["award_id"]] = _format_award_metadata(r["award"])
+    
+    # Awards not joined above (join fallback): cached rows first, Supabase only for the rest
+    award_ids = list({r["award_id"] for r in results if "award" not in r})
+    missing_ids = []
+    for award_id in award_ids:
+        metadata = _award_metadata_cache.get(award_id)
+        if metadata is None:
+            missing_ids.append(award_id)
+        else:
+            award_metadata[award_id] = metadata
+    
+    try:
+        if missing_ids:
             from src.database.supabase import get_supabase_client
             supabase_client = get_supabase_client()
             supabase_raw = supabase_client.get_client()
             
-            if award_ids:
-                # Use configured table name
-                awards_table = settings.AWARDS_TABLE_NAME
-                
-                # Fetch ALL columns from schema
-                all_columns = (
-                    "award_id, award_number, title, award_status, institution, uei, duns, "
-                    "most_recent_award_date, num_support_periods, pm, current_budget_period, "
-                    "current_project_period, pi, supplement_budget_period, public_abstract, "
-                    "public_abstract_url, agency"
-                )
-                
+            # Use configured table name
+            awards_table = settings.AWARDS_TABLE_NAME
+            
+            if _awards_columns is not None:
+                # Column set known: one query for the columns that exist
+                metadata_response = supabase_raw.table(awards_table).select(
+                    ", ".join(_award_metadata_columns())
+                ).in_("award_id", missing_ids).execute()
+            else:
                 try:
                     # Try to fetch all columns
                     metadata_response = supabase_raw.table(awards_table).select(
-                        all_columns
-                    ).in_("award_id", award_ids).execute()
+                        _AWARD_COLUMNS_FULL
+                    ).in_("award_id", missing_ids).execute()
                 except Exception as e1:
                     # Fallback to basic columns if some don't exist
                     logger.warning(f"Could not fetch all columns, using fallback: {e1}")
                     try:
                         metadata_response = supabase_raw.table(awards_table).select(
-                            "award_id, award_number, title, public_abstract, agency, public_abstract_url"
-                        ).in_("award_id", award_ids).execute()
+                            _AWARD_COLUMNS_BASIC
+                        ).in_("award_id", missing_ids).execute()
                     except:
                         # Final fallback
                         metadata_response = supabase_raw.table(awards_table).select(
-                            "award_id, title, agency"
-                        ).in_("award_id", award_ids).execute()
-                
-                for row in metadata_response.data:
-                    # Store ALL columns in metadata
-                    award_metadata[row["award_id"]] = {
-                        "award_id": row.get("award_id", ""),
-                        "award_number": row.get("award_number"),
-                        "title": row.get("title", ""),
-                        "agency": row.get("agency", ""),
-                        "url": row.get("public_abstract_url") or row.get("url") or None,
-                        "public_abstract_url": row.get("public_abstract_url") or row.get("url") or None,
-                        "award_status": row.get("award_status"),
-                        "institution": row.get("institution"),
-                        "uei": row.get("uei"),
-                        "duns": row.get("duns"),
-                        "most_recent_award_date": row.get("most_recent_award_date"),
-                        "num_support_periods": row.get("num_support_periods"),
-                        "pm": row.get("pm"),
-                        "current_budget_period": row.get("current_budget_period"),
-                        "current_project_period": row.get("current_project_period"),
-                        "pi": row.get("pi"),
-                        "supplement_budget_period": row.get("supplement_budget_period"),
-                        "public_abstract": row.get("public_abstract")
-                    }
-        except Exception as e:
-            logger.warning(f"Could not fetch award metadata: {e}")
-        
-        # Format results with full metadata (keep all chunks, will deduplicate later)
-        for result in results:
-            award_id = result["award_id"]
-            metadata = award_metadata.get(award_id, {})
-            chunk_text = result.get("chunk_text", "")
+                            _AWARD_COLUMNS_MIN
+                        ).in_("award_id", missing_ids).execute()
             
-            # Include ALL schema columns in result
-            formatted_result = {
-                "award_id": award_id,
-                "award_number": metadata.get("award_number"),
-                "semantic_score": result["similarity"],
-                "title": metadata.get("title", ""),
-                "agency": metadata.get("agency", ""),
-                "url": metadata.get("url") or metadata.get("public_abstract_url"),
-                "public_abstract_url": metadata.get("public_abstract_url") or metadata.get("url"),
-                "chunk_index": result.get("chunk_index", 0),
-                "chunk_text": chunk_text,
-                "snippet": chunk_text[:200] + "..." if len(chunk_text) > 200 else chunk_text,
-                # All other schema columns
-                "award_status": metadata.get("award_status"),
-                "institution": metadata.get("institution"),
-                "uei": metadata.get("uei"),
-                "duns": metadata.get("duns"),
-                "most_recent_award_date": metadata.get("most_recent_award_date"),
-                "num_support_periods": metadata.get("num_support_periods"),
-                "pm": metadata.get("pm"),
-                "current_budget_period": metadata.get("current_budget_period"),
-                "current_project_period": metadata.get("current_project_period"),
-                "pi": metadata.get("pi"),
-                "supplement_budget_period": metadata.get("supplement_budget_period"),
-                "public_abstract": metadata.get("public_abstract")
-            }
-            formatted_results.append(formatted_result)
-        
-        logger.debug(
-            f"Semantic search (pgvector) found {len(formatted_results)} results",
-            extra={"query": query, "top_k": top_k}
-        )
-        
-        return formatted_results
-        
+            for row in metadata_response.data:
+                # Store ALL columns in metadata
+                metadata = _format_award_metadata(row)
+                award_metadata[row["award_id"]] = metadata
+                _award_metadata_cache.put(row["award_id"], metadata)
     except Exception as e:
-        logger.error(f"Semantic search (pgvector) failed: {e}", extra={"query": query})
-        return []
+        logger.warning(f"Could not fetch award metadata: {e}")
+    
+    # Format results with full metadata (keep all chunks, will deduplicate later)
+    for result in results:
+        award_id = result["award_id"]
+        metadata = award_metadata.get(award_id) or _EMPTY_AWARD_METADATA
+        url = metadata["url"]  # same value as metadata["public_abstract_url"]
+        chunk_text = result.get("chunk_text", "")
+        snippet = chunk_text if len(chunk_text) <= _SNIPPET_CHARS else f"{chunk_text[:_SNIPPET_CHARS]}..."
+        
+        # Include ALL schema columns in result (metadata always has every key)
+        formatted_result = {
+            "award_id": award_id,
+            "award_number": metadata["award_number"],
+            "semantic_score": result["similarity"],
+            "title": metadata["title"],
+            "agency": metadata["agency"],
+            "url": url,
+            "public_abstract_url": url,
+            "chunk_index": result.get("chunk_index", 0),
+            "chunk_text": chunk_text,
+            "snippet": snippet,
+            # All other schema columns
+            "award_status": metadata["award_status"],
+            "institution": metadata["institution"],
+            "uei": metadata["uei"],
+            "duns": metadata["duns"],
+            "most_recent_award_date": metadata["most_recent_award_date"],
+            "num_support_periods": metadata["num_support_periods"],
+            "pm": metadata["pm"],
+            "current_budget_period": metadata["current_budget_period"],
+            "current_project_period": metadata["current_project_period"],
+            "pi": metadata["pi"],
+            "supplement_budget_period": metadata["supplement_budget_period"],
+            "public_abstract": metadata["public_abstract"]
+        }
+        formatted_results.append(formatted_result)
+    
+    return formatted_results
 
 
 def semantic_search_qdrant(
     query: str,
     qdrant_client,
     top_k: int = 10,
-    filter_agency: Optional[str] = None
+    filter_agency: Optional[str] = None,
+    query_embedding: Optional[List[float]] = None,
+    accuracy: str = "fast"
 ) -> List[Dict[str, Any]]:
     """
     Perform semantic search using Qdrant
@@ -167,16 +422,18 @@ def semantic_search_qdrant(
         qdrant_client: QdrantClient instance
         top_k: Number of results to return
         filter_agency: Optional agency filter
+        query_embedding: Precomputed query embedding (skips re-encoding the query)
+        accuracy: "fast" or "accurate" (HNSW ef tier)
     
     Returns:
         List of dictionaries with award_id and semantic_score
     """
     try:
-        from qdrant_client.http.models import Filter, FieldCondition, MatchValue
+        from qdrant_client.http.models import Filter, FieldCondition, MatchValue, SearchParams
         
-        # Generate query embedding
-        embedding_service = get_embedding_service()
-        query_embedding = embedding_service.embed_text(query)
+        # Generate query embedding (unless the caller already has one)
+        if query_embedding is None:
+            query_embedding = embed_query(query)
         
         # Build filter if agency specified
         search_filter = None
@@ -190,46 +447,45 @@ def semantic_search_qdrant(
                 ]
             )
         
-        # Search in Qdrant
+        # HNSW ef for this accuracy tier (None keeps the collection default)
+        hnsw_ef = settings.QDRANT_HNSW_EF_ACCURATE if accuracy == "accurate" else settings.QDRANT_HNSW_EF
+        search_params = SearchParams(hnsw_ef=hnsw_ef, exact=False) if hnsw_ef > 0 else None
+        
+        # Search in Qdrant, grouped server-side to the best chunk per award
+        # (plain chunk search returns fewer than top_k awards when hits share an award)
         collection_name = "sbir_awards"
-        search_results = qdrant_client.search(
+        search_groups = qdrant_client.search_groups(
             collection_name=collection_name,
             query_vector=query_embedding,
+            group_by="award_id",
             limit=top_k,
-            query_filter=search_filter
+            group_size=1,
+            query_filter=search_filter,
+            search_params=search_params
         )
         
-        # Format results
-        results = []
-        for hit in search_results:
-            # Get best score per award_id (deduplicate chunks)
-            award_id = hit.payload.get("award_id", "")
+        # Format results (groups arrive best-first, one hit each)
+        formatted_results = []
+        for group in search_groups.groups:
+            hit = group.hits[0]
+            chunk_text = hit.payload.get("chunk_text", "")
+            snippet = chunk_text if len(chunk_text) <= _SNIPPET_CHARS else f"{chunk_text[:_SNIPPET_CHARS]}..."
             
-            results.append({
-                "award_id": award_id,
+            formatted_results.append({
+                "award_id": hit.payload.get("award_id", ""),
                 "semantic_score": hit.score,
                 "chunk_index": hit.payload.get("chunk_index", 0),
-                "chunk_text": hit.payload.get("chunk_text", ""),
+                "chunk_text": chunk_text,
                 "agency": hit.payload.get("agency", ""),
-                "snippet": hit.payload.get("chunk_text", "")[:200] + "..."
+                "snippet": snippet
             })
         
-        # Deduplicate by award_id (keep highest score)
-        award_scores = {}
-        for result in results:
-            award_id = result["award_id"]
-            if award_id not in award_scores or result["semantic_score"] > award_scores[award_id]["semantic_score"]:
-                award_scores[award_id] = result
-        
-        formatted_results = list(award_scores.values())
-        formatted_results.sort(key=lambda x: x["semantic_score"], reverse=True)
-        
         logger.debug(
             f"Semantic search (Qdrant) found {len(formatted_results)} results",
             extra={"query": query, "top_k": top_k}
         )
         
-        return formatted_results[:top_k]
+        return formatted_results
         
     except Exception as e:
         logger.error(f"Semantic search (Qdrant) failed: {e}", extra={"query": query})
@@ -240,7 +496,9 @@ def semantic_search(
     query: str,
     vector_store_client,
     top_k: int = 10,
-    filter_agency: Optional[str] = None
+    filter_agency: Optional[str] = None,
+    query_embedding: Optional[List[float]] = None,
+    accuracy: str = "fast"
 ) -> List[Dict[str, Any]]:
     """
     Perform semantic search (auto-detects vector store type)
@@ -250,14 +508,117 @@ def semantic_search(
         vector_store_client: pgvector manager or Qdrant client
         top_k: Number of results to return
         filter_agency: Optional agency filter
+        query_embedding: Precomputed query embedding (skips re-encoding the query)
+        accuracy: "fast" for interactive queries, "accurate" for evaluation
+            (larger HNSW candidate list: higher recall, slower)
     
     Returns:
         List of dictionaries with award_id and semantic_score
+    
+    Note:
+        Results are cached by query embedding; a query whose embedding is
+        within settings.SEMANTIC_CACHE_TAU cosine similarity of a cached one
+        (same top_k, agency filter, vector store and accuracy) reuses its results.
     """
+    cache_tag = (top_k, filter_agency, settings.VECTOR_STORE, accuracy)
+    if settings.SEMANTIC_CACHE_MAX_SIZE > 0:
+        if query_embedding is None:
+            try:
+                query_embedding = embed_query(query)
+            except Exception as e:
+                logger.warning(f"Could not embed query for vector search cache: {e}")
+        if query_embedding is not None:
+            cached_results = _semantic_search_cache.lookup(query_embedding, tag=cache_tag)
+            if cached_results is not None:
+                return list(cached_results)
+    
     if settings.VECTOR_STORE == "pgvector":
-        return semantic_search_pgvector(query, vector_store_client, top_k, filter_agency)
+        results = semantic_search_pgvector(query, vector_store_client, top_k, filter_agency, query_embedding, accuracy)
     elif settings.VECTOR_STORE == "qdrant":
-        return semantic_search_qdrant(query, vector_store_client, top_k, filter_agency)
+        results = semantic_search_qdrant(query, vector_store_client, top_k, filter_agency, query_embedding, accuracy)
     else:
         logger.error(f"Unknown vector store: {settings.VECTOR_STORE}")
         return []
+    
+    if results and query_embedding is not None:
+        _semantic_search_cache.put(query_embedding, results, tag=cache_tag)
+    
+    return results
+
+
+def semantic_search_batch(
+    queries: List[str],
+    vector_store_client,
+    top_k: int = 10,
+    filter_agency: Optional[str] = None,
+    query_embeddings: Optional[List[Optional[List[float]]]] = None,
+    accuracy: str = "fast"
+) -> List[List[Dict[str, Any]]]:
+    """
+    Perform semantic search for several queries at once
+    
+    With pgvector, all queries that miss the vector search cache share one
+    batched SQL round-trip. Qdrant has no batched grouped search, so its
+    queries run one after another.
+    
+    Args:
+        queries: Search query strings
+        vector_store_client: pgvector manager or Qdrant client
+        top_k: Number of results to return per query
+        filter_agency: Optional agency filter
+        query_embeddings: Precomputed query embeddings (None entries are embedded here)
+        accuracy: "fast" or "accurate" (see semantic_search)
+    
+    Returns:
+        One semantic_search result list per query, in input order
+    """
+    if query_embeddings is None:
+        query_embeddings = [None] * len(queries)
+    
+    if len(queries) <= 1 or settings.VECTOR_STORE != "pgvector":
+        return [
+            semantic_search(query, vector_store_client, top_k, filter_agency, query_embedding, accuracy)
+            for query, query_embedding in zip(queries, query_embeddings)
+        ]
+    
+    batch_results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+    missing = [i for i, query_embedding in enumerate(query_embeddings) if query_embedding is None]
+    if missing:
+        query_embeddings = list(query_embeddings)
+        try:
+            for i, query_embedding in zip(missing, embed_queries([queries[i] for i in missing])):
+                query_embeddings[i] = query_embedding
+        except Exception as e:
+            logger.error(f"Semantic search (pgvector) failed: {e}", extra={"queries": len(missing)})
+    
+    cache_tag = (top_k, filter_agency, settings.VECTOR_STORE, accuracy)
+    pending = []
+    for i, query_embedding in enumerate(query_embeddings):
+        if query_embedding is None:
+            continue
+        cached_results = _semantic_search_cache.lookup(query_embedding, tag=cache_tag)
+        if cached_results is not None:
+            batch_results[i] = list(cached_results)
+        else:
+            pending.append((i, query_embedding))
+    
+    if not pending:
+        return batch_results
+    
+    try:
+        hits = _search_pgvector_hits(vector_store_client, [e for _, e in pending], top_k, filter_agency, accuracy)
+    except Exception as e:
+        logger.error(f"Batched semantic search (pgvector) failed: {e}", extra={"queries": len(pending)})
+        return batch_results
+    
+    for (i, query_embedding), results in zip(pending, hits):
+        batch_results[i] = _format_pgvector_results(results)
+        if batch_results[i]:
+            _semantic_search_cache.put(query_embedding, batch_results[i], tag=cache_tag)
+    
+    logger.debug(
+        f"Batched semantic search (pgvector) ran {len(pending)} of {len(queries)} queries",
+        extra={"top_k": top_k}
+    )
+    
+    return batch_results
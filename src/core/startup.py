@@ -5,22 +5,27 @@ Handles lazy loading, connection pooling, and startup/shutdown optimizations for
 This module improves container startup time and resource efficiency.
 """
 import asyncio
+import threading
 from typing import Optional
 from contextlib import asynccontextmanager
-from functools import lru_cache
 
 from src.core.logging import get_logger
 from src.core.config import settings
 
 logger = get_logger(__name__)
 
-# Global instances (lazy loaded)
+# Global instances (lazy loaded; each lock guards only the first load,
+# afterwards the getters return the global without locking)
 _embedding_service = None
 _supabase_client = None
 _pgvector_manager = None
+_qdrant_client = None
+_embedding_lock = threading.Lock()
+_supabase_lock = threading.Lock()
+_pgvector_lock = threading.Lock()
+_qdrant_lock = threading.Lock()
 
 
-@lru_cache(maxsize=1)
 def get_embedding_service_lazy():
     """
     Lazy load embedding service (only when first search is made)
@@ -33,22 +38,25 @@ def get_embedding_service_lazy():
     """
     global _embedding_service
     
-    if _embedding_service is None:
-        logger.info("Lazy loading embedding service...")
-        
-        if settings.EMBEDDING_PROVIDER == "openai":
-            from src.indexing.embeddings import get_embedding_service
-            _embedding_service = get_embedding_service()
-            logger.info("OpenAI embedding service loaded")
-        else:
-            from src.indexing.embeddings_sentence_transformers import get_sentence_transformers_service
-            _embedding_service = get_sentence_transformers_service()
-            logger.info("Sentence Transformers embedding service loaded")
+    if _embedding_service is not None:
+        return _embedding_service
+    
+    with _embedding_lock:
+        if _embedding_service is None:
+            logger.info("Lazy loading embedding service...")
+            
+            if settings.EMBEDDING_PROVIDER == "openai":
+                from src.indexing.embeddings import get_embedding_service
+                _embedding_service = get_embedding_service()
+                logger.info("OpenAI embedding service loaded")
+            else:
+                from src.indexing.embeddings_sentence_transformers import get_sentence_transformers_service
+                _embedding_service = get_sentence_transformers_service()
+                logger.info("Sentence Transformers embedding service loaded")
     
     return _embedding_service
 
 
-@lru_cache(maxsize=1)
 def get_supabase_client_lazy():
     """
     Lazy load Supabase client with connection pooling
@@ -58,16 +66,19 @@ def get_supabase_client_lazy():
     """
     global _supabase_client
     
-    if _supabase_client is None:
-        logger.info("Lazy loading Supabase client...")
-        from src.database.supabase import get_supabase_client
-        _supabase_client = get_supabase_client()
-        logger.info("Supabase client loaded")
+    if _supabase_client is not None:
+        return _supabase_client
+    
+    with _supabase_lock:
+        if _supabase_client is None:
+            logger.info("Lazy loading Supabase client...")
+            from src.database.supabase import get_supabase_client
+            _supabase_client = get_supabase_client()
+            logger.info("Supabase client loaded")
     
     return _supabase_client
 
 
-@lru_cache(maxsize=1)
 def get_pgvector_manager_lazy():
     """
     Lazy load PgVector manager with connection pooling
@@ -77,15 +88,81 @@ def get_pgvector_manager_lazy():
     """
     global _pgvector_manager
     
-    if _pgvector_manager is None:
-        logger.info("Lazy loading PgVector manager...")
-        from src.database.pgvector import get_pgvector_manager
-        _pgvector_manager = get_pgvector_manager()
-        logger.info("PgVector manager loaded")
+    if _pgvector_manager is not None:
+        return _pgvector_manager
+    
+    with _pgvector_lock:
+        if _pgvector_manager is None:
+            logger.info("Lazy loading PgVector manager...")
+            from src.database.pgvector import get_pgvector_manager
+            _pgvector_manager = get_pgvector_manager()
+            logger.info("PgVector manager loaded")
+        
+            # Without an ANN index every search is a sequential scan + sort
+            try:
+                index_method = _pgvector_manager.get_vector_index_method()
+                if index_method is None:
+                    logger.error(
+                        f"No HNSW/IVFFlat index on {settings.AWARD_CHUNKS_TABLE_NAME}.embedding - "
+                        "semantic searches will use a sequential scan"
+                    )
+                else:
+                    logger.info(f"Vector index found on {settings.AWARD_CHUNKS_TABLE_NAME}: {index_method}")
+            except Exception as e:
+                logger.warning(f"Could not verify vector index: {e}")
     
     return _pgvector_manager
 
 
+def get_qdrant_client_lazy():
+    """
+    Lazy load a shared Qdrant client (gRPC with keepalive unless disabled)
+    
+    One client per process keeps its connection open across searches,
+    instead of paying TCP/TLS setup on every request.
+    
+    Returns:
+        QdrantClient instance, or None if qdrant-client is not installed
+    """
+    global _qdrant_client
+    
+    if _qdrant_client is not None:
+        return _qdrant_client
+    
+    with _qdrant_lock:
+        if _qdrant_client is None:
+            try:
+                from qdrant_client import QdrantClient
+            except ImportError:
+                logger.warning("Qdrant client not available. Install with: pip install qdrant-client")
+                return None
+            
+            logger.info("Lazy loading Qdrant client...")
+            _qdrant_client = QdrantClient(
+                url=settings.QDRANT_URL,
+                api_key=settings.QDRANT_API_KEY if settings.QDRANT_API_KEY else None,
+                prefer_grpc=settings.QDRANT_PREFER_GRPC,
+                grpc_port=settings.QDRANT_GRPC_PORT,
+                grpc_options={"grpc.keepalive_time_ms": 10000}
+            )
+            logger.info(f"Qdrant client loaded (grpc: {settings.QDRANT_PREFER_GRPC})")
+    
+    return _qdrant_client
+
+
+def _warmup_embedding_service():
+    """
+    Load the embedding service (blocking)
+    
+    Local models also embed a dummy text; OpenAI is only constructed, since an
+    inference pass there would be a billed API call on every start.
+    """
+    embedding_service = get_embedding_service_lazy()
+    if settings.EMBEDDING_PROVIDER != "openai":
+        embedding_service.embed_text("warmup")
+    logger.info("Embedding service warmed up")
+
+
 async def warmup_services():
     """
     Warm up critical services in the background
@@ -96,18 +173,31 @@ async def warmup_services():
     try:
         logger.info("Starting service warmup...")
         
+        loop = asyncio.get_running_loop()
+        
         # Warm up in order of importance
         # 1. Database connections (fast)
         if settings.SUPABASE_URL:
-            get_supabase_client_lazy()
+            supabase_client = get_supabase_client_lazy()
+            
+            # Award columns, so metadata fetches select exactly what exists
+            # (a blocking Supabase request, so off the event loop)
+            from src.core.search.semantic import load_awards_columns
+            await loop.run_in_executor(None, load_awards_columns, supabase_client.get_client())
         
         if settings.VECTOR_STORE == "pgvector" and settings.DATABASE_URL:
-            get_pgvector_manager_lazy()
+            # Opens the pool and checks the vector index (blocking queries, so off the event loop)
+            await loop.run_in_executor(None, get_pgvector_manager_lazy)
+        elif settings.VECTOR_STORE == "qdrant" and settings.QDRANT_URL:
+            get_qdrant_client_lazy()
         
-        # 2. Embedding service (slower, only if needed)
-        # Only warm up if we're using OpenAI (fast) or if explicitly configured
-        if settings.EMBEDDING_PROVIDER == "openai" or settings.__dict__.get("WARMUP_EMBEDDINGS", False):
-            get_embedding_service_lazy()
+        # 2. Embedding service (slower): load it off the event loop, plus one
+        # inference pass for local models, so the first search doesn't pay for
+        # model load and lazy tokenizer/BLAS/CUDA initialization
+        try:
+            await loop.run_in_executor(None, _warmup_embedding_service)
+        except Exception as e:
+            logger.warning(f"Embedding warmup failed (non-critical): {e}")
         
         logger.info("Service warmup completed")
         
@@ -121,7 +211,7 @@ def cleanup_services():
     
     This ensures graceful shutdown and proper connection cleanup.
     """
-    global _embedding_service, _supabase_client, _pgvector_manager
+    global _embedding_service, _supabase_client, _pgvector_manager, _qdrant_client
     
     logger.info("Cleaning up services...")
     
@@ -133,11 +223,23 @@ def cleanup_services():
                 logger.info("PgVector manager closed")
             except Exception as e:
                 logger.warning(f"Error closing PgVector manager: {e}")
+            finally:
+                # Drop the closed manager from the module-level singleton as well
+                from src.database.pgvector import get_pgvector_manager
+                get_pgvector_manager.cache_clear()
         
-        # Reset globals
+        if _qdrant_client is not None:
+            try:
+                _qdrant_client.close()
+                logger.info("Qdrant client closed")
+            except Exception as e:
+                logger.warning(f"Error closing Qdrant client: {e}")
+        
+        # Reset globals (the next getter call loads fresh instances)
         _embedding_service = None
         _supabase_client = None
         _pgvector_manager = None
+        _qdrant_client = None
         
         logger.info("Service cleanup completed")
         
@@ -145,6 +247,29 @@ def cleanup_services():
         logger.error(f"Error during cleanup: {e}")
 
 
+async def close_embedding_service():
+    """
+    Close the OpenAI embedding service's pooled HTTP connections on shutdown
+    
+    The async HTTP client can only be closed from the event loop, so this runs
+    in the lifespan shutdown before cleanup_services() drops the service.
+    """
+    service = _embedding_service
+    if service is None or not hasattr(service, "aclose"):
+        return
+    
+    try:
+        await service.aclose()
+        logger.info("Embedding service HTTP client closed")
+    except Exception as e:
+        logger.warning(f"Error closing embedding service: {e}")
+    finally:
+        # Drop the closed service from the module-level singleton as well
+        from src.indexing import embeddings
+        if embeddings._embedding_service is service:
+            embeddings._embedding_service = None
+
+
 @asynccontextmanager
 async def lifespan_manager(app):
     """
@@ -175,6 +300,7 @@ async def lifespan_manager(app):
     
     # Shutdown
     logger.info("Application shutting down...")
+    await close_embedding_service()
     cleanup_services()
 
 
@@ -262,8 +388,8 @@ def get_connection_pool_config() -> dict:
         dict with connection pool settings
     """
     return {
-        "min_connections": 1,
-        "max_connections": 10,  # Cloud Run can handle ~10 concurrent connections per instance
+        "min_connections": settings.PGVECTOR_POOL_MIN_SIZE,
+        "max_connections": settings.PGVECTOR_POOL_MAX_SIZE,  # Cloud Run can handle ~10 concurrent connections per instance
         "connection_timeout": 30,
         "idle_timeout": 600,  # 10 minutes
     }
@@ -2,19 +2,23 @@
 pgvector Operations
 PostgreSQL pgvector extension operations for vector storage and search
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from functools import lru_cache
+import hashlib
+import io
+import struct
 import threading
 
 try:
     import psycopg2
     from psycopg2.extras import execute_values
-    from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+    from psycopg2.extensions import connection as _PgConnection
     from psycopg2.pool import ThreadedConnectionPool
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
     psycopg2 = None  # type: ignore
+    _PgConnection = object  # type: ignore
     ThreadedConnectionPool = None  # type: ignore
 
 try:
@@ -26,26 +30,186 @@ except ImportError:
 
 from src.core.config import settings
 from src.core.logging import get_logger
+from src.core.search.query_cache import QueryCache
 from src.database.supabase import get_supabase_client
 
 logger = get_logger(__name__)
 
+# Batches at least this large are loaded with COPY through a staging table
+# (smaller ones use execute_values, where COPY's setup outweighs its gain)
+_COPY_MIN_ROWS = 256
+
+# SQLSTATEs meaning the server session doesn't keep prepared statements
+# (a transaction-mode pooler hands each transaction a different backend):
+# invalid_sql_statement_name, duplicate_prepared_statement
+_PREPARED_UNSUPPORTED_PGCODES = frozenset({"26000", "42P05"})
+
+# SQLSTATE duplicate_prepared_statement: the statement is already on the server
+# (a PREPARE whose EXECUTE failed isn't undone by the rollback)
+_DUPLICATE_PREPARED_PGCODE = "42P05"
+
+# Columns written by insert_vectors, in value-tuple order
+_INSERT_COLUMNS = "award_id, chunk_index, chunk_text, embedding, field_name, text_hash"
+
+# Batches larger than this drop rows whose text_hash is already stored with
+# one indexed ANY() probe, instead of N failed inserts under ON CONFLICT
+_PREFILTER_MIN_ROWS = 2000
+
+# COPY text format escapes for values containing separators or backslashes
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# COPY binary format: signature, flags, header extension length / per-row field count / trailer
+_COPY_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_COPY_BINARY_ROW = struct.pack("!h", 6)
+_COPY_BINARY_TRAILER = struct.pack("!h", -1)
+_COPY_BINARY_NULL = struct.pack("!i", -1)
+
+
+# Per-thread float16 scratch buffers (search paths reuse one instead of
+# allocating a converted copy of every query vector)
+_scratch = threading.local()
+
+
+def _as_float32(vector: Any) -> "np.ndarray":
+    """View an embedding as a flat float32 array (no copy for float32 arrays or raw float32 bytes)"""
+    if isinstance(vector, (bytes, bytearray, memoryview)):
+        return np.frombuffer(vector, dtype=np.float32)
+    return np.asarray(vector, dtype=np.float32).ravel()
+
+
+def _as_float16_scratch(components: "np.ndarray") -> "np.ndarray":
+    """Round float32 components into this thread's float16 scratch buffer (valid until the next call)"""
+    buffer = getattr(_scratch, "half", None)
+    if buffer is None or buffer.size != components.size:
+        buffer = _scratch.half = np.empty(components.size, dtype=np.float16)
+    np.copyto(buffer, components, casting="same_kind")
+    return buffer
+
+
+@lru_cache(maxsize=8)
+def _vector_format(dimension: int, digits: int = 9) -> str:
+    """printf template for a pgvector literal (9 significant digits round-trip float32, 5 float16)"""
+    return "[" + ",".join([f"%.{digits}g"] * dimension) + "]"
+
+
+def _vector_literal(vector: Sequence[float], half: bool = False) -> str:
+    """
+    Format an embedding as a pgvector text literal
+    
+    One %-format call renders every component in C, instead of creating a
+    Python string per float and joining them.
+    
+    Args:
+        vector: Embedding (list, numpy array or raw float32 bytes)
+        half: The server stores/compares it as halfvec, so 5 significant
+            digits are lossless (about 40% less text than float32's 9)
+    
+    Returns:
+        Literal such as "[0.1,0.2,0.3]"
+    """
+    if NUMPY_AVAILABLE:
+        components = _as_float32(vector)
+        values = (_as_float16_scratch(components) if half else components).tolist()
+    elif isinstance(vector, (bytes, bytearray, memoryview)):
+        values = memoryview(vector).cast("B").cast("f").tolist()
+    else:
+        values = [float(x) for x in vector]
+    return _vector_format(len(values), 5 if half else 9) % tuple(values)
+
+
+def _copy_binary_text(value: Any) -> bytes:
+    """Encode one text column as a COPY binary field (length + UTF-8 payload)"""
+    if value is None:
+        return _COPY_BINARY_NULL
+    payload = str(value).encode("utf-8")
+    return struct.pack("!i", len(payload)) + payload
+
+
+def _copy_binary_vectors(vectors: Sequence[Sequence[float]], column_type: str) -> List[bytes]:
+    """
+    Encode embeddings as COPY binary fields in pgvector's wire format
+    
+    vector/halfvec recv format: int16 dimension, int16 unused, then big-endian
+    float32 (vector) or float16 (halfvec) components. The whole batch is
+    converted in one numpy call and shares one length/dimension prefix.
+    
+    Args:
+        vectors: Embeddings (lists or numpy arrays)
+        column_type: "vector" or "halfvec"
+    
+    Returns:
+        Field bytes (length prefix + payload) per embedding
+    """
+    dtype = np.dtype(">f2" if column_type == "halfvec" else ">f4")
+    try:
+        matrix = np.asarray(vectors, dtype=dtype)
+    except ValueError:
+        matrix = None  # mixed dimensions
+    
+    if matrix is None or matrix.ndim != 2:
+        fields = []
+        for vector in vectors:
+            components = np.asarray(vector, dtype=dtype).ravel()
+            fields.append(
+                struct.pack("!ihh", 4 + components.nbytes, components.size, 0) + components.tobytes()
+            )
+        return fields
+    
+    dimension = matrix.shape[1]
+    row_bytes = dimension * dtype.itemsize
+    prefix = struct.pack("!ihh", 4 + row_bytes, dimension, 0)
+    data = matrix.tobytes()
+    return [prefix + data[start:start + row_bytes] for start in range(0, len(data), row_bytes)]
+
+
+class _VectorConnection(_PgConnection):
+    """
+    psycopg2 connection carrying per-connection search state
+    
+    Passed as connection_factory, so the state is set up once when the pool
+    opens the physical connection instead of being looked up per checkout.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Names of search statements PREPAREd on this connection
+        self.prepared_statements: set = set()
+
 
 class PgVectorManager:
     """Manager for pgvector operations in PostgreSQL"""
     
-    def __init__(self, database_url: Optional[str] = None, pool_size: int = 5):
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        min_pool_size: Optional[int] = None
+    ):
         """
         Initialize pgvector manager with connection pooling
         
         Args:
             database_url: PostgreSQL connection URL (defaults to settings.DATABASE_URL)
-            pool_size: Number of connections in pool (default: 5)
+            pool_size: Maximum connections in pool (defaults to settings.PGVECTOR_POOL_MAX_SIZE)
+            min_pool_size: Connections opened up front (defaults to settings.PGVECTOR_POOL_MIN_SIZE)
         """
         self.database_url = database_url or settings.DATABASE_URL
-        self.pool_size = pool_size
+        self.pool_size = pool_size or settings.PGVECTOR_POOL_MAX_SIZE
+        self.min_pool_size = min(min_pool_size or settings.PGVECTOR_POOL_MIN_SIZE, self.pool_size)
         self._connection_pool: Optional[Any] = None
         self._lock = threading.Lock()
+        self._prepare_searches = settings.PGVECTOR_PREPARED_SEARCH
+        # Set once the vector extension is known to exist (it is never dropped at runtime)
+        self._extension_verified = False
+        # Search results by fp16-quantized query vector and search parameters
+        # (cleared when this manager inserts rows)
+        self._search_cache: Optional[QueryCache] = None
+        if settings.PGVECTOR_SEARCH_CACHE_MAX_SIZE > 0 and NUMPY_AVAILABLE:
+            self._search_cache = QueryCache(
+                max_size=settings.PGVECTOR_SEARCH_CACHE_MAX_SIZE,
+                ttl_seconds=settings.QUERY_CACHE_TTL,
+                name="pgvector search"
+            )
         
         if not self.database_url:
             logger.warning(
@@ -62,11 +226,12 @@ class PgVectorManager:
         
         try:
             self._connection_pool = ThreadedConnectionPool(
-                minconn=1,
+                minconn=self.min_pool_size,
                 maxconn=self.pool_size,
-                dsn=self.database_url
+                dsn=self.database_url,
+                connection_factory=_VectorConnection
             )
-            logger.info(f"Connection pool initialized (size: {self.pool_size})")
+            logger.info(f"Connection pool initialized (size: {self.min_pool_size}-{self.pool_size})")
         except Exception as e:
             logger.warning(f"Failed to create connection pool: {e}. Using single connections.")
             self._connection_pool = None
@@ -78,9 +243,9 @@ class PgVectorManager:
                 return self._connection_pool.getconn()
             except Exception as e:
                 logger.warning(f"Failed to get connection from pool: {e}")
-                return psycopg2.connect(self.database_url)
+                return psycopg2.connect(self.database_url, connection_factory=_VectorConnection)
         else:
-            return psycopg2.connect(self.database_url)
+            return psycopg2.connect(self.database_url, connection_factory=_VectorConnection)
     
     def _put_connection(self, conn):
         """Return connection to pool"""
@@ -99,6 +264,14 @@ class PgVectorManager:
             except:
                 pass
     
+    def close(self) -> None:
+        """Close all pooled connections (on shutdown; later calls open single connections)"""
+        with self._lock:
+            pool, self._connection_pool = self._connection_pool, None
+        if pool is not None:
+            pool.closeall()
+            logger.info("Connection pool closed")
+    
     def enable_extension(self) -> bool:
         """
         Enable pgvector extension in PostgreSQL
@@ -119,25 +292,24 @@ class PgVectorManager:
         if not self.database_url:
             raise ValueError("DATABASE_URL is required for pgvector operations")
         
+        conn = None
         try:
             logger.info("Enabling pgvector extension")
             
-            # Connect to database
-            conn = psycopg2.connect(self.database_url)
-            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            # Pooled connection in autocommit mode (restored before it goes back)
+            conn = self._get_connection()
+            conn.autocommit = True
             cursor = conn.cursor()
             
-            # Enable extension
-            cursor.execute("CREATE EXTENSION IF NOT EXISTS vector;")
-            
-            # Verify extension
+            # Enable and verify extension in one round-trip
             cursor.execute(
+                "CREATE EXTENSION IF NOT EXISTS vector;"
                 "SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'vector');"
             )
             enabled = cursor.fetchone()[0]
             
             cursor.close()
-            conn.close()
+            self._extension_verified = bool(enabled)
             
             if enabled:
                 logger.info("pgvector extension enabled successfully")
@@ -149,6 +321,10 @@ class PgVectorManager:
         except Exception as e:
             logger.error("Failed to enable pgvector extension", extra={"error": str(e)})
             raise
+        finally:
+            if conn:
+                conn.autocommit = False
+                self._put_connection(conn)
     
     def check_extension(self) -> bool:
         """
@@ -160,8 +336,12 @@ class PgVectorManager:
         if not PSYCOPG2_AVAILABLE or not self.database_url:
             return False
         
+        if self._extension_verified:
+            return True
+        
+        conn = None
         try:
-            conn = psycopg2.connect(self.database_url)
+            conn = self._get_connection()
             cursor = conn.cursor()
             
             cursor.execute(
@@ -170,17 +350,63 @@ class PgVectorManager:
             enabled = cursor.fetchone()[0]
             
             cursor.close()
-            conn.close()
+            conn.rollback()  # end the read-only transaction before pooling
             
+            self._extension_verified = bool(enabled)
             return enabled
         except Exception as e:
             logger.warning("Failed to check pgvector extension", extra={"error": str(e)})
             return False
+        finally:
+            if conn:
+                self._put_connection(conn)
+    
+    def get_vector_index_method(self, table_name: Optional[str] = None) -> Optional[str]:
+        """
+        Find the ANN index method on a vector table's embedding column
+        
+        Args:
+            table_name: Name of the vector table (defaults to settings.AWARD_CHUNKS_TABLE_NAME)
+        
+        Returns:
+            "hnsw" or "ivfflat", or None if the table has no vector index
+        """
+        if not PSYCOPG2_AVAILABLE or not self.database_url:
+            raise RuntimeError("Database connection not available")
+        
+        # Use configured table name if not provided
+        if table_name is None:
+            table_name = settings.AWARD_CHUNKS_TABLE_NAME
+        
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT indexdef FROM pg_indexes
+                WHERE tablename = %s
+                  AND (indexdef ILIKE '%%USING hnsw%%' OR indexdef ILIKE '%%USING ivfflat%%');
+                """,
+                (table_name,)
+            )
+            index_defs = [row[0].lower() for row in cursor.fetchall()]
+            cursor.close()
+        finally:
+            if conn:
+                self._put_connection(conn)
+        
+        if any("using hnsw" in d for d in index_defs):
+            return "hnsw"
+        if index_defs:
+            return "ivfflat"
+        return None
     
     def create_vector_table(
         self,
         table_name: Optional[str] = None,
-        dimension: int = 768
+        dimension: int = 768,
+        defer_index: bool = False
     ) -> bool:
         """
         Create a table with vector column for storing embeddings
@@ -188,6 +414,8 @@ class PgVectorManager:
         Args:
             table_name: Name of the table to create (defaults to settings.AWARD_CHUNKS_TABLE_NAME)
             dimension: Dimension of the vector (default: 768 for Sentence Transformers)
+            defer_index: Skip the HNSW index, for bulk loads; call build_index()
+                once the data is in (see build_index for the calling order)
         
         Returns:
             bool: True if table created successfully
@@ -199,21 +427,23 @@ class PgVectorManager:
         if table_name is None:
             table_name = settings.AWARD_CHUNKS_TABLE_NAME
         
+        conn = None
         try:
             logger.info(f"Creating vector table: {table_name}", extra={"dimension": dimension})
             
-            conn = psycopg2.connect(self.database_url)
-            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            conn = self._get_connection()
+            conn.autocommit = True
             cursor = conn.cursor()
             
-            # Create table with vector column
+            # Create table with vector column (halfvec stores float16: half the bytes per scan)
+            column_type = "halfvec" if settings.PGVECTOR_COLUMN_TYPE == "halfvec" else "vector"
             create_table_sql = f"""
             CREATE TABLE IF NOT EXISTS {table_name} (
                 chunk_id SERIAL PRIMARY KEY,
                 award_id VARCHAR(255) NOT NULL,
                 chunk_index INTEGER NOT NULL,
                 chunk_text TEXT NOT NULL,
-                embedding vector({dimension}),
+                embedding {column_type}({dimension}),
                 field_name VARCHAR(100),
                 text_hash VARCHAR(64),
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -234,35 +464,110 @@ class PgVectorManager:
                 ON {table_name}(text_hash);
             """)
             
-            # Create vector similarity index
-            # Note: Both HNSW and IVFFlat have a 2000 dimension limit
-            # For 3072 dimensions, we skip the index (searches will be slower)
-            # Options: Use 256-dim embeddings or Qdrant for better performance
-            if dimension <= 2000:
-                # Use HNSW for dimensions <= 2000 (faster)
-                logger.info(f"Creating HNSW index for {dimension} dimensions")
-                cursor.execute(f"""
-                    CREATE INDEX IF NOT EXISTS idx_{table_name}_embedding 
-                    ON {table_name} 
-                    USING hnsw (embedding vector_cosine_ops);
-                """)
-            else:
-                # Skip index for dimensions > 2000 (3072 not supported)
-                logger.warning(
-                    f"Skipping vector index for {dimension} dimensions "
-                    "(HNSW/IVFFlat limit is 2000). "
-                    "Consider using 256-dim embeddings or Qdrant for better performance."
-                )
-            
             cursor.close()
-            conn.close()
+            conn.autocommit = False
+            self._put_connection(conn)
+            conn = None
             
             logger.info(f"Vector table '{table_name}' created successfully")
+            
+            if defer_index:
+                logger.info(f"Deferring vector index on {table_name} until build_index()")
+            else:
+                self.build_index(table_name, dimension)
             return True
             
         except Exception as e:
             logger.error(f"Failed to create vector table: {table_name}", extra={"error": str(e)})
             raise
+        finally:
+            if conn:
+                conn.autocommit = False
+                self._put_connection(conn)
+    
+    def build_index(
+        self,
+        table_name: Optional[str] = None,
+        dimension: Optional[int] = None,
+        m: int = 16,
+        ef_construction: int = 64,
+        maintenance_work_mem: str = "2GB",
+        max_parallel_workers: int = 7
+    ) -> bool:
+        """
+        Create the HNSW index on a vector table's embedding column
+        
+        Building the graph once over loaded data is far faster than maintaining
+        it row by row during inserts. For bulk ingestion, call in this order:
+        enable_extension() -> create_vector_table(defer_index=True) ->
+        insert_vectors(...) -> build_index().
+        
+        Args:
+            table_name: Name of the vector table (defaults to settings.AWARD_CHUNKS_TABLE_NAME)
+            dimension: Dimension of the vector (defaults to settings.EMBEDDING_DIMENSION)
+            m: HNSW max connections per layer
+            ef_construction: HNSW candidate list size while building
+            maintenance_work_mem: Build memory; the build is much slower once the
+                graph no longer fits
+            max_parallel_workers: Parallel maintenance workers for the build
+        
+        Returns:
+            bool: True if the index exists, False if the dimension is over the HNSW limit
+        """
+        if not PSYCOPG2_AVAILABLE or not self.database_url:
+            raise RuntimeError("Database connection not available")
+        
+        if table_name is None:
+            table_name = settings.AWARD_CHUNKS_TABLE_NAME
+        if dimension is None:
+            dimension = settings.EMBEDDING_DIMENSION
+        
+        # Note: Both HNSW and IVFFlat have a 2000 dimension limit for vector
+        # (4000 for halfvec); above that we skip the index (searches will be slower)
+        # Options: Use halfvec, 256-dim embeddings or Qdrant for better performance
+        column_type = "halfvec" if settings.PGVECTOR_COLUMN_TYPE == "halfvec" else "vector"
+        if dimension > (4000 if column_type == "halfvec" else 2000):
+            logger.warning(
+                f"Skipping vector index for {dimension} dimensions "
+                f"(HNSW/IVFFlat limit for {column_type} is {4000 if column_type == 'halfvec' else 2000}). "
+                "Consider PGVECTOR_COLUMN_TYPE=halfvec, 256-dim embeddings or Qdrant for better performance."
+            )
+            return False
+        
+        conn = None
+        try:
+            logger.info(
+                f"Creating HNSW {column_type} index on {table_name}",
+                extra={"dimension": dimension, "m": m, "ef_construction": ef_construction}
+            )
+            
+            # One transaction, so SET LOCAL doesn't leak into the pooled connection
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute("SET LOCAL maintenance_work_mem = %s;", (maintenance_work_mem,))
+            cursor.execute("SET LOCAL max_parallel_maintenance_workers = %s;", (int(max_parallel_workers),))
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{table_name}_embedding 
+                ON {table_name} 
+                USING hnsw (embedding {column_type}_cosine_ops)
+                WITH (m = {int(m)}, ef_construction = {int(ef_construction)});
+            """)
+            
+            conn.commit()
+            cursor.close()
+            
+            logger.info(f"Vector index on '{table_name}' created successfully")
+            return True
+            
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            logger.error(f"Failed to create vector index on {table_name}", extra={"error": str(e)})
+            raise
+        finally:
+            if conn:
+                self._put_connection(conn)
     
     def insert_vectors(
         self,
@@ -296,43 +601,17 @@ class PgVectorManager:
             conn = self._get_connection()
             cursor = conn.cursor()
             
-            # Optimize embedding string conversion using numpy if available
-            if NUMPY_AVAILABLE:
-                # Convert all embeddings to numpy arrays for faster processing
-                values = []
-                for vec in vectors:
-                    embedding = vec["embedding"]
-                    if isinstance(embedding, list):
-                        # Use numpy for faster string conversion
-                        embedding_array = np.array(embedding, dtype=np.float32)
-                        embedding_str = "[" + ",".join(embedding_array.astype(str)) + "]"
-                    else:
-                        embedding_str = "[" + ",".join(map(str, embedding)) + "]"
-                    
-                    values.append((
-                        vec["award_id"],
-                        vec["chunk_index"],
-                        vec["chunk_text"],
-                        embedding_str,
-                        vec.get("field_name"),
-                        vec.get("text_hash")
-                    ))
-            else:
-                # Fallback: optimized string conversion
-                values = []
-                for vec in vectors:
-                    embedding = vec["embedding"]
-                    # Use join with generator for memory efficiency
-                    embedding_str = "[" + ",".join(str(x) for x in embedding) + "]"
-                    
-                    values.append((
-                        vec["award_id"],
-                        vec["chunk_index"],
-                        vec["chunk_text"],
-                        embedding_str,
-                        vec.get("field_name"),
-                        vec.get("text_hash")
-                    ))
+            values = [
+                (
+                    vec["award_id"],
+                    vec["chunk_index"],
+                    vec["chunk_text"],
+                    vec["embedding"],
+                    vec.get("field_name"),
+                    vec.get("text_hash")
+                )
+                for vec in vectors
+            ]
             
             # Insert using execute_values for efficiency
             # Handle conflicts: text_hash is UNIQUE, so we need to handle duplicate text_hash
@@ -343,16 +622,18 @@ class PgVectorManager:
             # 4. Use ON CONFLICT DO NOTHING for text_hash to handle race conditions
             
             # Step 1: Deduplicate within the batch (keep first occurrence of each text_hash)
-            seen_in_batch = set()
-            deduplicated_values = []
-            for v in values:
-                text_hash = v[5]  # text_hash is at index 5
-                if text_hash and text_hash in seen_in_batch:
-                    # Skip duplicate within batch
-                    continue
-                if text_hash:
-                    seen_in_batch.add(text_hash)
-                deduplicated_values.append(v)
+            # set()/dict() construction runs in C; the common all-unique batch
+            # is detected without a per-row Python loop
+            hashes = [v[5] for v in values]  # text_hash is at index 5
+            if len(set(hashes)) == len(hashes):
+                deduplicated_values = values
+            else:
+                # Built in reverse, so each hash maps to its first index
+                first_index = dict(zip(reversed(hashes), range(len(hashes) - 1, -1, -1)))
+                deduplicated_values = [
+                    v for i, (v, text_hash) in enumerate(zip(values, hashes))
+                    if not text_hash or first_index[text_hash] == i
+                ]
             
             if len(deduplicated_values) < len(values):
                 logger.info(
@@ -360,14 +641,30 @@ class PgVectorManager:
                     extra={"original": len(values), "deduplicated": len(deduplicated_values)}
                 )
             
-            # Step 2: Skip database check - let ON CONFLICT handle it (MUCH FASTER!)
-            # The database check was a major bottleneck. ON CONFLICT DO NOTHING is fast enough.
-            # We already deduplicated within batch, so most conflicts are handled.
-            # PostgreSQL handles ON CONFLICT efficiently internally.
+            # Step 2: For large batches (backfills/resyncs, mostly duplicates), drop rows
+            # already in the table with one batched index probe. A conflicting row still
+            # costs a full insert attempt (vector write, index work, WAL) before
+            # ON CONFLICT discards it; small batches skip the extra round-trip.
             filtered_values = deduplicated_values
+            if len(deduplicated_values) > _PREFILTER_MIN_ROWS:
+                batch_hashes = [v[5] for v in deduplicated_values if v[5]]
+                cursor.execute(
+                    f"SELECT text_hash FROM {table_name} WHERE text_hash = ANY(%s)",
+                    (batch_hashes,)
+                )
+                existing = {row[0] for row in cursor.fetchall()}
+                if existing:
+                    filtered_values = [v for v in deduplicated_values if v[5] not in existing]
+                    logger.info(
+                        f"Skipped {len(deduplicated_values) - len(filtered_values)} chunks already stored",
+                        extra={"batch": len(deduplicated_values), "remaining": len(filtered_values)}
+                    )
+                if not filtered_values:
+                    conn.commit()
+                    cursor.close()
+                    return 0
             
-            # Step 3: Insert chunks - ON CONFLICT will handle duplicates efficiently
-            # This is much faster than querying database first (removes extra round-trip)
+            # Step 3: Insert chunks - ON CONFLICT handles remaining duplicates and races
             insert_sql = f"""
                 INSERT INTO {table_name} 
                 (award_id, chunk_index, chunk_text, embedding, field_name, text_hash)
@@ -376,12 +673,24 @@ class PgVectorManager:
                 DO NOTHING
             """
             
-            execute_values(cursor, insert_sql, filtered_values, page_size=1000)
-            rows_inserted = cursor.rowcount
+            half = settings.PGVECTOR_COLUMN_TYPE == "halfvec"
+            if len(filtered_values) >= _COPY_MIN_ROWS:
+                rows_inserted = self._copy_insert(cursor, table_name, filtered_values)
+            else:
+                execute_values(
+                    cursor,
+                    insert_sql,
+                    [(*v[:3], _vector_literal(v[3], half), *v[4:]) for v in filtered_values],
+                    page_size=1000
+                )
+                rows_inserted = cursor.rowcount
             
             conn.commit()
             cursor.close()
             
+            if self._search_cache is not None and rows_inserted:
+                self._search_cache.clear()
+            
             logger.info(f"Inserted {rows_inserted} vectors into {table_name}")
             return rows_inserted
             
@@ -394,92 +703,266 @@ class PgVectorManager:
             if conn:
                 self._put_connection(conn)
     
+    @staticmethod
+    def _copy_insert(cursor, table_name: str, values: Sequence[Tuple[Any, ...]]) -> int:
+        """
+        Bulk insert rows with COPY into a staging table, then INSERT ... SELECT
+        
+        COPY streams the whole batch in one round-trip without per-row parsing
+        and planning; the final INSERT keeps the ON CONFLICT (text_hash) DO NOTHING
+        dedup of the execute_values path. With numpy the batch is sent in COPY's
+        binary format, so embeddings travel as raw floats (4 bytes per dimension,
+        2 for halfvec) instead of decimal text that the server has to parse.
+        
+        Args:
+            cursor: Cursor inside the caller's transaction (the caller commits)
+            table_name: Target table
+            values: Row tuples in _INSERT_COLUMNS order (embedding as list or array)
+        
+        Returns:
+            int: Number of rows inserted into table_name
+        """
+        stage_table = f"_stage_{table_name.rsplit('.', 1)[-1]}"  # temp tables take no schema
+        cursor.execute(f"""
+            CREATE TEMP TABLE {stage_table} ON COMMIT DROP AS
+            SELECT {_INSERT_COLUMNS} FROM {table_name} WITH NO DATA
+        """)
+        
+        column_type = "halfvec" if settings.PGVECTOR_COLUMN_TYPE == "halfvec" else "vector"
+        if NUMPY_AVAILABLE:
+            vector_fields = _copy_binary_vectors([row[3] for row in values], column_type)
+            buffer = io.BytesIO()
+            buffer.write(_COPY_BINARY_HEADER)
+            for (award_id, chunk_index, chunk_text, _, field_name, text_hash), vector_field in zip(values, vector_fields):
+                buffer.write(_COPY_BINARY_ROW)
+                buffer.write(_copy_binary_text(award_id))
+                buffer.write(struct.pack("!ii", 4, int(chunk_index)))
+                buffer.write(_copy_binary_text(chunk_text))
+                buffer.write(vector_field)
+                buffer.write(_copy_binary_text(field_name))
+                buffer.write(_copy_binary_text(text_hash))
+            buffer.write(_COPY_BINARY_TRAILER)
+            copy_options = " WITH (FORMAT binary)"
+        else:
+            buffer = io.StringIO()
+            for row in values:
+                buffer.write("\t".join(
+                    "\\N" if value is None
+                    else _vector_literal(value, column_type == "halfvec") if i == 3
+                    else str(value).translate(_COPY_ESCAPES)
+                    for i, value in enumerate(row)
+                ))
+                buffer.write("\n")
+            copy_options = ""
+        buffer.seek(0)
+        
+        cursor.copy_expert(f"COPY {stage_table} ({_INSERT_COLUMNS}) FROM STDIN{copy_options}", buffer)
+        cursor.execute(f"""
+            INSERT INTO {table_name} ({_INSERT_COLUMNS})
+            SELECT {_INSERT_COLUMNS} FROM {stage_table}
+            ON CONFLICT (text_hash)
+            DO NOTHING
+        """)
+        return cursor.rowcount
+    
     def search_vectors(
         self,
         query_vector: List[float],
         top_k: int = 10,
         table_name: Optional[str] = None,
-        filter_agency: Optional[str] = None
+        filter_agency: Optional[str] = None,
+        award_columns: Optional[List[str]] = None,
+        ef_search: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for similar vectors using cosine similarity (optimized with connection pooling)
         
         Args:
-            query_vector: Query embedding vector
+            query_vector: Query embedding vector (list, float32 array or raw float32 bytes)
             top_k: Number of results to return
             table_name: Name of the table to search (defaults to settings.AWARD_CHUNKS_TABLE_NAME)
             filter_agency: Optional agency filter
+            award_columns: Award columns to join onto each hit in the same query
+                (returned under "award"; None if the award row is missing)
+            ef_search: HNSW candidate list size (defaults to settings.PGVECTOR_HNSW_EF_SEARCH)
         
         Returns:
             List of dictionaries with search results
         """
+        return self.search_vectors_batch(
+            [query_vector],
+            top_k=top_k,
+            table_name=table_name,
+            filter_agency=filter_agency,
+            award_columns=award_columns,
+            ef_search=ef_search
+        )[0]
+    
+    def search_vectors_batch(
+        self,
+        query_vectors: List[List[float]],
+        top_k: int = 10,
+        table_name: Optional[str] = None,
+        filter_agency: Optional[str] = None,
+        award_columns: Optional[List[str]] = None,
+        ef_search: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query vectors in one round-trip
+        
+        Each query is its own index-ordered subquery; the subqueries are combined
+        with UNION ALL so planning, connection checkout and network latency are
+        paid once per batch instead of once per query.
+        
+        Args:
+            query_vectors: Query embedding vectors (lists, float32 arrays or raw float32 bytes)
+            top_k: Number of results to return per query
+            table_name: Name of the table to search (defaults to settings.AWARD_CHUNKS_TABLE_NAME)
+            filter_agency: Optional agency filter
+            award_columns: Award columns to join onto each hit in the same query
+                (returned under "award"; None if the award row is missing)
+            ef_search: HNSW candidate list size (defaults to settings.PGVECTOR_HNSW_EF_SEARCH;
+                0 keeps the server default)
+        
+        Returns:
+            One list of search results per query vector, in input order
+        
+        Note:
+            Results are cached per query vector (quantized to float16, so
+            near-identical vectors share an entry) and search parameters;
+            repeated queries skip the database.
+        """
         if not PSYCOPG2_AVAILABLE or not self.database_url:
             raise RuntimeError("Database connection not available")
         
+        if not query_vectors:
+            return []
+        
         # Use configured table name if not provided
         if table_name is None:
             table_name = settings.AWARD_CHUNKS_TABLE_NAME
+        if ef_search is None:
+            ef_search = settings.PGVECTOR_HNSW_EF_SEARCH
+        
+        if self._search_cache is None:
+            return self._search_vectors_uncached(
+                query_vectors, top_k, table_name, filter_agency, award_columns, ef_search
+            )
+        
+        search_key = (int(top_k), table_name, filter_agency, tuple(award_columns or ()), ef_search)
+        cache_keys = [
+            (hashlib.blake2b(_as_float16_scratch(_as_float32(query_vector)), digest_size=16).digest(), search_key)
+            for query_vector in query_vectors
+        ]
+        search_results = [self._search_cache.get(key) for key in cache_keys]
+        missing = [i for i, results in enumerate(search_results) if results is None]
+        
+        if missing:
+            fetched = self._search_vectors_uncached(
+                [query_vectors[i] for i in missing], top_k, table_name, filter_agency, award_columns, ef_search
+            )
+            for i, results in zip(missing, fetched):
+                self._search_cache.put(cache_keys[i], results)
+                search_results[i] = results
+        
+        return [list(results) for results in search_results]
+    
+    def _search_vectors_uncached(
+        self,
+        query_vectors: List[List[float]],
+        top_k: int,
+        table_name: str,
+        filter_agency: Optional[str],
+        award_columns: Optional[List[str]],
+        ef_search: int
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run a batch search against the database (see search_vectors_batch)
+        
+        Args:
+            query_vectors: Query embedding vectors
+            top_k: Number of results to return per query
+            table_name: Name of the table to search
+            filter_agency: Optional agency filter
+            award_columns: Award columns to join onto each hit (or None)
+            ef_search: HNSW candidate list size (0 keeps the server default)
         
+        Returns:
+            One list of search results per query vector, in input order
+        """
         conn = None
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
             
-            # Optimize query vector string conversion
-            if NUMPY_AVAILABLE:
-                query_array = np.array(query_vector, dtype=np.float32)
-                query_vector_str = "[" + ",".join(query_array.astype(str)) + "]"
-            else:
-                query_vector_str = "[" + ",".join(str(x) for x in query_vector) + "]"
+            # HNSW candidate list size (set in the same round-trip as the search;
+            # pooled connections are reused, so it is set on every search)
+            session_sql = ""
+            if ef_search > 0:
+                session_sql = f"SET hnsw.ef_search = {int(ef_search)};"
             
-            # Build query with optional filter
-            filter_clause = ""
-            if filter_agency:
-                filter_clause = f"WHERE field_name = '{filter_agency}'"
+            # Queries are compared as halfvec for halfvec columns and above 2000 dims
+            half = settings.PGVECTOR_COLUMN_TYPE == "halfvec" or settings.EMBEDDING_DIMENSION > 2000
+            vector_literals = [_vector_literal(query_vector, half) for query_vector in query_vectors]
             
-            # Use halfvec casting for dimensions > 2000 to leverage HNSW index
-            embedding_dim = settings.EMBEDDING_DIMENSION
-            if embedding_dim > 2000:
-                # Cast both query and column to halfvec for index usage
-                similarity_expr = f"1 - (embedding::halfvec({embedding_dim}) <=> '{query_vector_str}'::halfvec({embedding_dim}))"
-                order_expr = f"embedding::halfvec({embedding_dim}) <=> '{query_vector_str}'::halfvec({embedding_dim})"
-            else:
-                # Standard vector operations for dimensions <= 2000
-                similarity_expr = f"1 - (embedding <=> '{query_vector_str}'::vector)"
-                order_expr = f"embedding <=> '{query_vector_str}'::vector"
-            
-            search_sql = f"""
-                SELECT 
-                    chunk_id,
-                    award_id,
-                    chunk_index,
-                    chunk_text,
-                    field_name,
-                    {similarity_expr} as similarity
-                FROM {table_name}
-                {filter_clause}
-                ORDER BY {order_expr}
-                LIMIT {top_k}
-            """
+            results = None
+            if self._prepare_searches:
+                try:
+                    results = self._execute_prepared_search(
+                        conn, cursor, session_sql, vector_literals, top_k, table_name, filter_agency, award_columns
+                    )
+                except Exception as e:
+                    if getattr(e, "pgcode", None) in _PREPARED_UNSUPPORTED_PGCODES:
+                        # e.g. a transaction-mode pooler that doesn't keep session state
+                        logger.warning(f"Prepared vector search unsupported, using plain SQL from now on: {e}")
+                        self._prepare_searches = False
+                        conn.prepared_statements.clear()
+                    else:
+                        # Transient (timeout, lock wait): retry this search as plain SQL
+                        logger.warning(f"Prepared vector search failed, retrying as plain SQL: {e}")
+                    conn.rollback()
+                    cursor = conn.cursor()
             
-            cursor.execute(search_sql)
-            results = cursor.fetchall()
+            if results is None:
+                # Values are bound as parameters (never formatted into the SQL)
+                params: Dict[str, Any] = {f"v{i}": literal for i, literal in enumerate(vector_literals)}
+                if filter_agency:
+                    params["field_name"] = filter_agency
+                search_sql = self._build_batch_sql(
+                    [f"%(v{i})s" for i in range(len(vector_literals))],
+                    str(int(top_k)),
+                    table_name,
+                    "%(field_name)s" if filter_agency else None,
+                    award_columns
+                )
+                cursor.execute(session_sql + search_sql, params)
+                results = cursor.fetchall()
             
-            # Convert to list of dicts
-            search_results = []
+            # Convert to list of dicts, grouped by query
+            search_results: List[List[Dict[str, Any]]] = [[] for _ in query_vectors]
             for row in results:
-                search_results.append({
-                    "chunk_id": row[0],
-                    "award_id": row[1],
-                    "chunk_index": row[2],
-                    "chunk_text": row[3],
-                    "field_name": row[4],
-                    "similarity": float(row[5])
-                })
+                search_result = {
+                    "chunk_id": row[1],
+                    "award_id": row[2],
+                    "chunk_index": row[3],
+                    "chunk_text": row[4],
+                    "field_name": row[5],
+                    "similarity": float(row[6])
+                }
+                if award_columns:
+                    # Dates as ISO strings, matching the Supabase REST representation
+                    search_result["award"] = {
+                        column: value.isoformat() if hasattr(value, "isoformat") else value
+                        for column, value in zip(award_columns, row[8:])
+                    } if row[7] else None
+                search_results[row[0]].append(search_result)
             
             cursor.close()
             
-            logger.debug(f"Found {len(search_results)} similar vectors")
+            logger.debug(
+                f"Found {sum(len(r) for r in search_results)} similar vectors",
+                extra={"queries": len(query_vectors)}
+            )
             return search_results
             
         except Exception as e:
@@ -488,6 +971,178 @@ class PgVectorManager:
         finally:
             if conn:
                 self._put_connection(conn)
+    
+    def _execute_prepared_search(
+        self,
+        conn,
+        cursor,
+        session_sql: str,
+        vector_literals: List[str],
+        top_k: int,
+        table_name: str,
+        filter_agency: Optional[str],
+        award_columns: Optional[List[str]]
+    ) -> List[tuple]:
+        """
+        Run a batch search as a server-side prepared statement
+        
+        The statement is PREPAREd once per connection and batch shape (in the
+        same round-trip as its first EXECUTE), so later searches skip parse
+        and plan and only send the vectors and top_k. A statement already on
+        the server (left by a failed first EXECUTE) is reused, not re-prepared.
+        
+        Args:
+            conn: Connection the statement is prepared on
+            cursor: Cursor on conn
+            session_sql: Statements to run before the search (e.g. SET hnsw.ef_search)
+            vector_literals: pgvector literals of the query vectors
+            top_k: Number of results per query
+            table_name: Name of the table to search
+            filter_agency: Optional agency filter (bound as a parameter, so all
+                agencies share one statement and plan)
+            award_columns: Award columns to join onto each hit (or None)
+        
+        Returns:
+            Result rows (as from _build_batch_sql)
+        """
+        query_count = len(vector_literals)
+        statement_key = (
+            table_name, bool(filter_agency), tuple(award_columns or ()), query_count,
+            settings.EMBEDDING_DIMENSION, settings.PGVECTOR_COLUMN_TYPE, settings.AWARDS_TABLE_NAME
+        )
+        statement_name = "vsearch_" + hashlib.md5(repr(statement_key).encode("utf-8")).hexdigest()[:16]
+        
+        prepared = conn.prepared_statements
+        prepare_sql = ""
+        if statement_name not in prepared:
+            search_sql = self._build_batch_sql(
+                [f"${i + 1}" for i in range(query_count)],
+                f"${query_count + 1}",
+                table_name,
+                f"${query_count + 2}" if filter_agency else None,
+                award_columns
+            )
+            param_types = ", ".join(["text"] * query_count + ["int"] + (["text"] if filter_agency else []))
+            prepare_sql = f"PREPARE {statement_name}({param_types}) AS {search_sql};"
+        
+        params = (*vector_literals, int(top_k)) + ((filter_agency,) if filter_agency else ())
+        placeholders = ", ".join(["%s"] * len(params))
+        execute_sql = f"EXECUTE {statement_name}({placeholders})"
+        try:
+            cursor.execute(prepare_sql + session_sql + execute_sql, params)
+        except Exception as e:
+            if not prepare_sql or getattr(e, "pgcode", None) != _DUPLICATE_PREPARED_PGCODE:
+                raise
+            # Prepared by an earlier search whose EXECUTE failed: run it as it is
+            # (if the server doesn't keep it after all, this raises 26000)
+            conn.rollback()
+            cursor.execute(session_sql + execute_sql, params)
+        prepared.add(statement_name)
+        return cursor.fetchall()
+    
+    @classmethod
+    def _build_batch_sql(
+        cls,
+        vector_sqls: List[str],
+        limit_sql: str,
+        table_name: str,
+        filter_sql: Optional[str],
+        award_columns: Optional[List[str]]
+    ) -> str:
+        """
+        Build the search SQL for a batch of query vectors (UNION ALL of per-query SELECTs)
+        
+        Args:
+            vector_sqls: SQL expression per query vector (quoted literal or parameter)
+            limit_sql: SQL expression for top_k
+            table_name: Name of the table to search
+            filter_sql: SQL expression (placeholder) for the agency filter, or None
+            award_columns: Award columns to join onto each hit (or None)
+        
+        Returns:
+            SQL whose rows start with query_index, ordered by query then similarity
+        """
+        query_sqls = [
+            cls._build_search_sql(query_index, vector_sql, limit_sql, table_name, filter_sql, award_columns)
+            for query_index, vector_sql in enumerate(vector_sqls)
+        ]
+        if len(query_sqls) == 1:
+            return query_sqls[0]
+        
+        search_sql = "\nUNION ALL\n".join(f"({sql})" for sql in query_sqls)
+        return search_sql + "\nORDER BY query_index, similarity DESC"
+    
+    @staticmethod
+    def _build_search_sql(
+        query_index: int,
+        vector_sql: str,
+        limit_sql: str,
+        table_name: str,
+        filter_sql: Optional[str],
+        award_columns: Optional[List[str]]
+    ) -> str:
+        """
+        Build the nearest-neighbour SELECT for one query vector
+        
+        Args:
+            query_index: Position of the query in its batch (first output column)
+            vector_sql: SQL expression for the query vector text (quoted literal or parameter)
+            limit_sql: SQL expression for top_k
+            table_name: Name of the table to search
+            filter_sql: SQL expression (placeholder) for the agency filter, or None
+            award_columns: Award columns to join onto each hit (or None)
+        
+        Returns:
+            SQL selecting query_index, chunk columns, similarity (and award columns)
+        """
+        embedding_dim = settings.EMBEDDING_DIMENSION
+        if settings.PGVECTOR_COLUMN_TYPE == "halfvec":
+            # Native halfvec column: compare directly, no per-row cast
+            distance_expr = f"embedding <=> {vector_sql}::halfvec({embedding_dim})"
+        elif embedding_dim > 2000:
+            # Use halfvec casting for dimensions > 2000 to leverage HNSW index
+            # Cast both query and column to halfvec for index usage
+            distance_expr = f"embedding::halfvec({embedding_dim}) <=> {vector_sql}::halfvec({embedding_dim})"
+        else:
+            # Standard vector operations for dimensions <= 2000
+            distance_expr = f"embedding <=> {vector_sql}::vector"
+        
+        filter_clause = f"WHERE field_name = {filter_sql}" if filter_sql else ""
+        
+        # The query vector literal appears once: the index scan orders by the
+        # distance alias and similarity is derived from it outside
+        search_sql = f"""
+            SELECT 
+                {int(query_index)} as query_index,
+                chunk_id,
+                award_id,
+                chunk_index,
+                chunk_text,
+                field_name,
+                1 - distance as similarity
+            FROM (
+                SELECT chunk_id, award_id, chunk_index, chunk_text, field_name,
+                       {distance_expr} as distance
+                FROM {table_name}
+                {filter_clause}
+                ORDER BY distance
+                LIMIT {limit_sql}
+            ) nearest
+            ORDER BY distance
+        """
+        
+        if award_columns:
+            # Join award rows onto the ANN hits: one round-trip instead of a second metadata query
+            award_select = ", ".join(f"a.{column}" for column in award_columns)
+            search_sql = f"""
+                SELECT c.query_index, c.chunk_id, c.award_id, c.chunk_index, c.chunk_text, c.field_name,
+                       c.similarity, a.award_id IS NOT NULL, {award_select}
+                FROM ({search_sql}) c
+                LEFT JOIN {settings.AWARDS_TABLE_NAME} a ON a.award_id = c.award_id
+                ORDER BY c.similarity DESC
+            """
+        
+        return search_sql
 
 
 @lru_cache()
@@ -501,22 +1156,26 @@ def get_pgvector_manager() -> PgVectorManager:
     return PgVectorManager()
 
 
-def setup_pgvector() -> bool:
+def setup_pgvector(defer_index: bool = False) -> bool:
     """
     Set up pgvector extension and create necessary tables
     
+    Args:
+        defer_index: Create the table without its HNSW index; call
+            get_pgvector_manager().build_index() after the bulk load
+    
     Returns:
         bool: True if setup successful
     """
     manager = get_pgvector_manager()
     
-    # Enable extension
+    # Enable extension (no round-trip once this manager has verified it)
     if not manager.check_extension():
         manager.enable_extension()
     
     # Create vector table
     dimension = settings.EMBEDDING_DIMENSION
-    manager.create_vector_table(dimension=dimension)
+    manager.create_vector_table(dimension=dimension, defer_index=defer_index)
     
     logger.info("pgvector setup completed successfully")
     return True
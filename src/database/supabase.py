@@ -4,6 +4,7 @@ Supabase database client wrapper with connection management
 """
 from typing import Optional
 from functools import lru_cache
+import asyncio
 
 try:
     from supabase import create_client, Client
@@ -12,6 +13,13 @@ except ImportError:
     SUPABASE_AVAILABLE = False
     Client = None  # type: ignore
 
+try:
+    from supabase import acreate_client, AsyncClient
+    SUPABASE_ASYNC_AVAILABLE = True
+except ImportError:
+    SUPABASE_ASYNC_AVAILABLE = False
+    AsyncClient = None  # type: ignore
+
 from src.core.config import settings
 from src.core.logging import get_logger
 from src.database.connection import DatabaseConnection, validate_database_config
@@ -40,6 +48,10 @@ class SupabaseClient(DatabaseConnection):
         
         self.url = url or settings.SUPABASE_URL
         self.key = key or settings.SUPABASE_KEY
+        self._async_connection = None
+        # Set once async client creation fails (later calls skip straight to None)
+        self._async_unavailable = False
+        self._async_lock = asyncio.Lock()
         
         if not self.url or not self.key:
             logger.warning(
@@ -80,6 +92,8 @@ class SupabaseClient(DatabaseConnection):
         if self._is_connected:
             logger.info("Disconnecting from Supabase")
             self._connection = None
+            self._async_connection = None
+            self._async_unavailable = False
             self._is_connected = False
     
     def health_check(self) -> bool:
@@ -134,6 +148,36 @@ class SupabaseClient(DatabaseConnection):
         
         return self._connection  # type: ignore
     
+    async def get_async_client(self) -> Optional["AsyncClient"]:
+        """
+        Get the async Supabase client instance (created on first use)
+        
+        A failed creation is remembered, so later calls return None without
+        retrying (until disconnect).
+        
+        Returns:
+            AsyncClient: Async Supabase client, or None if the installed
+            supabase package has no async client, credentials are missing
+            or creating it failed
+        """
+        if self._async_connection is not None:
+            return self._async_connection
+        
+        if self._async_unavailable or not SUPABASE_ASYNC_AVAILABLE or not self.url or not self.key:
+            return None
+        
+        # Concurrent first requests wait for one client instead of each building one
+        async with self._async_lock:
+            if self._async_connection is None and not self._async_unavailable:
+                try:
+                    self._async_connection = await acreate_client(self.url, self.key)
+                    logger.info("Created async Supabase client")
+                except Exception as e:
+                    logger.warning(f"Could not create async Supabase client, using the sync client: {e}")
+                    self._async_unavailable = True
+        
+        return self._async_connection
+    
     def test_connection(self) -> bool:
         """
         Test the connection with a simple query
@@ -209,3 +253,16 @@ def get_client() -> Client:
         ```
     """
     return get_supabase_client().get_client()
+
+
+def is_async_client(client) -> bool:
+    """
+    Check whether a raw Supabase client is the async variant
+    
+    Args:
+        client: Raw Supabase client (sync or async)
+    
+    Returns:
+        bool: True if the client's queries must be awaited
+    """
+    return SUPABASE_ASYNC_AVAILABLE and isinstance(client, AsyncClient)
@@ -8,8 +8,15 @@ Benefits:
 - Token-aware chunking with tiktoken
 - Much simpler and faster than manual implementation
 """
+import atexit
 import hashlib
-from typing import List, Dict, Optional
+import logging
+import multiprocessing
+import os
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from functools import lru_cache
 
 try:
@@ -19,11 +26,141 @@ except ImportError:
     LANGCHAIN_AVAILABLE = False
     RecursiveCharacterTextSplitter = None  # type: ignore
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
 from src.core.config import settings
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Threads tiktoken uses to encode a batch of chunks
+_TOKENIZER_THREADS = min(8, os.cpu_count() or 1)
+
+# Approximate characters per token for English text (sizes the fast splitter)
+_CHARS_PER_TOKEN = 4
+
+# Text shorter than this (characters, after stripping) is never split
+_SHORT_TEXT_CHARS = 50
+
+# Separators for body text: paragraphs, lines, sentences, words, characters
+_TEXT_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+
+# Digest bytes kept as text_hash (16 = 128 bits is plenty for dedup; 32 = full SHA-256)
+_TEXT_HASH_BYTES = min(32, max(16, settings.TEXT_HASH_HEX_LENGTH // 2))
+
+# Token counts by text digest (titles, boilerplate and splitter fragments recur
+# across awards); keyed by the first 16 bytes of the text's SHA-256, so cached
+# texts aren't kept alive and chunks reuse the digest behind their text_hash
+_TOKEN_COUNT_CACHE_SIZE = 200_000
+_token_counts: "OrderedDict[bytes, int]" = OrderedDict()
+_token_counts_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_tokenizer():
+    """Get tiktoken tokenizer (cached)"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except ImportError:
+        logger.warning("tiktoken not available, using character count")
+        return None
+
+
+def _text_digest(text: str) -> bytes:
+    """
+    Content digest of a chunk (its hex form, cut to _TEXT_HASH_BYTES, is stored as text_hash)
+    
+    The text is UTF-8 encoded once here; the digest then serves both the
+    text_hash and the token-count cache key. SHA-256 is kept because existing
+    rows and embedding caches are keyed by it; hashlib's OpenSSL
+    implementation uses the CPU's SHA extensions.
+    
+    Args:
+        text: Chunk text
+    
+    Returns:
+        SHA-256 digest of the UTF-8 text
+    """
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def _cached_token_count(key: bytes) -> Optional[int]:
+    """Look up a cached token count (refreshing its LRU position)"""
+    with _token_counts_lock:
+        count = _token_counts.get(key)
+        if count is not None:
+            _token_counts.move_to_end(key)
+        return count
+
+
+def _store_token_count(key: bytes, count: int) -> None:
+    """Cache a token count, evicting the least recently used entry if full"""
+    with _token_counts_lock:
+        _token_counts[key] = count
+        if len(_token_counts) > _TOKEN_COUNT_CACHE_SIZE:
+            _token_counts.popitem(last=False)
+
+
+def _count_tokens_cached(text: str, digest: Optional[bytes] = None) -> int:
+    """
+    Count tokens in text using tiktoken, with an LRU cache keyed by text hash
+    
+    Args:
+        text: Input text
+        digest: _text_digest(text), if already computed
+    
+    Returns:
+        Number of tokens (characters if tiktoken is not available)
+    """
+    key = (digest or _text_digest(text))[:16]
+    count = _cached_token_count(key)
+    if count is None:
+        tokenizer = _get_tokenizer()
+        count = len(tokenizer.encode_ordinary(text)) if tokenizer else len(text)
+        _store_token_count(key, count)
+    return count
+
+
+@dataclass(slots=True)
+class Chunk:
+    """
+    Compact chunk record (same fields as a chunk_award dictionary)
+    
+    Slotted instances carry no per-instance __dict__, so holding many chunks
+    costs a fraction of the equivalent dictionaries. The indexing pipeline
+    still works on dictionaries (it attaches an "embedding" key to each);
+    use to_dict() to hand records to it.
+    """
+    chunk_text: str
+    chunk_index: int
+    token_count: int
+    field_name: str
+    text_hash: str
+    award_id: str = ""
+    agency: str = ""
+    source_fields: Tuple[str, ...] = ()
+    content_type: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the chunk as a chunk_award-style dictionary"""
+        return {
+            "chunk_text": self.chunk_text,
+            "chunk_index": self.chunk_index,
+            "token_count": self.token_count,
+            "field_name": self.field_name,
+            "text_hash": self.text_hash,
+            "award_id": self.award_id,
+            "agency": self.agency,
+            "source_fields": self.source_fields,
+            "content_type": self.content_type
+        }
+
 
 class ChunkingService:
     """Service for chunking text using LangChain's optimized text splitter"""
@@ -50,19 +187,46 @@ class ChunkingService:
         self.chunk_overlap = chunk_overlap or settings.CHUNK_OVERLAP
         
         # Initialize LangChain's RecursiveCharacterTextSplitter
-        # This is optimized, well-tested, and handles many edge cases
+        # This is optimized, well-tested, and handles many edge cases.
+        # The splitter measures length many times while it recurses, so it
+        # sizes chunks by characters (~_CHARS_PER_TOKEN per token); the
+        # resulting chunks are token-counted once, and any over chunk_size
+        # are re-split by the token-accurate splitter below.
+        self._split_chars = self.chunk_size * _CHARS_PER_TOKEN
         self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=self._split_chars,
+            chunk_overlap=self.chunk_overlap * _CHARS_PER_TOKEN,
+            length_function=len,
+            separators=_TEXT_SEPARATORS,
+            is_separator_regex=False,
+            strip_whitespace=True,
+        )
+        # Same splitter without the paragraph separator, for text with no "\n\n"
+        # (most abstracts): skips a find() over every piece at each recursion level
+        self._single_paragraph_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=self._split_chars,
+            chunk_overlap=self.chunk_overlap * _CHARS_PER_TOKEN,
+            length_function=len,
+            separators=_TEXT_SEPARATORS[1:],
+            is_separator_regex=False,
+            strip_whitespace=True,
+        )
+        self._token_splitter = RecursiveCharacterTextSplitter(
             chunk_size=self.chunk_size,
             chunk_overlap=self.chunk_overlap,
-            length_function=self._count_tokens,  # Use token count, not character count
-            separators=[
-                "\n\n",  # Paragraphs first
-                "\n",    # Then lines
-                ". ",    # Then sentences
-                " ",     # Then words
-                "",      # Finally characters
-            ],
+            length_function=_count_tokens_cached,  # Use token count, not character count
+            separators=_TEXT_SEPARATORS,
+            is_separator_regex=False,
+            strip_whitespace=True,
+        )
+        # Smaller chunks for titles to preserve exact phrases
+        self.title_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=100,  # Smaller for titles
+            chunk_overlap=20,  # Less overlap
+            length_function=_count_tokens_cached,
+            separators=[" ", "", "."],  # Word and character level
             is_separator_regex=False,
+            strip_whitespace=True,
         )
         
         logger.info(
@@ -74,19 +238,9 @@ class ChunkingService:
             }
         )
     
-    @lru_cache(maxsize=1)
-    def _get_tokenizer(self):
-        """Get tiktoken tokenizer (cached)"""
-        try:
-            import tiktoken
-            return tiktoken.get_encoding("cl100k_base")
-        except ImportError:
-            logger.warning("tiktoken not available, using character count")
-            return None
-    
     def _count_tokens(self, text: str) -> int:
         """
-        Count tokens in text using tiktoken
+        Count tokens in text using tiktoken (cached by text hash)
         
         Args:
             text: Input text
@@ -94,24 +248,57 @@ class ChunkingService:
         Returns:
             Number of tokens
         """
-        tokenizer = self._get_tokenizer()
+        return _count_tokens_cached(text)
+    
+    def _count_tokens_batch(self, texts: List[str], digests: Optional[List[bytes]] = None) -> List[int]:
+        """
+        Count tokens for several texts with one tiktoken call
+        
+        Cached counts are reused; the rest are encoded with one
+        encode_ordinary_batch call on tiktoken's native thread pool, instead
+        of one Python->Rust call per chunk.
+        
+        Args:
+            texts: Input texts
+            digests: _text_digest of each text, if already computed
+        
+        Returns:
+            Number of tokens per text, in input order
+        """
+        if digests is None:
+            digests = [_text_digest(text) for text in texts]
+        keys = [digest[:16] for digest in digests]
+        counts = [_cached_token_count(key) for key in keys]
+        missing = [i for i, count in enumerate(counts) if count is None]
+        if not missing:
+            return counts
+        
+        tokenizer = _get_tokenizer()
         if tokenizer:
-            return len(tokenizer.encode(text))
+            encoded = tokenizer.encode_ordinary_batch([texts[i] for i in missing], num_threads=_TOKENIZER_THREADS)
+            missing_counts = [len(ids) for ids in encoded]
         else:
             # Fallback to character count if tiktoken not available
-            return len(text)
+            missing_counts = [len(texts[i]) for i in missing]
+        
+        for i, count in zip(missing, missing_counts):
+            _store_token_count(keys[i], count)
+            counts[i] = count
+        return counts
     
     def chunk_text(
         self,
         text: str,
-        field_name: str = "abstract"
-    ) -> List[Dict[str, any]]:
+        field_name: str = "abstract",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Chunk text using LangChain's optimized splitter
         
         Args:
             text: Text to chunk
             field_name: Name of the field being chunked (for metadata)
+            metadata: Extra fields added to every chunk dictionary
         
         Returns:
             List of chunk dictionaries with:
@@ -120,37 +307,120 @@ class ChunkingService:
             - token_count: Number of tokens in chunk
             - field_name: Source field name
             - text_hash: SHA256 hash of chunk text
+            plus any metadata fields
         """
-        if not text or not text.strip():
-            logger.warning(f"Empty text provided for chunking (field: {field_name})")
+        text = text.strip() if text else ""
+        if not text:
+            logger.warning("Empty text provided for chunking (field: %s)", field_name)
             return []
         
+        # Short text (titles, stub abstracts) is always a single chunk
+        if len(text) < _SHORT_TEXT_CHARS:
+            return self._build_chunks([text], field_name, metadata)
+        
+        return self._build_chunks(self._split_text(text), field_name, metadata)
+    
+    def _split_text(self, text: str) -> List[str]:
+        """
+        Split text into stripped, non-empty pieces with the fast splitter
+        
+        Args:
+            text: Text to split
+        
+        Returns:
+            Chunk texts (may still exceed chunk_size tokens; see _build_chunks)
+        """
+        if "\n\n" not in text:
+            # Fits in one fast-splitter chunk: the splitter would return it whole
+            if len(text) <= self._split_chars:
+                text = text.strip()
+                return [text] if text else []
+            return self._single_paragraph_splitter.split_text(text)
+        
         # Use LangChain's splitter (much faster and more reliable!)
-        chunks = self.text_splitter.split_text(text)
+        # (strip_whitespace: pieces come back stripped, whitespace-only ones dropped)
+        return self.text_splitter.split_text(text)
+    
+    def _count_pieces(
+        self,
+        chunk_texts: List[str],
+        limit: Optional[int] = None
+    ) -> Tuple[List[str], List[int], List[bytes]]:
+        """
+        Token-count and hash split pieces, re-splitting any over chunk_size tokens
+        
+        Args:
+            chunk_texts: Pieces from _split_text
+            limit: Keep only the first `limit` chunks (later pieces are not counted or hashed)
+        
+        Returns:
+            Tuple of (chunk texts, token counts, _text_digest of each text)
+        """
+        # Re-splitting only expands pieces in place, so the first `limit`
+        # chunks come from the first `limit` pieces
+        if limit is not None:
+            chunk_texts = chunk_texts[:limit]
+        
+        # Count tokens for all chunks at once
+        digests = [_text_digest(chunk_text) for chunk_text in chunk_texts]
+        token_counts = self._count_tokens_batch(chunk_texts, digests)
+        
+        # Re-split chunks the character estimate let grow past chunk_size tokens
+        if any(token_count > self.chunk_size for token_count in token_counts):
+            resplit_texts = []
+            for chunk_text, token_count in zip(chunk_texts, token_counts):
+                if token_count > self.chunk_size:
+                    resplit_texts.extend(self._token_splitter.split_text(chunk_text))
+                else:
+                    resplit_texts.append(chunk_text)
+            chunk_texts = resplit_texts if limit is None else resplit_texts[:limit]
+            digests = [_text_digest(chunk_text) for chunk_text in chunk_texts]
+            token_counts = self._count_tokens_batch(chunk_texts, digests)
+        
+        return chunk_texts, token_counts, digests
+    
+    def _build_chunks(
+        self,
+        chunk_texts: List[str],
+        field_name: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        start_index: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Token-count and hash split pieces into chunk dictionaries
+        
+        Each dictionary is built once with its final keys, rather than
+        created and then grown with update().
+        
+        Args:
+            chunk_texts: Pieces from _split_text
+            field_name: Name of the field being chunked (for metadata)
+            metadata: Extra fields added to every chunk dictionary
+            start_index: chunk_index of the first chunk
+            limit: Keep only the first `limit` chunks (later pieces are not counted or hashed)
         
-        # Convert to our format with metadata
+        Returns:
+            List of chunk dictionaries (see chunk_text)
+        """
+        chunk_texts, token_counts, digests = self._count_pieces(chunk_texts, limit)
+        
+        # Convert to our format with metadata (hash for incremental processing)
+        metadata = metadata or {}
         result = []
-        for idx, chunk_text in enumerate(chunks):
-            chunk_text = chunk_text.strip()
-            if not chunk_text:
-                continue
-            
-            # Count tokens
-            token_count = self._count_tokens(chunk_text)
-            
-            # Generate hash for incremental processing
-            text_hash = hashlib.sha256(chunk_text.encode()).hexdigest()
-            
+        for idx, (chunk_text, token_count, digest) in enumerate(zip(chunk_texts, token_counts, digests), start_index):
             result.append({
                 "chunk_text": chunk_text,
                 "chunk_index": idx,
                 "token_count": token_count,
                 "field_name": field_name,
-                "text_hash": text_hash
+                "text_hash": digest[:_TEXT_HASH_BYTES].hex(),
+                **metadata
             })
         
         logger.debug(
-            f"Chunked text into {len(result)} chunks",
+            "Chunked text into %d chunks",
+            len(result),
             extra={
                 "field_name": field_name,
                 "chunk_count": len(result),
@@ -160,11 +430,63 @@ class ChunkingService:
         
         return result
     
+    def chunk_awards(
+        self,
+        awards: List[Dict],
+        fields: Optional[List[str]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Chunk many award records, tokenizing all their chunks in one batch
+        
+        The abstract and context texts of every award are split first, and all
+        pieces are token-counted with a single encode_ordinary_batch call (one
+        native, multi-threaded pass instead of a call per award). The per-award
+        chunking then reuses those splits and counts.
+        
+        Args:
+            awards: Award dictionaries
+            fields: List of field names to chunk (default: auto-detect per award)
+        
+        Returns:
+            One list of chunk dictionaries per award (as from chunk_award), in input order
+        """
+        splits: Dict[str, List[str]] = {}
+        for award in awards:
+            for text in self._award_split_texts(award, fields):
+                if text not in splits:
+                    splits[text] = self._split_text(text)
+        
+        pieces = [piece for award_pieces in splits.values() for piece in award_pieces]
+        if pieces:
+            self._count_tokens_batch(pieces)  # fills the token-count cache
+        
+        def split_text(text: str) -> List[str]:
+            award_pieces = splits.get(text)
+            return award_pieces if award_pieces is not None else self._split_text(text)
+        
+        return [self._chunk_award(award, fields, split_text) for award in awards]
+    
+    @staticmethod
+    def _award_split_texts(award: Dict, fields: Optional[List[str]]) -> List[str]:
+        """Texts chunk_award runs through the body-text splitter (abstract and title+abstract context)"""
+        abstract_text = award.get("public_abstract") or award.get("abstract") or ""
+        title = award.get("title") or ""
+        if fields is None:
+            fields = [name for name, value in (("title", title), ("abstract", abstract_text)) if value]
+        
+        texts = []
+        abstract_stripped = abstract_text.strip()
+        if "abstract" in fields and len(abstract_stripped) > 50:
+            texts.append(abstract_stripped)
+        if len(fields) > 1 and title and abstract_text:
+            texts.append(f"{title}. {abstract_text[:1000]}")
+        return texts
+    
     def chunk_award(
         self,
         award: Dict,
         fields: Optional[List[str]] = None
-    ) -> List[Dict[str, any]]:
+    ) -> List[Dict[str, Any]]:
         """
         Chunk an award record with field-specific strategies
 
@@ -180,108 +502,197 @@ class ChunkingService:
         Returns:
             List of chunk dictionaries with award metadata
         """
+        return self._chunk_award(award, fields, self._split_text)
+    
+    def chunk_award_records(
+        self,
+        award: Dict,
+        fields: Optional[List[str]] = None
+    ) -> List[Chunk]:
+        """
+        Chunk an award record into slotted Chunk records
+        
+        Same chunks as chunk_award, for callers that hold many chunks in memory.
+        
+        Args:
+            award: Award dictionary
+            fields: List of field names to chunk (default: auto-detect)
+        
+        Returns:
+            List of Chunk records
+        """
+        return [Chunk(**chunk) for chunk in self.chunk_award(award, fields)]
+    
+    def chunk_award_columnar(
+        self,
+        award: Dict,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Chunk an award record into columns instead of one dictionary per chunk
+        
+        Embedding calls want the chunk texts as one list; columns hand them over
+        without zipping dictionaries. Numeric columns are int32 numpy arrays
+        when numpy is installed (plain lists otherwise).
+        
+        Args:
+            award: Award dictionary
+            fields: List of field names to chunk (default: auto-detect)
+        
+        Returns:
+            Dictionary of equal-length columns, one per chunk_award field
+        """
+        award_id = award.get("award_id", "")
+        agency = award.get("agency", "")
+        columns: Dict[str, Any] = {name: [] for name in Chunk.__slots__}
+        segments = self._award_segments(award, fields, self._split_text)
+        for field_name, source_fields, content_type, texts, token_counts, digests in segments:
+            count = len(texts)
+            columns["chunk_text"].extend(texts)
+            columns["token_count"].extend(token_counts)
+            columns["field_name"].extend([field_name] * count)
+            columns["text_hash"].extend([digest[:_TEXT_HASH_BYTES].hex() for digest in digests])
+            columns["source_fields"].extend([source_fields] * count)
+            columns["content_type"].extend([content_type] * count)
+        
+        total = len(columns["chunk_text"])
+        columns["chunk_index"] = list(range(total))
+        columns["award_id"] = [award_id] * total
+        columns["agency"] = [agency] * total
+        if NUMPY_AVAILABLE:
+            columns["chunk_index"] = np.arange(total, dtype=np.int32)
+            columns["token_count"] = np.array(columns["token_count"], dtype=np.int32)
+        
+        self._log_award_chunks(award, segments)
+        return columns
+    
+    def _chunk_award(
+        self,
+        award: Dict,
+        fields: Optional[List[str]],
+        split_text: Callable[[str], List[str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Chunk an award record (see chunk_award)
+        
+        Args:
+            award: Award dictionary
+            fields: List of field names to chunk (default: auto-detect)
+            split_text: Splits body text into pieces (_split_text, or a lookup of
+                pieces chunk_awards already split)
+        
+        Returns:
+            List of chunk dictionaries with award metadata
+        """
+        award_id = award.get("award_id", "")
+        agency = award.get("agency", "")
+        segments = self._award_segments(award, fields, split_text)
+        
+        all_chunks = []
+        chunk_index_counter = 0  # Global counter for unique chunk indices
+        for field_name, source_fields, content_type, texts, token_counts, digests in segments:
+            for chunk_text, token_count, digest in zip(texts, token_counts, digests):
+                all_chunks.append({
+                    "chunk_text": chunk_text,
+                    "chunk_index": chunk_index_counter,
+                    "token_count": token_count,
+                    "field_name": field_name,
+                    "text_hash": digest[:_TEXT_HASH_BYTES].hex(),
+                    "award_id": award_id,
+                    "agency": agency,
+                    "source_fields": source_fields,
+                    "content_type": content_type
+                })
+                chunk_index_counter += 1
+        
+        self._log_award_chunks(award, segments)
+        return all_chunks
+    
+    def _award_segments(
+        self,
+        award: Dict,
+        fields: Optional[List[str]],
+        split_text: Callable[[str], List[str]]
+    ) -> List[Tuple[str, Tuple[str, ...], str, List[str], List[int], List[bytes]]]:
+        """
+        Run the chunk_award strategies, returning each one's chunks as parallel lists
+        
+        Args:
+            award: Award dictionary
+            fields: List of field names to chunk (default: auto-detect)
+            split_text: Splits body text into pieces (see _chunk_award)
+        
+        Returns:
+            List of (field_name, source_fields, content_type, texts, token_counts,
+            digests) tuples, in chunk order
+        """
+        title = award.get("title") or ""
+        # Raw abstract feeds the context chunks; stripped copy feeds the technical chunks
+        abstract_text = award.get("public_abstract") or award.get("abstract") or ""
+        abstract_stripped = abstract_text.strip()
+
         if fields is None:
             # Auto-detect available technical fields
             available_fields = []
-            if award.get("title"):
+            if title:
                 available_fields.append("title")
-            if award.get("public_abstract") or award.get("abstract"):
+            if abstract_text:
                 available_fields.append("abstract")
             fields = available_fields
 
         if not fields:
-            logger.warning(f"No text fields found for award {award.get('award_id', 'unknown')}")
+            logger.warning("No text fields found for award %s", award.get("award_id", "unknown"))
             return []
 
-        all_chunks = []
-        chunk_index_counter = 0  # Global counter for unique chunk indices
+        segments = []
 
         # Strategy 1: Chunk technical content (abstract) with optimal settings
         if "abstract" in fields:
-            abstract_text = award.get("public_abstract") or award.get("abstract", "")
-            if abstract_text and len(abstract_text.strip()) > 50:  # Minimum content check
-                # Use optimized settings for technical content
-                tech_chunks = self.chunk_text(
-                    abstract_text.strip(),
-                    field_name="abstract"
-                )
-                for chunk in tech_chunks:
-                    chunk.update({
-                        "award_id": award.get("award_id", ""),
-                        "agency": award.get("agency", ""),
-                        "source_fields": ["abstract"],
-                        "content_type": "technical",
-                        "chunk_index": chunk_index_counter  # Assign unique index
-                    })
-                    chunk_index_counter += 1
-                all_chunks.extend(tech_chunks)
+            if len(abstract_stripped) > 50:  # Minimum content check
+                texts, token_counts, digests = self._count_pieces(split_text(abstract_stripped))
+                if texts:
+                    segments.append(("abstract", ("abstract",), "technical", texts, token_counts, digests))
 
         # Strategy 2: Chunk titles separately (smaller chunks for exact matching)
         if "title" in fields:
-            title_text = award.get("title", "")
-            if title_text and len(title_text.strip()) > 10:
-                # Smaller chunks for titles to preserve exact phrases
-                title_splitter = RecursiveCharacterTextSplitter(
-                    chunk_size=100,  # Smaller for titles
-                    chunk_overlap=20,  # Less overlap
-                    length_function=self._count_tokens,
-                    separators=[" ", "", "."],  # Word and character level
-                    is_separator_regex=False,
-                )
-                title_chunks_raw = title_splitter.split_text(title_text.strip())
-
-                for chunk_text in title_chunks_raw:
-                    chunk_text = chunk_text.strip()
-                    if len(chunk_text) < 5:  # Skip very short chunks
-                        continue
-
-                    token_count = self._count_tokens(chunk_text)
-                    text_hash = hashlib.sha256(chunk_text.encode()).hexdigest()
-
-                    title_chunk = {
-                        "chunk_text": chunk_text,
-                        "chunk_index": chunk_index_counter,  # Use global counter
-                        "token_count": token_count,
-                        "field_name": "title",
-                        "text_hash": text_hash,
-                        "award_id": award.get("award_id", ""),
-                        "agency": award.get("agency", ""),
-                        "source_fields": ["title"],
-                        "content_type": "title"
-                    }
-                    all_chunks.append(title_chunk)
-                    chunk_index_counter += 1
+            title_stripped = title.strip()
+            if len(title_stripped) > 10:
+                # Skip very short chunks
+                texts = [text for text in self.title_splitter.split_text(title_stripped) if len(text) >= 5]
+                digests = [_text_digest(text) for text in texts]
+                token_counts = [_count_tokens_cached(text, digest) for text, digest in zip(texts, digests)]
+                if texts:
+                    segments.append(("title", ("title",), "title", texts, token_counts, digests))
 
         # Strategy 3: Create some overlapping chunks across title+abstract for context
-        if len(fields) > 1 and all_chunks:
+        if len(fields) > 1 and segments:
             # Combine title + first part of abstract for contextual chunks
-            title = award.get("title", "")
-            abstract = (award.get("public_abstract") or award.get("abstract", ""))[:1000]  # First 1000 chars
+            abstract = abstract_text[:1000]  # First 1000 chars
 
             if title and abstract:
                 combined = f"{title}. {abstract}"
-                context_chunks = self.chunk_text(combined, field_name="title_abstract_context")
-
                 # Only keep the first few context chunks to avoid duplication
-                for chunk in context_chunks[:2]:  # Limit to 2 context chunks
-                    chunk.update({
-                        "award_id": award.get("award_id", ""),
-                        "agency": award.get("agency", ""),
-                        "source_fields": ["title", "abstract"],
-                        "content_type": "context",
-                        "chunk_index": chunk_index_counter  # Assign unique index
-                    })
-                    chunk_index_counter += 1
-                all_chunks.extend(context_chunks[:2])
+                texts, token_counts, digests = self._count_pieces(split_text(combined), limit=2)
+                if texts:
+                    segments.append((
+                        "title_abstract_context", ("title", "abstract"), "context",
+                        texts, token_counts, digests
+                    ))
 
-        logger.info(
-            f"Created {len(all_chunks)} chunks for award {award.get('award_id', 'unknown')}: "
-            f"technical={len([c for c in all_chunks if c.get('content_type') == 'technical'])}, "
-            f"title={len([c for c in all_chunks if c.get('content_type') == 'title'])}, "
-            f"context={len([c for c in all_chunks if c.get('content_type') == 'context'])}"
-        )
-
-        return all_chunks
+        return segments
+    
+    @staticmethod
+    def _log_award_chunks(award: Dict, segments: List[Tuple]) -> None:
+        """Log the chunk counts per content type for an award"""
+        if logger.isEnabledFor(logging.INFO):
+            counts = Counter()
+            for segment in segments:
+                counts[segment[2]] += len(segment[3])
+            logger.info(
+                "Created %d chunks for award %s: technical=%d, title=%d, context=%d",
+                sum(counts.values()), award.get("award_id", "unknown"),
+                counts["technical"], counts["title"], counts["context"]
+            )
 
 
 # Singleton instance
@@ -303,8 +714,98 @@ def get_chunking_service() -> ChunkingService:
     return _chunking_service
 
 
+# Service owned by each chunk_awards_parallel worker process (own tokenizer and caches)
+_worker_service: Optional[ChunkingService] = None
+
+# Long-lived worker pool shared by chunk_awards_parallel calls (started on first use)
+_worker_pool: Optional[Any] = None
+_worker_pool_lock = threading.Lock()
+
+
+def _init_chunking_worker() -> None:
+    """Pool initializer: build the worker's ChunkingService once"""
+    global _worker_service
+    _worker_service = ChunkingService()
+
+
+def _chunk_awards_worker(args: Tuple[List[Dict], Optional[List[str]]]) -> List[List[Dict[str, Any]]]:
+    """Chunk one slice of awards in a worker process"""
+    awards, fields = args
+    return _worker_service.chunk_awards(awards, fields)
+
+
+def _get_worker_pool(workers: int):
+    """
+    Get the chunking worker pool, starting it on first use
+    
+    Args:
+        workers: Worker processes to start (ignored once the pool is running)
+    
+    Returns:
+        multiprocessing Pool whose workers each own a ChunkingService
+    """
+    global _worker_pool
+    
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            # spawn, not fork: forking after tiktoken has started its native threads can deadlock
+            _worker_pool = multiprocessing.get_context("spawn").Pool(workers, initializer=_init_chunking_worker)
+            logger.info("Started chunking worker pool with %d processes", workers)
+        
+        return _worker_pool
+
+
+def close_chunking_pool() -> None:
+    """Stop the chunk_awards_parallel worker pool (a later call starts a new one)"""
+    global _worker_pool
+    
+    with _worker_pool_lock:
+        if _worker_pool is not None:
+            _worker_pool.terminate()
+            _worker_pool.join()
+            _worker_pool = None
+
+
+atexit.register(close_chunking_pool)
+
+
+def chunk_awards_parallel(
+    awards: List[Dict],
+    fields: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 64
+) -> List[List[Dict[str, Any]]]:
+    """
+    Chunk awards across worker processes
+    
+    Chunking is pure CPU work, so threads serialize on the GIL; each worker
+    process owns its own ChunkingService and tokenizer and chunks slices of
+    `chunksize` awards with chunk_awards. The pool is started once and kept
+    for later calls (see close_chunking_pool), so its startup and tokenizer
+    loading are paid once per process, not per call. Small inputs (or
+    workers=1) are chunked in-process.
+    
+    Args:
+        awards: Award dictionaries
+        fields: List of field names to chunk (default: auto-detect per award)
+        workers: Worker processes when the pool is started (default: CPU count)
+        chunksize: Awards per task sent to a worker
+    
+    Returns:
+        One list of chunk dictionaries per award, in input order
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(awards) <= chunksize:
+        return get_chunking_service().chunk_awards(awards, fields)
+    
+    slices = [(awards[i:i + chunksize], fields) for i in range(0, len(awards), chunksize)]
+    results = _get_worker_pool(workers).map(_chunk_awards_worker, slices)
+    
+    return [chunks for slice_chunks in results for chunks in slice_chunks]
+
+
 # Convenience function
-def chunk_text(text: str, field_name: str = "abstract") -> List[Dict[str, any]]:
+def chunk_text(text: str, field_name: str = "abstract") -> List[Dict[str, Any]]:
     """
     Convenience function to chunk text
     
@@ -0,0 +1,155 @@
+"""
+Embedding Cache
+Persistent, content-addressed cache of embedding vectors
+
+Vectors are keyed by a hash of (model, dimension, text), so a cached vector is
+only reused for the exact text and model settings that produced it, and they
+survive process restarts (re-indexing unchanged chunks costs no API calls).
+Vectors are stored as packed float32 (4 bytes per dimension) in SQLite.
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Key bytes kept from the SHA-256 of (model, dimension, text)
+_KEY_BYTES = 16
+
+# SQLite caps bound parameters per statement (999 on older builds)
+_SQL_BATCH = 500
+
+
+def _float32_bytes(vector: Any) -> bytes:
+    """Pack a vector (numpy array or list) as float32 bytes"""
+    if NUMPY_AVAILABLE:
+        return np.asarray(vector, dtype=np.float32).tobytes()
+    return array("f", vector).tobytes()
+
+
+class EmbeddingCache:
+    """File-backed embedding cache (SQLite, float32 vectors, optional TTL)"""
+    
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None):
+        """
+        Open (or create) the cache file
+        
+        Args:
+            path: SQLite file path (parent directories are created)
+            ttl_seconds: Drop vectors older than this (None keeps them forever)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key BLOB PRIMARY KEY, vector BLOB NOT NULL, created REAL NOT NULL)"
+        )
+        if ttl_seconds:
+            self._conn.execute("DELETE FROM embeddings WHERE created < ?", (time.time() - ttl_seconds,))
+        self._conn.commit()
+        
+        logger.info("Embedding cache opened", extra={"path": path, "ttl_seconds": ttl_seconds})
+    
+    @staticmethod
+    def make_key(text: str, namespace: str) -> bytes:
+        """
+        Content address of a text under a model namespace
+        
+        Args:
+            text: Embedded text
+            namespace: Model settings the vector depends on (e.g. model + dimension)
+        
+        Returns:
+            Cache key bytes
+        """
+        return hashlib.sha256(f"{namespace}\x00{text}".encode("utf-8")).digest()[:_KEY_BYTES]
+    
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, Any]:
+        """
+        Look up vectors for several keys
+        
+        Args:
+            keys: Cache keys (from make_key)
+        
+        Returns:
+            Dictionary of key -> vector (float32 numpy array, or list without
+            numpy) for the keys that were cached
+        """
+        found: Dict[bytes, Any] = {}
+        if not keys:
+            return found
+        
+        min_created = time.time() - self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._lock:
+            for i in range(0, len(keys), _SQL_BATCH):
+                batch = keys[i:i + _SQL_BATCH]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE created >= ? "
+                    f"AND key IN ({','.join('?' * len(batch))})",
+                    (min_created, *batch)
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32) if NUMPY_AVAILABLE else array("f", blob).tolist()
+        return found
+    
+    def put_many(self, items: Dict[bytes, Any]) -> None:
+        """
+        Store vectors (replacing any cached under the same keys)
+        
+        Args:
+            items: Dictionary of key -> vector
+        """
+        if not items:
+            return
+        
+        now = time.time()
+        rows = [(key, _float32_bytes(vector), now) for key, vector in items.items()]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, created) VALUES (?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+    
+    def close(self) -> None:
+        """Close the cache file"""
+        with self._lock:
+            self._conn.close()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Open the cache configured by EMBEDDING_CACHE_PATH
+    
+    Returns:
+        EmbeddingCache, or None if disabled (empty path) or the file can't be opened
+    """
+    if not settings.EMBEDDING_CACHE_PATH:
+        return None
+    
+    ttl_seconds = settings.EMBEDDING_CACHE_TTL_DAYS * 86400 if settings.EMBEDDING_CACHE_TTL_DAYS > 0 else None
+    try:
+        return EmbeddingCache(settings.EMBEDDING_CACHE_PATH, ttl_seconds=ttl_seconds)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Embedding cache disabled, could not open {settings.EMBEDDING_CACHE_PATH}: {e}")
+        return None
@@ -10,24 +10,370 @@ Implements:
 - Cost tracking
 - Parallel processing with asyncio
 """
+import base64
+import hashlib
+import re
 import time
 import asyncio
+import threading
 from typing import List, Dict, Optional, Any
 from functools import lru_cache
+from email.utils import parsedate_to_datetime
 
 try:
-    from openai import OpenAI, AsyncOpenAI
+    from openai import OpenAI, AsyncOpenAI, RateLimitError
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     OpenAI = None  # type: ignore
     AsyncOpenAI = None  # type: ignore
+    RateLimitError = None  # type: ignore
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+    blake3 = None  # type: ignore
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None  # type: ignore
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 from src.core.config import settings
 from src.core.logging import get_logger
+from src.indexing.embedding_cache import EmbeddingCache, get_embedding_cache
 
 logger = get_logger(__name__)
 
+# Pooled connections for async embedding calls (kept alive across batches)
+_HTTP_MAX_KEEPALIVE = 100
+_HTTP_MAX_CONNECTIONS = 200
+_HTTP_KEEPALIVE_EXPIRY = 30.0  # seconds
+_HTTP_TIMEOUT = 60.0  # seconds
+
+# USD per token for text-embedding-3-large by dimension (other dimensions
+# are billed at the 3072 rate)
+_COST_PER_TOKEN = {
+    3072: 0.00013 / 1000,
+    256: 0.00002 / 1000,
+}
+
+# OpenAI embeddings request limits: inputs per request, and total tokens per
+# request (kept under the 300k cap to absorb error in the ~4 chars/token estimate)
+_MAX_BATCH_ITEMS = 2048
+_MAX_BATCH_TOKENS = 290_000
+
+# Concurrent batches embed_chunks_async starts with (grows toward max_concurrent)
+_INITIAL_CONCURRENCY = 2
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for API calls (async context manager)
+    
+    Like TCP congestion control: the limit grows by one after each
+    successful call, up to max_limit, and halves when the API reports a
+    rate limit. Other errors leave it unchanged.
+    """
+    
+    def __init__(self, max_limit: int, initial_limit: int = _INITIAL_CONCURRENCY):
+        self.max_limit = max(1, max_limit)
+        self.limit = max(1, min(initial_limit, self.max_limit))
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+    
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+    
+    def record_success(self) -> None:
+        """Additive increase after a successful call"""
+        if self.limit < self.max_limit:
+            self.limit += 1
+            logger.info(f"Embedding concurrency raised to {self.limit}")
+    
+    def record_rate_limit(self) -> None:
+        """Multiplicative decrease after a rate-limit response"""
+        new_limit = max(1, self.limit // 2)
+        if new_limit != self.limit:
+            self.limit = new_limit
+            logger.info(f"Embedding concurrency lowered to {self.limit} after rate limit")
+
+
+class TokenBucket:
+    """
+    Token bucket for proactive rate limiting (shared by sync and async callers)
+    
+    reserve() takes the tokens immediately, letting the balance go negative,
+    and returns how long the caller must wait for the refill to cover it, so
+    concurrent callers queue up in order without a lock held across waits.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Create a full bucket
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum balance (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, amount: float) -> float:
+        """
+        Take tokens, returning the seconds to wait before using them
+        
+        Args:
+            amount: Tokens needed (capped at capacity so it can always be met)
+        
+        Returns:
+            Seconds to wait (0 if the balance covered it)
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+    
+    async def acquire(self, amount: float) -> None:
+        """Wait (without blocking the event loop) until `amount` tokens are available"""
+        wait_time = self.reserve(amount)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+    
+    def acquire_sync(self, amount: float) -> None:
+        """Blocking variant of acquire()"""
+        wait_time = self.reserve(amount)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+# With numpy, request raw base64 float32 and decode it straight into arrays
+# (the SDK would otherwise decode it into a list of Python floats)
+_CREATE_KWARGS = {"encoding_format": "base64"} if NUMPY_AVAILABLE else {}
+
+
+class _EmbeddingBlock:
+    """
+    Output rows for a run of embeddings, filled as batches complete
+    
+    With numpy the rows are one contiguous float32 array, allocated on the
+    first write from the returned vectors' width; each completed batch is
+    copied in and its decoded arrays can be freed right away.
+    """
+    
+    def __init__(self, count: int):
+        self.count = count
+        self.filled = [False] * count
+        self._rows: Any = None
+    
+    def write(self, start: int, embeddings: List[Optional[Any]]) -> None:
+        """Store a batch's embeddings at rows start.. (None entries are skipped)"""
+        for row, embedding in enumerate(embeddings, start):
+            if embedding is None:
+                continue
+            if self._rows is None:
+                self._rows = np.empty((self.count, len(embedding)), dtype=np.float32) if NUMPY_AVAILABLE else [None] * self.count
+            self._rows[row] = embedding
+            self.filled[row] = True
+    
+    def __getitem__(self, row: int) -> Any:
+        return self._rows[row]
+
+
+def _decode_embeddings(data: List[Any]) -> List[Any]:
+    """
+    Embedding vectors from an embeddings response
+    
+    float32 numpy arrays (12 KB for 3072 dimensions, instead of ~100 KB of
+    Python floats) when numpy is installed, otherwise lists of floats.
+    """
+    if not NUMPY_AVAILABLE:
+        return [item.embedding for item in data]
+    return [
+        np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32)
+        if isinstance(item.embedding, str)
+        else np.asarray(item.embedding, dtype=np.float32)
+        for item in data
+    ]
+
+
+def _token_budget_batches(texts: List[str], max_items: int) -> List[tuple[int, int]]:
+    """
+    Greedily split texts into contiguous batches that fit one embeddings request
+    
+    Args:
+        texts: Texts to embed, in order
+        max_items: Most texts per batch (capped at the API's per-request limit)
+    
+    Returns:
+        (start, end) slice bounds per batch; a text over the token budget on
+        its own still gets a batch
+    """
+    max_items = max(1, min(max_items, _MAX_BATCH_ITEMS))
+    bounds = []
+    start = 0
+    batch_tokens = 0
+    for i, text in enumerate(texts):
+        tokens = len(text) // 4 + 1  # ~4 chars per token
+        if i > start and (batch_tokens + tokens > _MAX_BATCH_TOKENS or i - start >= max_items):
+            bounds.append((start, i))
+            start = i
+            batch_tokens = 0
+        batch_tokens += tokens
+    if start < len(texts):
+        bounds.append((start, len(texts)))
+    return bounds
+
+
+def _hash_text(text: str) -> str:
+    """
+    Fallback cache key for chunks that arrive without a text_hash
+    
+    blake3 when installed (several times faster than SHA-256 on KB-sized
+    texts), else SHA-256; 32 hex chars (128 bits, a UUID's width) either way.
+    """
+    data = text.encode("utf-8")
+    if BLAKE3_AVAILABLE:
+        return blake3(data).hexdigest()[:32]
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def _cache_store_key(chunk: Dict[str, Any]) -> str:
+    """In-memory cache key of a chunk: its text_hash, or a hash of its text"""
+    return chunk.get("text_hash") or _hash_text(chunk["chunk_text"])
+
+
+def has_embedding(chunk: Optional[Dict[str, Any]]) -> bool:
+    """Whether a chunk carries a non-empty embedding (numpy array or list)"""
+    if not chunk:
+        return False
+    embedding = chunk.get("embedding")
+    return embedding is not None and len(embedding) > 0
+
+
+def _check_not_in_event_loop(method: str) -> None:
+    """
+    Refuse blocking calls (HTTP requests, time.sleep backoff) on an event loop thread
+    
+    Raises:
+        RuntimeError: If an asyncio event loop is running in this thread
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return  # No running loop: blocking is fine
+    raise RuntimeError(
+        f"EmbeddingService.{method} blocks and would stall the running event loop; "
+        f"await the async variant or call it via run_in_executor"
+    )
+
+
+# OpenAI reset durations, e.g. "20ms", "1s", "6m0s", "1h2m3.5s"
+_RESET_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_RESET_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+# Shortest wait honoured from a rate-limit header (guards against "0s" spins)
+_MIN_RATE_LIMIT_WAIT = 0.1
+
+
+def _parse_reset_duration(value: str) -> Optional[float]:
+    """Parse an x-ratelimit-reset-* duration ("6m0s", "20ms") into seconds"""
+    parts = _RESET_DURATION_RE.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value.replace(" ", ""):
+        return None
+    return sum(float(n) * _RESET_UNIT_SECONDS[u] for n, u in parts)
+
+
+def _parse_retry_after(error: Exception) -> Optional[float]:
+    """
+    Seconds the server asked us to wait before retrying, from a 429 response
+    
+    Reads retry-after-ms, Retry-After (seconds or HTTP date), then the longer
+    of x-ratelimit-reset-requests / x-ratelimit-reset-tokens.
+    
+    Args:
+        error: Exception raised by the OpenAI client
+    
+    Returns:
+        Seconds to wait, or None if the response carries no usable header
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+    
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                return parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass
+    
+    resets = [
+        _parse_reset_duration(value)
+        for value in (headers.get("x-ratelimit-reset-requests"), headers.get("x-ratelimit-reset-tokens"))
+        if value
+    ]
+    resets = [reset for reset in resets if reset is not None]
+    return max(resets) if resets else None
+
+
+def _rate_limit_wait(error: Exception, attempt: int, retry_delay: float) -> float:
+    """Wait before retrying a 429: the server's hint, else exponential backoff"""
+    wait_time = _parse_retry_after(error)
+    if wait_time is None:
+        return retry_delay * (2 ** attempt)
+    return max(wait_time, _MIN_RATE_LIMIT_WAIT)
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Whether an API error is a rate-limit (429) response"""
+    if OPENAI_AVAILABLE and isinstance(error, RateLimitError):
+        return True
+    error_str = str(error).lower()
+    return "rate limit" in error_str or "429" in error_str
+
 
 class EmbeddingService:
     """Service for generating embeddings using OpenAI API"""
@@ -37,7 +383,9 @@ class EmbeddingService:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         dimension: Optional[int] = None,
-        batch_size: int = 100
+        batch_size: int = 100,
+        requests_per_min: Optional[int] = None,
+        tokens_per_min: Optional[int] = None
     ):
         """
         Initialize embedding service
@@ -47,6 +395,8 @@ class EmbeddingService:
             model: Embedding model name (defaults to settings.EMBEDDING_MODEL)
             dimension: Embedding dimension (defaults to settings.EMBEDDING_DIMENSION)
             batch_size: Number of texts to process per batch
+            requests_per_min: Account request limit (defaults to settings.OPENAI_REQUESTS_PER_MIN; 0 disables)
+            tokens_per_min: Account token limit (defaults to settings.OPENAI_TOKENS_PER_MIN; 0 disables)
         """
         if not OPENAI_AVAILABLE:
             raise ImportError(
@@ -58,6 +408,14 @@ class EmbeddingService:
         self.model = model or settings.EMBEDDING_MODEL
         self.dimension = dimension or settings.EMBEDDING_DIMENSION
         self.batch_size = batch_size
+        self._cost_per_token = _COST_PER_TOKEN.get(self.dimension, _COST_PER_TOKEN[3072])
+        
+        # Throttle before each API call to stay under the account's limits,
+        # instead of reacting to 429s with backoff sleeps
+        requests_per_min = settings.OPENAI_REQUESTS_PER_MIN if requests_per_min is None else requests_per_min
+        tokens_per_min = settings.OPENAI_TOKENS_PER_MIN if tokens_per_min is None else tokens_per_min
+        self._rpm_bucket = TokenBucket(requests_per_min / 60, requests_per_min) if requests_per_min > 0 else None
+        self._tpm_bucket = TokenBucket(tokens_per_min / 60, tokens_per_min) if tokens_per_min > 0 else None
         
         if not self.api_key:
             logger.warning(
@@ -66,11 +424,28 @@ class EmbeddingService:
             )
         
         # Initialize OpenAI clients (sync and async)
+        # The async client shares one pooled HTTP client (HTTP/2 when h2 is
+        # installed), so concurrent batches reuse open TCP/TLS connections
+        # instead of paying a handshake per batch
+        self._http = None
         if self.api_key:
             try:
                 self.client = OpenAI(api_key=self.api_key)
-                self.async_client = AsyncOpenAI(api_key=self.api_key)
-                logger.info("OpenAI clients initialized", extra={"model": self.model})
+                if HTTPX_AVAILABLE:
+                    self._http = httpx.AsyncClient(
+                        http2=HTTP2_AVAILABLE,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=_HTTP_MAX_KEEPALIVE,
+                            max_connections=_HTTP_MAX_CONNECTIONS,
+                            keepalive_expiry=_HTTP_KEEPALIVE_EXPIRY
+                        ),
+                        timeout=_HTTP_TIMEOUT
+                    )
+                self.async_client = AsyncOpenAI(api_key=self.api_key, http_client=self._http)
+                logger.info(
+                    "OpenAI clients initialized",
+                    extra={"model": self.model, "http2": self._http is not None and HTTP2_AVAILABLE}
+                )
             except Exception as e:
                 logger.error(f"Failed to initialize OpenAI client: {e}")
                 raise
@@ -78,6 +453,10 @@ class EmbeddingService:
             self.client = None
             self.async_client = None
         
+        # Persistent cache keyed by (model, dimension, text); None when disabled
+        self._cache = get_embedding_cache()
+        self._cache_namespace = f"{self.model}:{self.dimension}"
+        
         logger.info(
             "EmbeddingService initialized",
             extra={
@@ -87,6 +466,107 @@ class EmbeddingService:
             }
         )
     
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP connections (on shutdown; async calls fail afterwards)"""
+        self.async_client = None
+        if self._http is not None:
+            http, self._http = self._http, None
+            await http.aclose()
+    
+    def _load_cached_embeddings(
+        self,
+        chunks: List[Dict[str, Any]],
+        cache_store: Dict[str, List[float]]
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[bytes]]:
+        """
+        Fill embeddings for chunks found in the persistent cache
+        
+        Args:
+            chunks: Chunks missing from cache_store
+            cache_store: In-memory text_hash -> embedding cache (hits are added)
+        
+        Returns:
+            (chunks filled from the cache, remaining chunks, their cache keys)
+        """
+        keys = [EmbeddingCache.make_key(chunk["chunk_text"], self._cache_namespace) for chunk in chunks]
+        stored = self._cache.get_many(keys)
+        if not stored:
+            return [], chunks, keys
+        
+        hits = []
+        remaining_chunks, remaining_keys = [], []
+        for chunk, key in zip(chunks, keys):
+            embedding = stored.get(key)
+            if embedding is not None:
+                chunk["embedding"] = embedding
+                cache_store[_cache_store_key(chunk)] = embedding
+                hits.append(chunk)
+            else:
+                remaining_chunks.append(chunk)
+                remaining_keys.append(key)
+        return hits, remaining_chunks, remaining_keys
+    
+    @staticmethod
+    def _dedupe_chunks(
+        chunks: List[Dict[str, Any]]
+    ) -> tuple[List[Dict[str, Any]], List[tuple[Dict[str, Any], Dict[str, Any]]]]:
+        """
+        Group chunks that carry the same text (boilerplate, repeated topic statements)
+        
+        Args:
+            chunks: Chunks to embed
+        
+        Returns:
+            (one representative chunk per distinct text_hash/text,
+             (duplicate chunk, its representative) pairs)
+        """
+        representatives: Dict[str, Dict[str, Any]] = {}
+        unique_chunks = []
+        duplicates = []
+        for chunk in chunks:
+            key = chunk.get("text_hash") or chunk["chunk_text"]
+            representative = representatives.get(key)
+            if representative is None:
+                representatives[key] = chunk
+                unique_chunks.append(chunk)
+            else:
+                duplicates.append((chunk, representative))
+        return unique_chunks, duplicates
+    
+    @staticmethod
+    def _attach_embeddings(
+        chunks: List[Dict[str, Any]],
+        block: _EmbeddingBlock,
+        use_cache: bool,
+        cache_store: Dict[str, List[float]]
+    ) -> None:
+        """
+        Set each chunk's embedding in one pass (row views of the block with numpy)
+        
+        Args:
+            chunks: Chunks that were embedded, in block row order
+            block: Their embeddings (unfilled rows are chunks whose batch failed)
+            use_cache: Whether to record the embeddings in cache_store
+            cache_store: In-memory text_hash -> embedding cache
+        """
+        for row, (chunk, filled) in enumerate(zip(chunks, block.filled)):
+            if filled:
+                embedding = block[row]
+                chunk["embedding"] = embedding
+                if use_cache:
+                    cache_store[_cache_store_key(chunk)] = embedding
+    
+    def _store_cached_embeddings(self, chunks: List[Dict[str, Any]], keys: List[bytes]) -> None:
+        """Write newly generated embeddings to the persistent cache"""
+        try:
+            self._cache.put_many({
+                key: chunk["embedding"]
+                for chunk, key in zip(chunks, keys)
+                if has_embedding(chunk)
+            })
+        except Exception as e:
+            logger.warning(f"Failed to write embedding cache: {e}")
+    
     def embed_text(self, text: str) -> List[float]:
         """
         Generate embedding for a single text
@@ -98,11 +578,12 @@ class EmbeddingService:
             List of floats representing the embedding vector
         
         Raises:
-            RuntimeError: If API key not configured
+            RuntimeError: If API key not configured, or called on a running event loop
             Exception: If embedding generation fails
         """
         if not self.client:
             raise RuntimeError("OpenAI API key not configured")
+        _check_not_in_event_loop("embed_text")
         
         if not text or not text.strip():
             logger.warning("Empty text provided for embedding")
@@ -138,36 +619,42 @@ class EmbeddingService:
         texts: List[str],
         max_retries: int = 3,
         retry_delay: float = 1.0
-    ) -> List[List[float]]:
+    ) -> List[Any]:
         """
         Generate embeddings for a batch of texts
         
         Args:
             texts: List of texts to embed
             max_retries: Maximum number of retry attempts
-            retry_delay: Initial delay between retries (exponential backoff)
+            retry_delay: Initial delay between retries (exponential backoff; 429s honour Retry-After instead)
         
         Returns:
-            List of embedding vectors
+            List of embedding vectors (float32 numpy arrays when numpy is
+            installed, else lists; None for empty texts)
         
         Raises:
-            RuntimeError: If API key not configured
+            RuntimeError: If API key not configured, or called on a running event loop
             Exception: If embedding generation fails after retries
         """
         if not self.client:
             raise RuntimeError("OpenAI API key not configured")
+        _check_not_in_event_loop("embed_batch")
         
         if not texts:
             return []
         
-        # Filter empty texts
-        valid_texts = [t for t in texts if t and t.strip()]
+        # Filter empty texts, tracking which texts were valid (one pass)
+        valid_texts = []
+        valid_indices = []
+        for i, t in enumerate(texts):
+            if t and not t.isspace():
+                valid_texts.append(t)
+                valid_indices.append(i)
         if not valid_texts:
             logger.warning("No valid texts provided for embedding")
             return []
         
-        # Track which texts were valid
-        valid_indices = [i for i, t in enumerate(texts) if t and t.strip()]
+        est_tokens = sum(len(t) for t in valid_texts) // 4 + 1  # ~4 chars per token
         
         for attempt in range(max_retries):
             try:
@@ -176,14 +663,20 @@ class EmbeddingService:
                     extra={"batch_size": len(valid_texts)}
                 )
                 
+                if self._rpm_bucket is not None:
+                    self._rpm_bucket.acquire_sync(1)
+                if self._tpm_bucket is not None:
+                    self._tpm_bucket.acquire_sync(est_tokens)
+                
                 response = self.client.embeddings.create(
                     model=self.model,
                     input=valid_texts,
-                    dimensions=self.dimension
+                    dimensions=self.dimension,
+                    **_CREATE_KWARGS
                 )
                 
                 # Extract embeddings
-                embeddings = [item.embedding for item in response.data]
+                embeddings = _decode_embeddings(response.data)
                 
                 # Create full result list (with None for empty texts)
                 result = [None] * len(texts)
@@ -201,11 +694,9 @@ class EmbeddingService:
                 return result
                 
             except Exception as e:
-                error_str = str(e).lower()
-                
                 # Check if it's a rate limit error
-                if "rate limit" in error_str or "429" in error_str:
-                    wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
+                if _is_rate_limit_error(e):
+                    wait_time = _rate_limit_wait(e, attempt, retry_delay)
                     logger.warning(
                         f"Rate limit hit, retrying in {wait_time:.1f}s",
                         extra={"attempt": attempt + 1, "max_retries": max_retries}
@@ -237,37 +728,44 @@ class EmbeddingService:
         self,
         texts: List[str],
         max_retries: int = 3,
-        retry_delay: float = 1.0
-    ) -> List[List[float]]:
+        retry_delay: float = 1.0,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None
+    ) -> List[Any]:
         """
         Generate embeddings for a batch of texts (ASYNC)
         
         Args:
             texts: List of texts to embed
             max_retries: Maximum number of retry attempts
-            retry_delay: Initial delay between retries (exponential backoff)
+            retry_delay: Initial delay between retries (exponential backoff; 429s honour Retry-After instead)
+            limiter: Concurrency limiter told about rate-limit responses
         
         Returns:
-            List of embedding vectors
+            List of embedding vectors (float32 numpy arrays when numpy is
+            installed, else lists; None for empty texts)
         
         Raises:
-            RuntimeError: If API key not configured
+            RuntimeError: If API key not configured or the service was closed
             Exception: If embedding generation fails after retries
         """
         if not self.async_client:
-            raise RuntimeError("OpenAI API key not configured")
+            raise RuntimeError("Async OpenAI client not available (API key not configured or service closed)")
         
         if not texts:
             return []
         
-        # Filter empty texts
-        valid_texts = [t for t in texts if t and t.strip()]
+        # Filter empty texts, tracking which texts were valid (one pass)
+        valid_texts = []
+        valid_indices = []
+        for i, t in enumerate(texts):
+            if t and not t.isspace():
+                valid_texts.append(t)
+                valid_indices.append(i)
         if not valid_texts:
             logger.warning("No valid texts provided for embedding")
             return []
         
-        # Track which texts were valid
-        valid_indices = [i for i, t in enumerate(texts) if t and t.strip()]
+        est_tokens = sum(len(t) for t in valid_texts) // 4 + 1  # ~4 chars per token
         
         for attempt in range(max_retries):
             try:
@@ -276,14 +774,20 @@ class EmbeddingService:
                     extra={"batch_size": len(valid_texts)}
                 )
                 
+                if self._rpm_bucket is not None:
+                    await self._rpm_bucket.acquire(1)
+                if self._tpm_bucket is not None:
+                    await self._tpm_bucket.acquire(est_tokens)
+                
                 response = await self.async_client.embeddings.create(
                     model=self.model,
                     input=valid_texts,
-                    dimensions=self.dimension
+                    dimensions=self.dimension,
+                    **_CREATE_KWARGS
                 )
                 
                 # Extract embeddings
-                embeddings = [item.embedding for item in response.data]
+                embeddings = _decode_embeddings(response.data)
                 
                 # Create full result list (with None for empty texts)
                 result = [None] * len(texts)
@@ -301,11 +805,11 @@ class EmbeddingService:
                 return result
                 
             except Exception as e:
-                error_str = str(e).lower()
-                
                 # Check if it's a rate limit error
-                if "rate limit" in error_str or "429" in error_str:
-                    wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
+                if _is_rate_limit_error(e):
+                    if limiter is not None:
+                        limiter.record_rate_limit()
+                    wait_time = _rate_limit_wait(e, attempt, retry_delay)
                     logger.warning(
                         f"Rate limit hit, retrying in {wait_time:.1f}s",
                         extra={"attempt": attempt + 1, "max_retries": max_retries}
@@ -347,9 +851,10 @@ class EmbeddingService:
         Args:
             chunks: List of chunk dictionaries (from chunking service)
             use_cache: Whether to use cached embeddings (text_hash-based)
-            cache_store: Dictionary mapping text_hash -> embedding
+            cache_store: Dictionary mapping text_hash (or a hash of chunk_text when missing) -> embedding
             max_concurrent: Maximum concurrent API calls
-            batch_size: Number of chunks per API call
+            batch_size: Most chunks per API call (batches also stay under the
+                request token limit)
         
         Returns:
             List of chunk dictionaries with 'embedding' field added
@@ -363,19 +868,26 @@ class EmbeddingService:
         # Separate chunks into cached and uncached
         cached_chunks = []
         uncached_chunks = []
-        uncached_indices = []
         
-        for idx, chunk in enumerate(chunks):
-            text_hash = chunk.get("text_hash")
+        for chunk in chunks:
+            cached = cache_store.get(_cache_store_key(chunk)) if use_cache else None
             
-            if use_cache and text_hash and text_hash in cache_store:
+            if cached is not None:
                 # Use cached embedding
-                chunk["embedding"] = cache_store[text_hash]
-                cached_chunks.append((idx, chunk))
+                chunk["embedding"] = cached
+                cached_chunks.append(chunk)
             else:
                 # Need to generate embedding
                 uncached_chunks.append(chunk)
-                uncached_indices.append(idx)
+        
+        # Chunks embedded by earlier runs come from the persistent cache; the
+        # lookup (hashing + SQLite, both release the GIL) runs off the event loop
+        cache_keys = None
+        if use_cache and self._cache is not None and uncached_chunks:
+            hits, uncached_chunks, cache_keys = await asyncio.get_running_loop().run_in_executor(
+                None, self._load_cached_embeddings, uncached_chunks, cache_store
+            )
+            cached_chunks.extend(hits)
         
         logger.info(
             "Embedding chunks (async)",
@@ -388,85 +900,69 @@ class EmbeddingService:
             }
         )
         
-        if uncached_chunks:
-            logger.info(f"Processing {len(uncached_chunks)} uncached chunks in {len(uncached_chunks) // batch_size + 1} batches")
-        
         # Generate embeddings for uncached chunks in parallel batches
         if uncached_chunks:
-            texts = [chunk["chunk_text"] for chunk in uncached_chunks]
+            # Embed each distinct text once; duplicates get a copy afterwards
+            unique_chunks, duplicates = self._dedupe_chunks(uncached_chunks)
+            texts = [chunk["chunk_text"] for chunk in unique_chunks]
+            batch_bounds = _token_budget_batches(texts, batch_size)
+            num_batches = len(batch_bounds)
+            num_workers = min(max_concurrent, num_batches)
+            logger.info(f"Processing {len(uncached_chunks)} uncached chunks in {num_batches} batches")
             
-            # Split into batches
-            batches = []
-            for i in range(0, len(texts), batch_size):
-                batches.append((i, texts[i:i + batch_size]))
+            # Each completed batch is copied into its rows right away (its
+            # response arrays are freed); chunks are updated in one pass after
+            # all batches finish
+            block = _EmbeddingBlock(len(unique_chunks))
             
-            # Process batches concurrently with semaphore to limit concurrency
-            semaphore = asyncio.Semaphore(max_concurrent)
+            # Producer/consumer: a producer queues batches while workers embed
+            # them, so the first API call starts right away and only a bounded
+            # number of batches is prepared ahead of the workers
+            queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent * 2)
             
-            async def process_batch(batch_idx: int, batch_texts: List[str]) -> tuple[int, List[List[float]]]:
-                async with semaphore:
-                    try:
-                        embeddings = await self.embed_batch_async(batch_texts)
-                        logger.debug(f"Completed embedding batch {batch_idx + 1}/{len(batches)}")
-                        return batch_idx, embeddings
-                    except Exception as e:
-                        logger.error(f"Failed to embed batch {batch_idx}", extra={"error": str(e)})
-                        return batch_idx, [None] * len(batch_texts)
+            # Concurrency adapts to the API's rate limits (grows per successful
+            # batch, halves on 429s) up to max_concurrent
+            limiter = AdaptiveConcurrencyLimiter(max_concurrent)
             
-            # Create tasks for all batches
-            tasks = [
-                process_batch(batch_idx, batch_texts)
-                for batch_idx, batch_texts in batches
-            ]
+            async def produce_batches() -> None:
+                for batch_idx, (start, end) in enumerate(batch_bounds):
+                    await queue.put((batch_idx, start, texts[start:end]))
+                for _ in range(num_workers):
+                    await queue.put(None)  # One stop signal per worker
             
-            # Wait for all batches to complete
-            # Use return_exceptions=True to prevent one failure from crashing everything
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            async def embed_worker() -> None:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    batch_idx, start, batch_texts = item
+                    async with limiter:
+                        try:
+                            embeddings = await self.embed_batch_async(batch_texts, limiter=limiter)
+                            limiter.record_success()
+                            block.write(start, embeddings)
+                            logger.debug(f"Completed embedding batch {batch_idx + 1}/{num_batches}")
+                        except Exception as e:
+                            # Leave this batch's chunks without embeddings; other batches continue
+                            logger.error(f"Failed to embed batch {batch_idx}", extra={"error": str(e)})
             
-            # Handle exceptions in results
-            valid_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(
-                        f"Exception in embedding batch {i}",
-                        extra={"error": str(result), "exception_type": type(result).__name__},
-                        exc_info=result
-                    )
-                    # Return empty embeddings for failed batch
-                    batch_texts = batches[i][1]
-                    valid_results.append((i, [None] * len(batch_texts)))
-                else:
-                    valid_results.append(result)
-            
-            results = valid_results
+            await asyncio.gather(
+                produce_batches(),
+                *(embed_worker() for _ in range(num_workers))
+            )
+            self._attach_embeddings(unique_chunks, block, use_cache, cache_store)
             
-            # Sort results by batch index and combine
-            results.sort(key=lambda x: x[0])
-            all_embeddings = []
-            for _, embeddings in results:
-                all_embeddings.extend(embeddings)
+            for chunk, representative in duplicates:
+                if "embedding" in representative:
+                    chunk["embedding"] = representative["embedding"]
             
-            # Add embeddings to chunks and update cache
-            for chunk, embedding in zip(uncached_chunks, all_embeddings):
-                if embedding:
-                    chunk["embedding"] = embedding
-                    # Update cache
-                    text_hash = chunk.get("text_hash")
-                    if text_hash and use_cache:
-                        cache_store[text_hash] = embedding
-        
-        # Combine cached and newly embedded chunks in original order
-        result = [None] * len(chunks)
-        
-        # Place cached chunks
-        for idx, chunk in cached_chunks:
-            result[idx] = chunk
-        
-        # Place newly embedded chunks
-        for idx, chunk in zip(uncached_indices, uncached_chunks):
-            result[idx] = chunk
+            if cache_keys is not None:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._store_cached_embeddings, uncached_chunks, cache_keys
+                )
         
-        return result
+        # Every chunk was updated in place, so the input order is the result order
+        return list(chunks)
     
     def embed_chunks(
         self,
@@ -480,7 +976,7 @@ class EmbeddingService:
         Args:
             chunks: List of chunk dictionaries (from chunking service)
             use_cache: Whether to use cached embeddings (text_hash-based)
-            cache_store: Dictionary mapping text_hash -> embedding
+            cache_store: Dictionary mapping text_hash (or a hash of chunk_text when missing) -> embedding
         
         Returns:
             List of chunk dictionaries with 'embedding' field added
@@ -494,19 +990,23 @@ class EmbeddingService:
         # Separate chunks into cached and uncached
         cached_chunks = []
         uncached_chunks = []
-        uncached_indices = []
         
-        for idx, chunk in enumerate(chunks):
-            text_hash = chunk.get("text_hash")
+        for chunk in chunks:
+            cached = cache_store.get(_cache_store_key(chunk)) if use_cache else None
             
-            if use_cache and text_hash and text_hash in cache_store:
+            if cached is not None:
                 # Use cached embedding
-                chunk["embedding"] = cache_store[text_hash]
+                chunk["embedding"] = cached
                 cached_chunks.append(chunk)
             else:
                 # Need to generate embedding
                 uncached_chunks.append(chunk)
-                uncached_indices.append(idx)
+        
+        # Chunks embedded by earlier runs come from the persistent cache
+        cache_keys = None
+        if use_cache and self._cache is not None and uncached_chunks:
+            hits, uncached_chunks, cache_keys = self._load_cached_embeddings(uncached_chunks, cache_store)
+            cached_chunks.extend(hits)
         
         logger.info(
             "Embedding chunks",
@@ -519,34 +1019,26 @@ class EmbeddingService:
         
         # Generate embeddings for uncached chunks
         if uncached_chunks:
-            texts = [chunk["chunk_text"] for chunk in uncached_chunks]
+            # Embed each distinct text once; duplicates get a copy afterwards
+            unique_chunks, duplicates = self._dedupe_chunks(uncached_chunks)
+            texts = [chunk["chunk_text"] for chunk in unique_chunks]
             
             # Process in batches
-            all_embeddings = []
-            for i in range(0, len(texts), self.batch_size):
-                batch_texts = texts[i:i + self.batch_size]
-                batch_embeddings = self.embed_batch(batch_texts)
-                all_embeddings.extend(batch_embeddings)
+            block = _EmbeddingBlock(len(unique_chunks))
+            for start, end in _token_budget_batches(texts, self.batch_size):
+                block.write(start, self.embed_batch(texts[start:end]))
             
-            # Add embeddings to chunks and update cache
-            for chunk, embedding in zip(uncached_chunks, all_embeddings):
-                if embedding:
-                    chunk["embedding"] = embedding
-                    # Update cache
-                    text_hash = chunk.get("text_hash")
-                    if text_hash and use_cache:
-                        cache_store[text_hash] = embedding
-        
-        # Combine cached and newly embedded chunks
-        result = [None] * len(chunks)
-        for chunk in cached_chunks + uncached_chunks:
-            # Find original index
-            for idx, orig_chunk in enumerate(chunks):
-                if orig_chunk.get("text_hash") == chunk.get("text_hash"):
-                    result[idx] = chunk
-                    break
-        
-        return result
+            self._attach_embeddings(unique_chunks, block, use_cache, cache_store)
+            
+            for chunk, representative in duplicates:
+                if "embedding" in representative:
+                    chunk["embedding"] = representative["embedding"]
+            
+            if cache_keys is not None:
+                self._store_cached_embeddings(uncached_chunks, cache_keys)
+        
+        # Every chunk was updated in place, so the input order is the result order
+        return list(chunks)
     
     def estimate_cost(self, num_tokens: int) -> float:
         """
@@ -558,20 +1050,21 @@ class EmbeddingService:
         Returns:
             Estimated cost in USD
         """
-        # Cost per 1K tokens for text-embedding-3-large
-        # 3072 dimensions: $0.00013 per 1K tokens
-        # 256 dimensions: $0.00002 per 1K tokens
-        
-        if self.dimension == 3072:
-            cost_per_1k = 0.00013
-        elif self.dimension == 256:
-            cost_per_1k = 0.00002
-        else:
-            # Default to 3072 pricing
-            cost_per_1k = 0.00013
+        return num_tokens * self._cost_per_token
+    
+    def estimate_cost_bulk(self, token_counts: Any) -> float:
+        """
+        Estimate the total cost of many embedding inputs in one pass
+        
+        Args:
+            token_counts: Token count per input (numpy array or sequence of ints)
         
-        cost = (num_tokens / 1000) * cost_per_1k
-        return cost
+        Returns:
+            Estimated total cost in USD
+        """
+        if NUMPY_AVAILABLE:
+            return float(np.asarray(token_counts, dtype=np.float64).sum() * self._cost_per_token)
+        return sum(token_counts) * self._cost_per_token
 
 
 # Singleton instance
@@ -314,6 +314,10 @@ class SentenceTransformersEmbeddingService:
         """Estimate cost (always 0 for Sentence Transformers - it's free!)"""
         return 0.0
     
+    def estimate_cost_bulk(self, token_counts: Any) -> float:
+        """Estimate total cost of many inputs (always 0 for Sentence Transformers)"""
+        return 0.0
+    
     def get_dimension(self) -> int:
         """Get embedding dimension"""
         return self.dimension
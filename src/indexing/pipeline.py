@@ -18,11 +18,16 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from src.core.config import settings
 from src.core.logging import get_logger
 from src.indexing.chunking import get_chunking_service
-from src.indexing.embeddings import get_embedding_service
+from src.indexing.embeddings import get_embedding_service, has_embedding
 
 logger = get_logger(__name__)
 
 
+def _as_float_list(embedding: Any) -> List[float]:
+    """Embedding as a list of Python floats (Qdrant points don't accept numpy arrays)"""
+    return embedding.tolist() if hasattr(embedding, "tolist") else embedding
+
+
 class IndexingPipeline:
     """Complete indexing pipeline for SBIR awards"""
     
@@ -45,7 +50,8 @@ class IndexingPipeline:
             batch_size: Process awards in batches (increased default: 200)
             embedding_batch_size: Number of chunks to embed per API call (increased default: 200)
             max_workers: Maximum number of parallel workers for sync embedding generation (default: 10)
-            chunking_workers: Maximum number of parallel workers for chunking (default: 4)
+            chunking_workers: Kept for compatibility; each batch is chunked in one
+                batched pass (ChunkingService.chunk_awards)
             max_concurrent: Maximum concurrent async API calls (default: 20)
         """
         self.vector_store = vector_store or settings.VECTOR_STORE
@@ -135,28 +141,12 @@ class IndexingPipeline:
                 }
             )
             
-            # Step 1: Chunk all awards in parallel (much faster!)
+            # Step 1: Chunk all awards (one batched tokenizer pass)
             award_chunks_map: Dict[str, List[Dict[str, Any]]] = {}
             all_chunks: List[Dict[str, Any]] = []
             chunk_to_award_map: Dict[int, str] = {}  # chunk index -> award_id
             
-            # Parallel chunking
-            def chunk_award_worker(award: Dict[str, Any]) -> tuple[str, List[Dict[str, Any]]]:
-                """Worker function for parallel chunking"""
-                award_id = award.get("award_id", "unknown")
-                try:
-                    chunks = self.chunking_service.chunk_award(award, fields=fields)
-                    return award_id, chunks
-                except Exception as e:
-                    logger.error(
-                        f"Failed to chunk award {award_id}",
-                        extra={"error": str(e)}
-                    )
-                    return award_id, []
-            
-            # Process chunking in parallel
-            with ThreadPoolExecutor(max_workers=self.chunking_workers) as executor:
-                chunk_results = list(executor.map(chunk_award_worker, batch))
+            chunk_results = self._chunk_batch(batch, fields)
             
             # Collect results
             for award_id, chunks in chunk_results:
@@ -190,7 +180,7 @@ class IndexingPipeline:
                 # Filter valid chunks with embeddings
                 valid_chunks_with_embeddings = [
                     chunk for chunk in chunks_with_embeddings
-                    if chunk and chunk.get("embedding")
+                    if has_embedding(chunk)
                 ]
                 
                 # Update statistics for all chunks
@@ -323,6 +313,59 @@ class IndexingPipeline:
         total_batches = (len(awards) + self.batch_size - 1) // self.batch_size
         logger.info(f"Will process {total_batches} batch(es) of awards")
         
+        async def store_batch(
+            batch: List[Dict[str, Any]],
+            award_chunks_map: Dict[str, List[Dict[str, Any]]],
+            chunks: List[Dict[str, Any]]
+        ) -> None:
+            """Store one batch's chunks off the event loop and record per-award results"""
+            try:
+                logger.info(
+                    f"Batch storing {len(chunks)} chunks",
+                    extra={"chunk_count": len(chunks)}
+                )
+                # Run blocking database operation in executor to avoid blocking event loop
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None,  # Use default ThreadPoolExecutor
+                    self._store_chunks,
+                    chunks
+                )
+                
+                # Mark all awards in batch as processed
+                for award in batch:
+                    award_id = award.get("award_id", "unknown")
+                    if award_id in award_chunks_map:
+                        self.stats["processed_awards"] += 1
+                    else:
+                        # Award was chunked but no embeddings generated
+                        logger.warning(
+                            f"No embeddings generated for award {award_id}"
+                        )
+                        failed_awards.append(award_id)
+                        self.stats["failed_awards"] += 1
+            except Exception as e:
+                logger.error(
+                    f"Failed to batch store chunks",
+                    extra={"error": str(e), "chunk_count": len(chunks)}
+                )
+                # Mark all awards in batch as failed
+                for award in batch:
+                    award_id = award.get("award_id", "unknown")
+                    failed_awards.append(award_id)
+                    self.stats["failed_awards"] += 1
+            
+            # Log progress
+            progress = (self.stats["processed_awards"] / self.stats["total_awards"]) * 100
+            logger.info(
+                f"Progress: {self.stats['processed_awards']}/{self.stats['total_awards']} "
+                f"({progress:.1f}%)"
+            )
+        
+        # Storing batch N overlaps chunking/embedding batch N+1 (one store in flight,
+        # so inserts stay in order and at most one extra batch is held in memory)
+        store_task: Optional[asyncio.Task] = None
+        
         for batch_start in range(0, len(awards), self.batch_size):
             batch_end = min(batch_start + self.batch_size, len(awards))
             batch = awards[batch_start:batch_end]
@@ -336,46 +379,17 @@ class IndexingPipeline:
                 }
             )
             
-            # Step 1: Chunk all awards in PARALLEL (optimized - 8+ awards simultaneously)
-            logger.info(f"Chunking {len(batch)} awards in parallel...")
+            # Step 1: Chunk all awards
+            logger.info(f"Chunking {len(batch)} awards...")
             award_chunks_map: Dict[str, List[Dict[str, Any]]] = {}
             all_chunks: List[Dict[str, Any]] = []
             chunk_to_award_map: Dict[int, str] = {}  # chunk index -> award_id
             
-            # Parallel chunking using asyncio (8+ awards simultaneously)
-            async def chunk_single_award(award: Dict[str, Any]) -> tuple[str, List[Dict[str, Any]]]:
-                """Chunk a single award (async wrapper for parallel execution)"""
-                award_id = award.get("award_id", "unknown")
-                try:
-                    # Run chunking in thread pool (CPU-bound operation)
-                    loop = asyncio.get_event_loop()
-                    chunks = await loop.run_in_executor(
-                        None,  # Default ThreadPoolExecutor
-                        self.chunking_service.chunk_award,
-                        award,
-                        fields
-                    )
-                    return award_id, chunks
-                except Exception as e:
-                    logger.error(
-                        f"Failed to chunk award {award_id}",
-                        extra={"error": str(e)}
-                    )
-                    return award_id, []
-            
-            # Process all awards in parallel (8+ at once)
-            chunk_tasks = [chunk_single_award(award) for award in batch]
-            chunk_results = await asyncio.gather(*chunk_tasks, return_exceptions=True)
+            # Chunk the whole batch in one batched tokenizer pass, off the event loop
+            loop = asyncio.get_running_loop()
+            chunk_results = await loop.run_in_executor(None, self._chunk_batch, batch, fields)
             
-            # Filter out exceptions and collect valid results
-            valid_chunk_results = []
-            for result in chunk_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Chunking task failed: {result}")
-                else:
-                    valid_chunk_results.append(result)
-            
-            logger.info(f"Chunking complete: {len(valid_chunk_results)} awards processed (parallel)")
+            logger.info(f"Chunking complete: {len(chunk_results)} awards processed")
             
             # Collect results
             logger.info("Collecting chunking results...")
@@ -419,7 +433,7 @@ class IndexingPipeline:
                 # Filter valid chunks with embeddings
                 valid_chunks_with_embeddings = [
                     chunk for chunk in chunks_with_embeddings
-                    if chunk and chunk.get("embedding")
+                    if has_embedding(chunk)
                 ]
                 
                 # Update statistics for all chunks
@@ -433,55 +447,16 @@ class IndexingPipeline:
                     # Count tokens
                     self.stats["total_tokens"] += chunk.get("token_count", 0)
                 
-                # Batch store all chunks at once (much faster!)
-                # Run in executor to avoid blocking the event loop
+                # Batch store all chunks at once (much faster!), in the background
                 if valid_chunks_with_embeddings:
-                    try:
-                        logger.info(
-                            f"Batch storing {len(valid_chunks_with_embeddings)} chunks",
-                            extra={"chunk_count": len(valid_chunks_with_embeddings)}
-                        )
-                        # Run blocking database operation in executor to avoid blocking event loop
-                        try:
-                            loop = asyncio.get_running_loop()
-                        except RuntimeError:
-                            loop = asyncio.get_event_loop()
-                        
-                        await loop.run_in_executor(
-                            None,  # Use default ThreadPoolExecutor
-                            self._store_chunks,
-                            valid_chunks_with_embeddings
-                        )
-                        
-                        # Mark all awards in batch as processed
-                        for award in batch:
-                            award_id = award.get("award_id", "unknown")
-                            if award_id in award_chunks_map:
-                                self.stats["processed_awards"] += 1
-                            else:
-                                # Award was chunked but no embeddings generated
-                                logger.warning(
-                                    f"No embeddings generated for award {award_id}"
-                                )
-                                failed_awards.append(award_id)
-                                self.stats["failed_awards"] += 1
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to batch store chunks",
-                            extra={"error": str(e), "chunk_count": len(valid_chunks_with_embeddings)}
-                        )
-                        # Mark all awards in batch as failed
-                        for award in batch:
-                            award_id = award.get("award_id", "unknown")
-                            failed_awards.append(award_id)
-                            self.stats["failed_awards"] += 1
-            
-            # Log progress
-            progress = (self.stats["processed_awards"] / self.stats["total_awards"]) * 100
-            logger.info(
-                f"Progress: {self.stats['processed_awards']}/{self.stats['total_awards']} "
-                f"({progress:.1f}%)"
-            )
+                    if store_task is not None:
+                        await store_task
+                    store_task = asyncio.create_task(
+                        store_batch(batch, award_chunks_map, valid_chunks_with_embeddings)
+                    )
+        
+        if store_task is not None:
+            await store_task
         
         # Finalize statistics
         self.stats["end_time"] = datetime.utcnow()
@@ -607,7 +582,7 @@ class IndexingPipeline:
             
             # Add embeddings to chunks and update cache
             for chunk, embedding in zip(uncached_chunks, all_embeddings):
-                if embedding:
+                if embedding is not None:
                     chunk["embedding"] = embedding
                     # Update cache
                     text_hash = chunk.get("text_hash")
@@ -638,7 +613,7 @@ class IndexingPipeline:
             return
         
         # Filter out chunks without embeddings
-        valid_chunks = [c for c in chunks if c and c.get("embedding")]
+        valid_chunks = [c for c in chunks if has_embedding(c)]
         
         if not valid_chunks:
             logger.warning("No valid chunks with embeddings to store")
@@ -651,6 +626,10 @@ class IndexingPipeline:
         else:
             logger.error(f"Unknown vector store: {self.vector_store}")
             raise ValueError(f"Unsupported vector store: {self.vector_store}")
+        
+        # Cached search results predate these rows
+        from src.core.search.hybrid_search import clear_search_caches
+        clear_search_caches()
     
     def _store_pgvector(self, chunks: List[Dict[str, Any]]) -> None:
         """
@@ -736,7 +715,7 @@ class IndexingPipeline:
                 
                 point = PointStruct(
                     id=point_id,
-                    vector=chunk.get("embedding", []),
+                    vector=_as_float_list(chunk.get("embedding", [])),
                     payload={
                         "award_id": award_id,
                         "agency": chunk.get("agency", ""),
@@ -763,6 +742,41 @@ class IndexingPipeline:
             logger.error(f"Failed to store in Qdrant: {e}")
             raise
     
+    def _chunk_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        fields: Optional[List[str]]
+    ) -> List[tuple[str, List[Dict[str, Any]]]]:
+        """
+        Chunk a batch of awards, tokenizing all their chunks in one pass
+        
+        If the batched call fails, awards are chunked one by one so a single
+        bad record only loses its own chunks.
+        
+        Args:
+            batch: Award dictionaries
+            fields: Fields to chunk (None auto-detects)
+        
+        Returns:
+            (award_id, chunks) per award, in batch order
+        """
+        try:
+            chunk_lists = self.chunking_service.chunk_awards(batch, fields=fields)
+        except Exception as e:
+            logger.warning(f"Batched chunking failed, chunking awards one by one: {e}")
+            chunk_lists = []
+            for award in batch:
+                try:
+                    chunk_lists.append(self.chunking_service.chunk_award(award, fields=fields))
+                except Exception as award_error:
+                    logger.error(
+                        f"Failed to chunk award {award.get('award_id', 'unknown')}",
+                        extra={"error": str(award_error)}
+                    )
+                    chunk_lists.append([])
+        
+        return [(award.get("award_id", "unknown"), chunks) for award, chunks in zip(batch, chunk_lists)]
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get current indexing statistics"""
         return self.stats.copy()